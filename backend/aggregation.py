@@ -0,0 +1,261 @@
+# backend/aggregation.py
+import os
+
+import numpy as np
+import pandas as pd
+from scipy.stats import gaussian_kde
+
+# ----------------------------
+# Ayarlar (nokta bütçeleri)
+# ----------------------------
+# Scatter/line için en fazla nokta; scatter bunu aşarsa 2B yoğunluğa geçer
+MAX_POINTS = int(os.environ.get("LEBB_PLOT_POINTS", "2000"))
+# Histogram kutusu üst sınırı
+MAX_BINS = int(os.environ.get("LEBB_PLOT_BINS", "100"))
+# 2B yoğunluk ızgarası (GRID x GRID hücre)
+DENSITY_GRID = int(os.environ.get("LEBB_PLOT_GRID", "60"))
+# KDE tahmini için kullanılan en fazla örnek
+KDE_SAMPLE = int(os.environ.get("LEBB_PLOT_KDE_SAMPLE", "5000"))
+# Bar/pie/box/violin için en fazla kategori
+MAX_GROUPS = int(os.environ.get("LEBB_PLOT_GROUPS", "50"))
+
+KDE_GRID = 200
+VIOLIN_GRID = 100
+MAX_FLIERS = 50
+
+
+# ----------------------------
+# Yardımcılar
+# ----------------------------
+def to_list(values):
+    # JSON için: numpy -> python, NaN -> None
+    arr = np.asarray(values)
+    if arr.dtype.kind == "f":
+        return [None if np.isnan(v) else float(v) for v in arr.ravel()]
+    if arr.dtype.kind in "mM":
+        return [str(v) for v in pd.Series(arr.ravel()).astype(str)]
+    return [v.item() if isinstance(v, np.generic) else v for v in arr.ravel()]
+
+
+def sample_indices(n, limit=MAX_POINTS, seed=42):
+    if n <= limit:
+        return np.arange(n)
+    return np.sort(np.random.default_rng(seed).choice(n, size=limit, replace=False))
+
+
+def is_numeric(s):
+    return pd.api.types.is_numeric_dtype(s) and not pd.api.types.is_bool_dtype(s)
+
+
+def _axis(s):
+    # Sıralanabilir eksen: sayısal ya da tarih (int64 ns) değerleri
+    if pd.api.types.is_datetime64_any_dtype(s):
+        return s.astype("int64").to_numpy(dtype="float64")
+    return s.to_numpy(dtype="float64")
+
+
+def lttb(x, y, n_out):
+    # Largest-Triangle-Three-Buckets: çizginin görsel şeklini koruyan n_out
+    # noktanın indeksleri. x sıralı olmalıdır.
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    idx = np.empty(n_out, dtype=int)
+    idx[0], idx[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        nxt_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:nxt_end].mean()
+        avg_y = y[end:nxt_end].mean()
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(area.argmax())
+        idx[i + 1] = a
+    return idx
+
+
+def kde_curve(values, grid_size=KDE_GRID, cut=3, seed=0):
+    # Örneklem üzerinde gaussian KDE; sabit değerli seride None döner
+    values = np.asarray(values, dtype="float64")
+    if len(values) < 2 or np.ptp(values) == 0:
+        return None
+    if len(values) > KDE_SAMPLE:
+        values = np.random.default_rng(seed).choice(values, size=KDE_SAMPLE, replace=False)
+    kde = gaussian_kde(values)
+    bw = kde.factor * values.std(ddof=1)
+    grid = np.linspace(values.min() - cut * bw, values.max() + cut * bw, grid_size)
+    return grid, kde(grid)
+
+
+def histogram(values):
+    values = np.asarray(values, dtype="float64")
+    edges = np.histogram_bin_edges(values, bins="auto")
+    if len(edges) - 1 > MAX_BINS:
+        edges = np.histogram_bin_edges(values, bins=MAX_BINS)
+    counts, edges = np.histogram(values, bins=edges)
+    return counts, edges
+
+
+def value_counts(s, limit=MAX_GROUPS):
+    counts = s.value_counts()
+    top = counts.head(limit)
+    return {
+        "labels": [str(v) for v in top.index],
+        "counts": to_list(top.to_numpy()),
+        "other": int(counts.iloc[limit:].sum()),
+    }
+
+
+# ----------------------------
+# Grafik türüne göre özetler
+# ----------------------------
+def _histogram_data(x, with_kde):
+    if not is_numeric(x):
+        return value_counts(x.dropna())
+    s = x.dropna().to_numpy(dtype="float64")
+    if len(s) == 0:
+        raise ValueError("Sayısal değer yok.")
+    counts, edges = histogram(s)
+    data = {"edges": to_list(edges), "counts": to_list(counts)}
+    curve = kde_curve(s) if with_kde else None
+    if curve is not None:
+        # Eğri histogram ölçeğinde (adet) verilir
+        grid, density = curve
+        width = edges[1] - edges[0]
+        data["kde"] = {"x": to_list(grid), "y": to_list(density * len(s) * width)}
+    return data
+
+
+def _kde_data(x):
+    if not is_numeric(x):
+        raise ValueError("KDE için sayısal kolon gerekir.")
+    curve = kde_curve(x.dropna().to_numpy(dtype="float64"))
+    if curve is None:
+        raise ValueError("KDE için yeterli değişkenlik yok.")
+    grid, density = curve
+    return {"x": to_list(grid), "y": to_list(density)}
+
+
+def _scatter_data(pair, x_col, y_col):
+    n = len(pair)
+    if n > MAX_POINTS and is_numeric(pair[x_col]) and is_numeric(pair[y_col]):
+        counts, x_edges, y_edges = np.histogram2d(
+            _axis(pair[x_col]), _axis(pair[y_col]), bins=DENSITY_GRID
+        )
+        # counts[i][j]: x kutusu i, y kutusu j
+        return {
+            "mode": "density", "n": n,
+            "xEdges": to_list(x_edges), "yEdges": to_list(y_edges),
+            "counts": counts.astype(int).tolist(),
+        }
+    pair = pair.iloc[sample_indices(n)]
+    return {"mode": "points", "n": n, "x": to_list(pair[x_col].to_numpy()), "y": to_list(pair[y_col].to_numpy())}
+
+
+def _line_data(pair, x_col, y_col):
+    if not is_numeric(pair[y_col]):
+        raise ValueError("Line için sayısal y kolonu gerekir.")
+    # seaborn.lineplot gibi: aynı x için ortalama y
+    line = pair.groupby(x_col, sort=True, observed=True)[y_col].mean()
+    xs = line.index.to_series()
+    if is_numeric(xs) or pd.api.types.is_datetime64_any_dtype(xs):
+        idx = lttb(_axis(xs), line.to_numpy(dtype="float64"), MAX_POINTS)
+    else:
+        idx = np.arange(min(len(line), MAX_POINTS))
+    line = line.iloc[idx]
+    data = {"n": len(pair), "x": to_list(line.index.to_numpy()), "y": to_list(line.to_numpy())}
+    if pd.api.types.is_datetime64_any_dtype(xs):
+        data["xType"] = "datetime"
+    return data
+
+
+def _groups(pair, x_col, y_col):
+    y = pd.to_numeric(pair[y_col], errors="coerce")
+    keep = y.notna()
+    x, y = pair[x_col][keep], y[keep]
+    labels = x.value_counts().head(MAX_GROUPS).index
+    mask = x.isin(labels)
+    return x[mask], y[mask]
+
+
+def _box_stats(x, y):
+    grouped = y.groupby(x, sort=True, observed=True)
+    q = grouped.quantile([0.25, 0.5, 0.75]).unstack()
+    iqr = q[0.75] - q[0.25]
+    lo = (q[0.25] - 1.5 * iqr).reindex(x).to_numpy()
+    hi = (q[0.75] + 1.5 * iqr).reindex(x).to_numpy()
+    inside = (y.to_numpy() >= lo) & (y.to_numpy() <= hi)
+    whiskers = y[inside].groupby(x[inside], sort=True, observed=True).agg(["min", "max"])
+    outliers = y[~inside].groupby(x[~inside], sort=True, observed=True)
+    fliers = {k: v.to_numpy() for k, v in outliers}
+    counts = grouped.size()
+
+    stats = []
+    for label in q.index:
+        out = fliers.get(label, np.empty(0))
+        stats.append({
+            "label": str(label),
+            "n": int(counts[label]),
+            "whislo": float(whiskers.loc[label, "min"]),
+            "q1": float(q.loc[label, 0.25]),
+            "med": float(q.loc[label, 0.5]),
+            "q3": float(q.loc[label, 0.75]),
+            "whishi": float(whiskers.loc[label, "max"]),
+            "outliers": int(len(out)),
+            "fliers": to_list(out[sample_indices(len(out), MAX_FLIERS)]),
+        })
+    return stats
+
+
+def _box_data(pair, x_col, y_col):
+    x, y = _groups(pair, x_col, y_col)
+    if len(y) == 0:
+        raise ValueError("Box için sayısal y kolonu gerekir.")
+    return {"groups": _box_stats(x, y)}
+
+
+def _violin_data(pair, x_col, y_col):
+    x, y = _groups(pair, x_col, y_col)
+    if len(y) == 0:
+        raise ValueError("Violin için sayısal y kolonu gerekir.")
+    groups = _box_stats(x, y)
+    values = {str(k): v.to_numpy(dtype="float64") for k, v in y.groupby(x, sort=True, observed=True)}
+    for g in groups:
+        curve = kde_curve(values[g["label"]], grid_size=VIOLIN_GRID)
+        if curve is None:
+            g["y"], g["density"] = [g["med"]], [1.0]
+        else:
+            grid, density = curve
+            g["y"], g["density"] = to_list(grid), to_list(density / density.max())
+    return {"groups": groups}
+
+
+def _heatmap_data(df, stats=None):
+    corr = stats.correlation() if stats is not None else df.corr(numeric_only=True)
+    return {"columns": [str(c) for c in corr.columns], "matrix": [to_list(row) for row in corr.to_numpy()]}
+
+
+def chart_data(df, chart_type, x_col, y_col=None, stats=None):
+    # Her grafik türü için nokta bütçesiyle sınırlı özet; hem istemciye
+    # gönderilir hem de sunucu tarafı çizim bu özetten yapılır.
+    if chart_type == "heatmap":
+        return _heatmap_data(df, stats)
+    if chart_type in ("histogram", "kde"):
+        x = df[x_col]
+        return _histogram_data(x, with_kde=True) if chart_type == "histogram" else _kde_data(x)
+    if chart_type in ("bar", "count", "pie"):
+        return value_counts(df[x_col])
+
+    pair = df[list(dict.fromkeys([x_col, y_col]))].dropna()
+    if chart_type == "scatter":
+        return _scatter_data(pair, x_col, y_col)
+    if chart_type == "line":
+        return _line_data(pair, x_col, y_col)
+    if chart_type == "box":
+        return _box_data(pair, x_col, y_col)
+    if chart_type == "violin":
+        return _violin_data(pair, x_col, y_col)
+    raise ValueError(f"Bilinmeyen grafik türü: {chart_type}")
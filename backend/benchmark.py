@@ -0,0 +1,380 @@
+# backend/benchmark.py
+# Uç noktaların performans ölçümü (Flask test istemcisiyle, sunucu gerekmez).
+#
+#   python benchmark.py run --scales 10k,100k --out baseline.json
+#   python benchmark.py run --scales 10k,100k --out current.json --compare baseline.json
+#   python benchmark.py compare baseline.json current.json
+#
+# Her çalıştırma geçici bir veri kökünde (LEBB_DATA_DIR) yapılır; depo klasörleri
+# kirlenmez. Eğitim süreç içinde çalışır (LEBB_TRAIN_WORKERS=0) ki bellek
+# ölçümü fit'i de kapsasın; sonuç önbelleği kapalıdır (her tekrar yeniden fit).
+import argparse
+import io
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+SCALES = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+SHAPES = {
+    # (sayısal kolon, kategorik kolon)
+    "narrow": (8, 2),
+    "wide": (100, 10),
+}
+MISSING_RATE = 0.05
+CATEGORY_LEVELS = 12
+DOWNLOAD_FORMATS = ("csv", "xlsx", "json", "ndjson", "arrow")
+
+# Karşılaştırmada bu orandan fazla kötüleşme (ve en az MIN_MS fark) gerileme sayılır
+THRESHOLD = 0.25
+MIN_MS = 5.0
+
+
+# ----------------------------
+# Sentetik veri
+# ----------------------------
+def parse_scale(text):
+    text = text.strip().lower()
+    if text in SCALES:
+        return SCALES[text]
+    if text.endswith("k"):
+        return int(float(text[:-1]) * 1_000)
+    if text.endswith("m"):
+        return int(float(text[:-1]) * 1_000_000)
+    return int(text)
+
+
+def scale_label(rows):
+    if rows % 1_000_000 == 0:
+        return f"{rows // 1_000_000}m"
+    if rows % 1_000 == 0:
+        return f"{rows // 1_000}k"
+    return str(rows)
+
+
+def make_dataset(rows, shape, seed=0):
+    # Sayısal kolonlarda eksik değerler, metin kategoriler; "label" sınıflandırma,
+    # "y" regresyon hedefi (özelliklere bağlı, gürültülü)
+    n_num, n_cat = SHAPES[shape]
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(rows, n_num))
+    weights = rng.normal(size=n_num)
+    signal = X @ weights
+    data = {f"num_{i}": X[:, i] for i in range(n_num)}
+    levels = np.array([f"c{j}" for j in range(CATEGORY_LEVELS)], dtype=object)
+    for i in range(n_cat):
+        data[f"cat_{i}"] = levels[rng.integers(0, CATEGORY_LEVELS, rows)]
+    df = pd.DataFrame(data)
+    for i in range(0, n_num, 2):
+        df.loc[rng.random(rows) < MISSING_RATE, f"num_{i}"] = np.nan
+    df.loc[rng.random(rows) < MISSING_RATE, "cat_0"] = None
+    df["label"] = np.digitize(signal, np.quantile(signal, [1 / 3, 2 / 3]))
+    df["y"] = signal + rng.normal(scale=0.5, size=rows)
+    return df
+
+
+# ----------------------------
+# Ölçüm
+# ----------------------------
+class PeakSampler:
+    # Çağrı süresince anlık belleği örnekler; tepe - başlangıç
+    def __init__(self, rss, interval=0.01):
+        self.rss = rss
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+
+    def __enter__(self):
+        self.start = self.rss() or 0
+        self.peak = self.start
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, self.rss() or 0)
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, self.rss() or 0)
+
+    @property
+    def delta_mb(self):
+        return round((self.peak - self.start) / 2 ** 20, 1)
+
+
+def percentile(values, q):
+    return round(float(np.percentile(values, q)), 3) if values else None
+
+
+def summarize(samples):
+    ms = [s["ms"] for s in samples]
+    return {
+        "n": len(ms),
+        "p50_ms": percentile(ms, 50),
+        "p90_ms": percentile(ms, 90),
+        "p95_ms": percentile(ms, 95),
+        "max_ms": round(max(ms), 3),
+        "mean_ms": round(float(np.mean(ms)), 3),
+        "peak_rss_mb": max(s["rss_mb"] for s in samples),
+        "bytes": int(np.median([s["bytes"] for s in samples])),
+        "status": sorted({s["status"] for s in samples}),
+    }
+
+
+class Bench:
+
+    def __init__(self, client, rss, repeat, log=print):
+        self.client = client
+        self.rss = rss
+        self.repeat = repeat
+        self.log = log
+        self.cases = {}
+
+    def measure(self, name, call, repeat=None, before=None):
+        samples = []
+        for _ in range(repeat or self.repeat):
+            if before is not None:
+                before()
+            with PeakSampler(self.rss) as mem:
+                started = time.perf_counter()
+                response = call()
+                body = response.get_data()
+                elapsed = (time.perf_counter() - started) * 1000
+            samples.append({"ms": elapsed, "rss_mb": mem.delta_mb, "bytes": len(body), "status": response.status_code})
+        self.cases[name] = summarize(samples)
+        case = self.cases[name]
+        self.log(f"{name:55s} p50 {case['p50_ms']:10.1f} ms  rss +{case['peak_rss_mb']:7.1f} MB  "
+                 f"{case['bytes']:>10d} B  {case['status']}")
+        return response
+
+
+# ----------------------------
+# Senaryolar
+# ----------------------------
+def bench_dataset(bench, rows, shape, args):
+    from config import PLOT_FOLDER, UPLOAD_FOLDER
+    from plots import CHART_TYPES, XY_CHART_TYPES
+    from preprocessing import STEPS
+    from training import CLF_MAP
+
+    c = bench.client
+    tag = f"{scale_label(rows)}-{shape}"
+    name = f"bench_{tag}.csv"
+    df = make_dataset(rows, shape, args.seed)
+    payload = df.to_csv(index=False).encode()
+
+    def upload():
+        return c.post("/analyze", data={"file": (io.BytesIO(payload), name)}, content_type="multipart/form-data")
+
+    def reset_uploads():
+        # Aynı içerik tekrar yüklenince işlenmez; soğuk yol ölçülür
+        shutil.rmtree(UPLOAD_FOLDER)
+        os.makedirs(UPLOAD_FOLDER)
+
+    bench.measure(f"analyze/{tag}", upload, before=reset_uploads)
+    bench.measure(f"analyze_duplicate/{tag}", upload)
+
+    # Ön işleme: her seçenek tek başına
+    params = {"selected_columns": ["num_0", "num_1", "cat_0", "label", "y"], "rename_map": {"num_0": "first"}}
+    for step in STEPS:
+        bench.measure(f"preprocess:{step}/{tag}", lambda: c.post(
+            "/preprocess", json={"filename": name, "options": {step: True}, "params": params, "target_column": "label"}
+        ))
+
+    # Görselleştirme: kayıt (özet) + ilk render
+    def clear_images():
+        for f in os.listdir(PLOT_FOLDER):
+            if f.endswith((".png", ".svg")):
+                os.remove(os.path.join(PLOT_FOLDER, f))
+
+    for chart in CHART_TYPES:
+        if chart in XY_CHART_TYPES:
+            x, y = ("cat_1", "num_1") if chart in ("box", "violin") else ("num_1", "num_2")
+        else:
+            x, y = ("cat_1", None) if chart in ("bar", "pie", "count") else ("num_1", None)
+        item = {"chartType": chart, "xColumn": x, "yColumn": y}
+        response = bench.measure(
+            f"visualize:{chart}/{tag}", lambda: c.post(f"/visualize?filename={name}", json=[item])
+        )
+        refs = response.get_json() or []
+        if refs:
+            bench.measure(f"render:{chart}/{tag}", lambda: c.get(f"/plots/{refs[0]['id']}.png"), before=clear_images)
+
+    # Eğitim için sayısal veri: eksikler dolu, kategoriler kodlu
+    c.post("/preprocess", json={
+        "filename": name, "options": {"fillMissing": True, "encodeCategorical": True}, "target_column": "label"
+    })
+    processed = f"processed_{name}"
+
+    for fmt in DOWNLOAD_FORMATS:
+        if fmt == "xlsx" and rows > args.max_xlsx_rows:
+            bench.log(f"download:{fmt}/{tag}: {args.max_xlsx_rows} satırdan büyük, atlandı")
+            continue
+        bench.measure(f"download:{fmt}/{tag}", lambda: c.get(f"/download?filename={processed}&format={fmt}"))
+
+    train_name = processed
+    if rows > args.max_train_rows:
+        # Yavaş algoritmalar (SVM, KNN...) için eğitim verisi alt örneklenir
+        sample = df.sample(n=args.max_train_rows, random_state=args.seed)
+        train_name = f"train_{name}"
+        c.post("/analyze", data={"file": (io.BytesIO(sample.to_csv(index=False).encode()), train_name)},
+               content_type="multipart/form-data")
+        c.post("/preprocess", json={
+            "filename": train_name, "options": {"fillMissing": True, "encodeCategorical": True},
+            "target_column": "label",
+        })
+        train_name = f"processed_{train_name}"
+
+    targets = {"classification": "label", "regression": "y", "clustering": None}
+    for model_type, algorithms in CLF_MAP.items():
+        for algo in algorithms:
+            for cv in (False, True):
+                if cv and model_type == "clustering":
+                    continue
+                body = {
+                    "filename": train_name, "modelType": model_type, "algorithms": [algo],
+                    "target": targets[model_type], "cvEnabled": cv, "cvFolds": 3,
+                }
+                label = f"train:{model_type}:{algo}{':cv' if cv else ''}/{tag}"
+                bench.measure(label, lambda: c.post("/train-models", json=body), repeat=args.train_repeat)
+
+
+def run(args):
+    data_dir = tempfile.mkdtemp(prefix="lebb-bench-")
+    os.environ["LEBB_DATA_DIR"] = data_dir
+    os.environ["LEBB_TRAIN_WORKERS"] = str(args.workers)
+    os.environ["LEBB_RESULT_CACHE"] = "0"
+    os.environ.setdefault("LEBB_ACTION_LOG", "")
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+    import app as app_module
+    from jobs import job_manager
+    from telemetry import rss_bytes
+
+    bench = Bench(app_module.app.test_client(), rss_bytes, args.repeat)
+    started = time.time()
+    try:
+        for scale in args.scales.split(","):
+            for shape in args.shapes.split(","):
+                bench_dataset(bench, parse_scale(scale), shape, args)
+    finally:
+        job_manager.shutdown()
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+    report = {
+        "meta": {
+            "created_at": started,
+            "seconds": round(time.time() - started, 1),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "versions": _versions(),
+            "scales": args.scales,
+            "shapes": args.shapes,
+            "repeat": args.repeat,
+            "train_repeat": args.train_repeat,
+            "max_train_rows": args.max_train_rows,
+            "seed": args.seed,
+        },
+        "cases": bench.cases,
+    }
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"{len(bench.cases)} ölçüm -> {args.out}")
+
+    if args.compare:
+        return compare(args.compare, args.out, args.threshold, args.min_ms)
+    return 0
+
+
+def _versions():
+    from importlib.metadata import PackageNotFoundError, version
+    versions = {}
+    for package in ("numpy", "pandas", "pyarrow", "scikit-learn", "flask", "matplotlib"):
+        try:
+            versions[package] = version(package)
+        except PackageNotFoundError:
+            versions[package] = None
+    return versions
+
+
+# ----------------------------
+# Karşılaştırma
+# ----------------------------
+def compare(baseline_path, current_path, threshold=THRESHOLD, min_ms=MIN_MS):
+    # p50 süre, tepe bellek ve yanıt boyutu; eşik aşılırsa çıkış kodu 1
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)["cases"]
+    with open(current_path, encoding="utf-8") as f:
+        current = json.load(f)["cases"]
+
+    regressions = []
+    for name in sorted(set(baseline) & set(current)):
+        old, new = baseline[name], current[name]
+        checks = (
+            ("p50_ms", min_ms),
+            ("peak_rss_mb", 1.0),
+            ("bytes", 0),
+        )
+        for key, floor in checks:
+            before, after = old.get(key), new.get(key)
+            if before is None or after is None:
+                continue
+            if after > before * (1 + threshold) and after - before > floor:
+                change = (after - before) / before * 100 if before else float("inf")
+                regressions.append((name, key, before, after, change))
+        if old.get("status") != new.get("status"):
+            regressions.append((name, "status", old.get("status"), new.get("status"), None))
+
+    for name in sorted(set(baseline) - set(current)):
+        print(f"eksik: {name}")
+    for name, key, before, after, change in regressions:
+        suffix = f" (+{change:.0f}%)" if change is not None else ""
+        print(f"GERİLEME {name} {key}: {before} -> {after}{suffix}")
+    print(f"{len(set(baseline) & set(current))} ölçüm karşılaştırıldı, {len(regressions)} gerileme.")
+    return 1 if regressions else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="LEBB backend benchmark")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("run", help="ölçümleri çalıştır ve JSON'a yaz")
+    p.add_argument("--scales", default="10k,100k", help="satır sayıları: 10k,100k,1m ya da sayı")
+    p.add_argument("--shapes", default="narrow,wide", help=",".join(SHAPES))
+    p.add_argument("--repeat", type=int, default=5, help="her istek için tekrar")
+    p.add_argument("--train-repeat", type=int, default=1, help="her eğitim için tekrar")
+    p.add_argument("--max-train-rows", type=int, default=20_000,
+                   help="eğitim verisi bu satır sayısına alt örneklenir")
+    p.add_argument("--max-xlsx-rows", type=int, default=200_000, help="daha büyük veride XLSX atlanır")
+    p.add_argument("--workers", type=int, default=0, help="LEBB_TRAIN_WORKERS (0: süreç içi)")
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--out", default="benchmark.json")
+    p.add_argument("--compare", help="bu taban çizgisiyle karşılaştır")
+    p.add_argument("--threshold", type=float, default=THRESHOLD)
+    p.add_argument("--min-ms", type=float, default=MIN_MS)
+
+    p = sub.add_parser("compare", help="iki sonucu karşılaştır")
+    p.add_argument("baseline")
+    p.add_argument("current")
+    p.add_argument("--threshold", type=float, default=THRESHOLD)
+    p.add_argument("--min-ms", type=float, default=MIN_MS)
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        return run(args)
+    return compare(args.baseline, args.current, args.threshold, args.min_ms)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
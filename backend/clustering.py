@@ -0,0 +1,300 @@
+# backend/clustering.py
+import os
+import time
+
+import numpy as np
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from sklearn.base import BaseEstimator, ClusterMixin
+from sklearn.cluster import AgglomerativeClustering, MiniBatchKMeans, kmeans_plusplus
+from sklearn.metrics.pairwise import euclidean_distances
+from sklearn.neighbors import KNeighborsClassifier, NearestNeighbors
+
+# ----------------------------
+# Ayarlar
+# ----------------------------
+# Bu satır sayısından büyük verilerde ölçeklenebilir kümeleme kullanılır
+LARGE_ROWS = int(os.environ.get("LEBB_CLUSTER_LARGE_ROWS", "20000"))
+# Agglomerative'in fit edildiği örneklem (O(n²) bellek yalnızca bunun için)
+AGGLO_SAMPLE = int(os.environ.get("LEBB_CLUSTER_AGGLO_SAMPLE", "10000"))
+# Silhouette tahmini için örneklem
+SILHOUETTE_SAMPLE = int(os.environ.get("LEBB_SILHOUETTE_SAMPLE", "10000"))
+# DBSCAN komşuluk sorgusunda bir parçada tutulacak en fazla komşu indeksi
+# (bellek sınırı); parça boyu gözlenen komşu yoğunluğuna göre ayarlanır
+NEIGHBOR_BUDGET = int(os.environ.get("LEBB_CLUSTER_NEIGHBORS", "20000000"))
+# Ölçeklenebilir kümeleme için süre sınırı (sn)
+CLUSTER_TIMEOUT = float(os.environ.get("LEBB_CLUSTER_TIMEOUT", "600"))
+
+ASSIGN_CHUNK = 50000
+
+
+class ClusteringTimeout(Exception):
+    pass
+
+
+class _Deadline:
+
+    def __init__(self, seconds):
+        self.end = time.monotonic() + seconds
+
+    def check(self):
+        if time.monotonic() > self.end:
+            raise ClusteringTimeout()
+
+
+# ----------------------------
+# KMeans (mini-batch, süre sınırlı)
+# ----------------------------
+class TimedMiniBatchKMeans(BaseEstimator, ClusterMixin):
+    # MiniBatchKMeans partial_fit ile parça parça eğitilir; her parçadan önce
+    # süre sınırı denetlenir. max_iter veri üzerinden en fazla geçiş sayısı,
+    # merkezler bir geçişte tol'den az kayınca durulur. Başlangıç merkezleri
+    # MiniBatchKMeans.fit'teki gibi n_init aday arasından örneklem
+    # inertia'sına göre seçilir.
+
+    def __init__(self, n_clusters=8, init="k-means++", n_init=3, max_iter=100, batch_size=4096,
+                 tol=1e-4, random_state=None, timeout=CLUSTER_TIMEOUT):
+        self.n_clusters = n_clusters
+        self.init = init
+        self.n_init = n_init
+        self.max_iter = max_iter
+        self.batch_size = batch_size
+        self.tol = tol
+        self.random_state = random_state
+        self.timeout = timeout
+
+    def _initial_centers(self, X, rng):
+        if not isinstance(self.init, str):
+            return np.asarray(self.init, dtype="float64")
+        size = min(len(X), max(3 * self.batch_size, self.n_clusters))
+        sample = X[rng.choice(len(X), size=size, replace=False)]
+        best, best_inertia = None, np.inf
+        # KMeans'in n_init="auto" değeri burada 3 aday demektir
+        n_init = self.n_init if isinstance(self.n_init, int) else 3
+        for _ in range(max(1, n_init)):
+            if self.init == "random":
+                centers = sample[rng.choice(len(sample), size=self.n_clusters, replace=False)]
+            else:
+                centers, _ = kmeans_plusplus(sample, self.n_clusters, random_state=int(rng.integers(2 ** 31 - 1)))
+            inertia = euclidean_distances(sample, centers, squared=True).min(axis=1).sum()
+            if inertia < best_inertia:
+                best, best_inertia = centers, inertia
+        return best
+
+    def fit(self, X, y=None):
+        X = np.asarray(X, dtype="float64")
+        deadline = _Deadline(self.timeout)
+        rng = np.random.default_rng(self.random_state)
+        self.engine_ = MiniBatchKMeans(
+            n_clusters=self.n_clusters, init=self._initial_centers(X, rng), n_init=1,
+            batch_size=self.batch_size, random_state=self.random_state,
+        )
+        # Kayma eşiği verinin ortalama varyansına göre (KMeans'teki gibi)
+        tol = self.tol * float(X.var(axis=0).mean())
+        self.n_iter_ = 0
+        while self.n_iter_ < self.max_iter:
+            previous = getattr(self.engine_, "cluster_centers_", None)
+            previous = None if previous is None else previous.copy()
+            order = rng.permutation(len(X))
+            for start in range(0, len(X), self.batch_size):
+                deadline.check()
+                self.engine_.partial_fit(X[order[start:start + self.batch_size]])
+            self.n_iter_ += 1
+            if previous is not None and ((self.engine_.cluster_centers_ - previous) ** 2).sum() <= tol:
+                break
+        self.cluster_centers_ = self.engine_.cluster_centers_
+        self.labels_ = self._assign(X, deadline)
+        return self
+
+    def _assign(self, X, deadline=None):
+        labels = np.empty(len(X), dtype=np.int64)
+        for start in range(0, len(X), ASSIGN_CHUNK):
+            if deadline is not None:
+                deadline.check()
+            labels[start:start + ASSIGN_CHUNK] = self.engine_.predict(X[start:start + ASSIGN_CHUNK])
+        return labels
+
+    def predict(self, X):
+        return self._assign(np.asarray(X, dtype="float64"))
+
+
+# ----------------------------
+# DBSCAN (parça parça komşuluk)
+# ----------------------------
+def _counts(neighbors):
+    return np.fromiter((len(nb) for nb in neighbors), dtype=np.int64, count=len(neighbors))
+
+
+def _edges(neighbors):
+    # radius_neighbors çıktısı -> (parça içi satır konumu, komşu indeksi)
+    counts = _counts(neighbors)
+    if not counts.sum():
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return np.repeat(np.arange(len(neighbors)), counts), np.concatenate(neighbors)
+
+
+def _roots(parent, idx):
+    roots = parent[idx]
+    while True:
+        nxt = parent[roots]
+        if np.array_equal(nxt, roots):
+            return roots
+        roots = nxt
+
+
+def _union(parent, a, b):
+    # Kenarlar (a, b) ile birleşen kökler bileşenin en küçük köküne bağlanır
+    a, b = _roots(parent, a), _roots(parent, b)
+    keep = a != b
+    if not keep.any():
+        return
+    nodes, inv = np.unique(np.concatenate([a[keep], b[keep]]), return_inverse=True)
+    m = int(keep.sum())
+    graph = coo_matrix((np.ones(m, dtype=np.int8), (inv[:m], inv[m:])), shape=(len(nodes), len(nodes)))
+    n_comp, comp = connected_components(graph, directed=False)
+    rep = np.full(n_comp, np.iinfo(np.int64).max)
+    np.minimum.at(rep, comp, nodes)
+    parent[nodes] = rep[comp]
+
+
+class ChunkedDBSCAN(BaseEstimator, ClusterMixin):
+    # DBSCAN ile aynı tanım (çekirdek: kendisi dahil eps içinde en az
+    # min_samples nokta). Komşuluklar KD/Ball ağacından parça parça sorgulanır
+    # ve bileşenler union-find ile birleştirilir; tüm komşuluk listesi hiçbir
+    # zaman bellekte tutulmaz.
+
+    def __init__(self, eps=0.5, min_samples=5, metric="euclidean", n_jobs=None,
+                 neighbor_budget=NEIGHBOR_BUDGET, timeout=CLUSTER_TIMEOUT):
+        self.eps = eps
+        self.min_samples = min_samples
+        self.metric = metric
+        self.n_jobs = n_jobs
+        self.neighbor_budget = neighbor_budget
+        self.timeout = timeout
+
+    def _chunks(self, nn, idx, X, deadline):
+        # Parça boyu: komşu bütçesi / satır başına komşu sayısı. İlk parçada
+        # yoğunluk bilinmediğinden en kötü durum (her satır tüm noktaların
+        # komşusu) varsayılır, sonrakilerde gözlenen ortalama kullanılır.
+        start, size = 0, int(max(1, min(ASSIGN_CHUNK, self.neighbor_budget / max(1, len(X)))))
+        while start < len(idx):
+            deadline.check()
+            rows = idx[start:start + size]
+            neighbors = nn.radius_neighbors(X[rows], return_distance=False)
+            yield rows, neighbors
+            start += len(rows)
+            avg = max(1.0, sum(len(n) for n in neighbors) / len(rows))
+            size = int(max(1, min(ASSIGN_CHUNK, self.neighbor_budget / avg)))
+
+    def fit(self, X, y=None):
+        X = np.asarray(X, dtype="float64")
+        n = len(X)
+        deadline = _Deadline(self.timeout)
+        nn = NearestNeighbors(radius=self.eps, metric=self.metric, n_jobs=self.n_jobs).fit(X)
+        everything = np.arange(n)
+
+        # 1) Çekirdek noktalar
+        core = np.zeros(n, dtype=bool)
+        for rows, neighbors in self._chunks(nn, everything, X, deadline):
+            core[rows] = _counts(neighbors) >= self.min_samples
+
+        # 2) Birbirinin eps komşusu olan çekirdekler aynı kümede
+        parent = np.arange(n)
+        core_idx = np.flatnonzero(core)
+        for rows, neighbors in self._chunks(nn, core_idx, X, deadline):
+            pos, dst = _edges(neighbors)
+            edge = core[dst]
+            _union(parent, rows[pos[edge]], dst[edge])
+
+        labels = np.full(n, -1, dtype=np.int64)
+        labels[core_idx] = _roots(parent, core_idx)
+
+        # 3) Sınır noktaları: eps içindeki (indeksi en küçük) çekirdeğin kümesi
+        for rows, neighbors in self._chunks(nn, np.flatnonzero(~core), X, deadline):
+            pos, dst = _edges(neighbors)
+            edge = core[dst]
+            nearest = np.full(len(rows), n)
+            np.minimum.at(nearest, pos[edge], dst[edge])
+            found = nearest < n
+            labels[rows[found]] = labels[nearest[found]]
+
+        # Kökler 0..k-1 olarak, ilk görünme sırasıyla numaralanır
+        clustered = labels >= 0
+        _, first, inverse = np.unique(labels[clustered], return_index=True, return_inverse=True)
+        order = np.argsort(np.argsort(first))
+        labels[clustered] = order[inverse]
+
+        self.labels_ = labels
+        self.core_sample_indices_ = core_idx
+        return self
+
+
+# ----------------------------
+# Agglomerative (örneklem + atama)
+# ----------------------------
+class SampledAgglomerative(BaseEstimator, ClusterMixin):
+    # Agglomerative örneklem üzerinde fit edilir; kalan noktalar en yakın
+    # örneklem noktasının kümesini alır. Aynı atama predict() ile yeni
+    # veriye de uygulanabilir.
+
+    def __init__(self, n_clusters=2, linkage="ward", metric="euclidean", distance_threshold=None,
+                 sample_size=AGGLO_SAMPLE, random_state=42, timeout=CLUSTER_TIMEOUT):
+        self.n_clusters = n_clusters
+        self.linkage = linkage
+        self.metric = metric
+        self.distance_threshold = distance_threshold
+        self.sample_size = sample_size
+        self.random_state = random_state
+        self.timeout = timeout
+
+    def fit(self, X, y=None):
+        X = np.asarray(X, dtype="float64")
+        deadline = _Deadline(self.timeout)
+        rng = np.random.default_rng(self.random_state)
+        sample = np.sort(rng.choice(len(X), size=min(self.sample_size, len(X)), replace=False))
+        self.agglomerative_ = AgglomerativeClustering(
+            n_clusters=self.n_clusters, linkage=self.linkage, metric=self.metric,
+            distance_threshold=self.distance_threshold,
+        ).fit(X[sample])
+        self.assigner_ = KNeighborsClassifier(n_neighbors=1).fit(X[sample], self.agglomerative_.labels_)
+        self.n_clusters_ = self.agglomerative_.n_clusters_
+        self.labels_ = self._assign(X, deadline)
+        self.labels_[sample] = self.agglomerative_.labels_
+        return self
+
+    def _assign(self, X, deadline=None):
+        labels = np.empty(len(X), dtype=np.int64)
+        for start in range(0, len(X), ASSIGN_CHUNK):
+            if deadline is not None:
+                deadline.check()
+            labels[start:start + ASSIGN_CHUNK] = self.assigner_.predict(X[start:start + ASSIGN_CHUNK])
+        return labels
+
+    def predict(self, X):
+        return self._assign(np.asarray(X, dtype="float64"))
+
+
+# ----------------------------
+# Seçim
+# ----------------------------
+def scalable_model(algo, params, n_rows, n_jobs=1):
+    # Büyük veri için eşdeğer ölçeklenebilir tahmin edici; küçük veride None
+    if n_rows <= LARGE_ROWS:
+        return None
+    if algo == "KMeans":
+        allowed = TimedMiniBatchKMeans().get_params()
+        return TimedMiniBatchKMeans(**{k: v for k, v in params.items() if k in allowed})
+    if algo == "DBSCAN":
+        allowed = ChunkedDBSCAN().get_params()
+        kwargs = {k: v for k, v in params.items() if k in allowed}
+        kwargs.setdefault("n_jobs", n_jobs)
+        return ChunkedDBSCAN(**kwargs)
+    if algo == "AgglomerativeClustering":
+        allowed = SampledAgglomerative().get_params()
+        return SampledAgglomerative(**{k: v for k, v in params.items() if k in allowed})
+    return None
+
+
+def silhouette_sample(n_rows):
+    # silhouette_score O(n²); büyük veride örneklem üzerinden tahmin
+    return SILHOUETTE_SAMPLE if n_rows > SILHOUETTE_SAMPLE else None
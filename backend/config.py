@@ -0,0 +1,17 @@
+# backend/config.py
+import os
+
+# Depo klasörleri (LEBB_DATA_DIR ile başka bir köke taşınabilir, ör. benchmark)
+BASE_DIR = os.environ.get("LEBB_DATA_DIR", os.path.dirname(__file__))
+UPLOAD_FOLDER = os.path.join(BASE_DIR, "uploads")
+PROCESSED_FOLDER = os.path.join(BASE_DIR, "processed")
+MODEL_FOLDER = os.path.join(BASE_DIR, "models")
+PLOT_FOLDER = os.path.join(BASE_DIR, "plots")
+LOG_FOLDER = os.path.join(BASE_DIR, "logs")
+JOB_FOLDER = os.path.join(BASE_DIR, "jobs")
+os.makedirs(UPLOAD_FOLDER, exist_ok=True)
+os.makedirs(PROCESSED_FOLDER, exist_ok=True)
+os.makedirs(MODEL_FOLDER, exist_ok=True)
+os.makedirs(PLOT_FOLDER, exist_ok=True)
+os.makedirs(LOG_FOLDER, exist_ok=True)
+os.makedirs(JOB_FOLDER, exist_ok=True)
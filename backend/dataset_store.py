@@ -0,0 +1,764 @@
+# backend/dataset_store.py
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+
+from profiling import DatasetProfile
+from telemetry import span
+
+# ----------------------------
+# Ayarlar
+# ----------------------------
+# Ayrıştırılmış veri setleri için bellek bütçesi (MB)
+DATASET_CACHE_MB = int(os.environ.get("LEBB_DATASET_CACHE_MB", "512"))
+
+# Depolama biçimi: Arrow IPC (Feather v2). Sıkıştırmasız dosyalar
+# memory-map ile kopyasız okunabilir.
+STORE_SUFFIX = ".arrow"
+STORE_COMPRESSION = os.environ.get("LEBB_STORE_COMPRESSION", "uncompressed")
+# DataFrame'e çevirirken tek parçalı, eksiksiz sayısal ve metin kolonları
+# memory-map üzerinden kopyasız görünüm olarak kalır; aynı veri setini açan
+# sunucu işçileri işletim sisteminin sayfa önbelleğini paylaşır.
+SHARED_FRAMES = os.environ.get("LEBB_SHARED_FRAMES", "1") != "0"
+
+READERS = {
+    ".csv": pd.read_csv,
+    ".parquet": pd.read_parquet,
+    ".pq": pd.read_parquet,
+    ".feather": pd.read_feather,
+    ".arrow": pd.read_feather,
+    ".xlsx": pd.read_excel,
+    ".xls": pd.read_excel,
+}
+SUPPORTED_EXTENSIONS = tuple(READERS)
+
+# Akışlı okuma/yazmada parça başına satır sayısı
+CHUNK_ROWS = int(os.environ.get("LEBB_CHUNK_ROWS", "100000"))
+
+# CSV kolon türü -> depo türü (tamamen boş kolonlar pandas gibi float64)
+ARROW_TYPES = {
+    "bool": pa.bool_(),
+    "int": pa.int64(),
+    "float": pa.float64(),
+    "str": pa.string(),
+    None: pa.float64(),
+}
+
+# Depoya yazarken kolonlar profile göre en küçük güvenli türe indirilir:
+# tamsayılar int8/16/32, kayıpsız sığan ondalıklar float32, az değerli
+# metinler kategori (sözlük). Seçilen tür Arrow şemasında saklanır, sonraki
+# okumalar yeniden çıkarım yapmaz.
+DOWNCAST = os.environ.get("LEBB_DOWNCAST", "1") != "0"
+# Farklı değer sayısı dolu satırların bu oranını aşmayan metinler kategori olur
+CATEGORY_RATIO = float(os.environ.get("LEBB_CATEGORY_RATIO", "0.5"))
+INT_TYPES = (pa.int8(), pa.int16(), pa.int32(), pa.int64())
+
+HASH_CHUNK_SIZE = 1 << 20
+
+# İstatistik indeksi (profil + korelasyon toplamları) veri setinin yanında tutulur
+STATS_SUFFIX = ".stats.pkl"
+STATS_CACHE_SIZE = int(os.environ.get("LEBB_STATS_CACHE", "32"))
+
+
+# ----------------------------
+# Yardımcılar
+# ----------------------------
+def file_digest(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class HashingFile:
+    # Yazılan baytların sha256 özetini yazarken hesaplayan dosya; dosya
+    # sonradan yeniden okunmadan file_digest() ile aynı özet elde edilir.
+    # limit aşılırsa OSError yerine on_limit() ile verilen hata fırlatılır.
+
+    def __init__(self, path, limit=None, on_limit=None):
+        self.path = path
+        self.limit = limit
+        self.on_limit = on_limit
+        self.size = 0
+        self._hash = hashlib.sha256()
+        self._file = open(path, "w+b")
+
+    def write(self, data):
+        self.size += len(data)
+        if self.limit is not None and self.size > self.limit:
+            raise self.on_limit() if self.on_limit else OSError("Dosya boyutu sınırı aşıldı.")
+        self._hash.update(data)
+        return self._file.write(data)
+
+    def hexdigest(self):
+        return self._hash.hexdigest()
+
+    @property
+    def closed(self):
+        return self._file.closed
+
+    def __getattr__(self, name):
+        # read/seek/tell/flush/close doğrudan alttaki dosyaya
+        return getattr(self._file, name)
+
+
+def drop_unnamed(df):
+    return df.loc[:, ~df.columns.str.contains('^Unnamed')]
+
+
+def is_supported(filename):
+    return os.path.splitext(filename)[1].lower() in READERS
+
+
+def stored_path(folder, name):
+    return os.path.join(folder, name + STORE_SUFFIX)
+
+
+def find_dataset(name, *folders):
+    # Önce kolonlu kopya, yoksa (eski) ham dosya
+    for folder in folders:
+        for path in (stored_path(folder, name), os.path.join(folder, name)):
+            if os.path.exists(path):
+                return path
+    return None
+
+
+def load_frame(path):
+    if path.endswith(STORE_SUFFIX):
+        return feather.read_table(path, memory_map=True).to_pandas(split_blocks=SHARED_FRAMES)
+    reader = READERS.get(os.path.splitext(path)[1].lower())
+    if reader is None:
+        raise ValueError("Desteklenmeyen dosya uzantısı.")
+    return drop_unnamed(reader(path))
+
+
+def to_arrow_table(df):
+    df = df.reset_index(drop=True)
+    df.columns = [str(c) for c in df.columns]
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError):
+        pass
+    # Karışık tipli object kolonlar metne çevrilir
+    for col in df.columns:
+        if df[col].dtype == object:
+            try:
+                pa.array(df[col], from_pandas=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError):
+                df[col] = df[col].where(df[col].isna(), df[col].astype(str))
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+# ----------------------------
+# Tür küçültme
+# ----------------------------
+def column_type(col, base):
+    # (Arrow türü, kategori değerleri); profil yoksa ya da tür bilinmiyorsa base
+    if not DOWNCAST or col is None:
+        return base, None
+    if col.kind == "int" and not col.missing:
+        for t in INT_TYPES:
+            info = np.iinfo(t.to_pandas_dtype())
+            if info.min <= col.min and col.max <= info.max:
+                return t, None
+    if col.kind in ("int", "float") and col.count:
+        return (pa.float32() if col.float32_exact else pa.float64()), None
+    if col.kind == "str" and col.levels is not None and len(col.levels) <= CATEGORY_RATIO * (col.rows - col.missing):
+        return pa.dictionary(pa.int32(), pa.string()), sorted(col.levels)
+    return base, None
+
+
+def logical_type(type_):
+    # Küçültülmüş tür yalnızca depolama ayrıntısıdır; pipeline şeması ve
+    # filtreler gibi dışarıya dönük yerlerde geniş tür kullanılır
+    if pa.types.is_integer(type_):
+        return pa.int64()
+    if pa.types.is_floating(type_):
+        return pa.float64()
+    if pa.types.is_dictionary(type_):
+        return type_.value_type
+    return type_
+
+
+def logical_schema(schema):
+    return pa.schema([pa.field(field.name, logical_type(field.type)) for field in schema])
+
+
+def storage_schema(profile, base):
+    # Profil + temel şema -> depo şeması ve kategori kolonlarının değerleri
+    fields, levels = [], {}
+    for field in base:
+        col = profile.columns.get(field.name)
+        if col is None:
+            # Kolon adları str'ye çevrilmiş olabilir (to_arrow_table)
+            col = next((c for c in profile.columns.values() if str(c.name) == field.name), None)
+        type_, values = column_type(col, field.type)
+        fields.append(pa.field(field.name, type_))
+        if values is not None:
+            levels[field.name] = values
+    return pa.schema(fields), levels
+
+
+def downcast_frame(df, profile):
+    # Bellekteki DataFrame için aynı seçim (pandas türleriyle)
+    df = df.copy(deep=False)
+    for col in df.columns:
+        profiled = profile.columns.get(col)
+        if profiled is None:
+            continue
+        type_, values = column_type(profiled, None)
+        if values is not None:
+            df[col] = pd.Categorical(df[col], categories=values)
+        elif type_ is not None and df[col].dtype != type_.to_pandas_dtype():
+            df[col] = df[col].astype(type_.to_pandas_dtype())
+    return df
+
+
+# ----------------------------
+# Veri seti önbelleği
+# ----------------------------
+class DatasetCache:
+    # İçerik özeti + mtime ile anahtarlanan, LRU tahliyeli DataFrame önbelleği.
+    # Dönen DataFrame paylaşımlıdır; değiştirecek olan çağıran .copy() almalı.
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()   # key -> (df, nbytes)
+        self._digests = {}              # path -> (mtime_ns, size, digest)
+        self._keys_by_path = {}         # path -> key
+        self._lock = threading.Lock()
+
+    def _key(self, path):
+        st = os.stat(path)
+        with self._lock:
+            memo = self._digests.get(path)
+        if memo and memo[0] == st.st_mtime_ns and memo[1] == st.st_size:
+            digest = memo[2]
+        else:
+            digest = file_digest(path)
+            with self._lock:
+                self._digests[path] = (st.st_mtime_ns, st.st_size, digest)
+        return (digest, st.st_mtime_ns)
+
+    def digest(self, path):
+        return self._key(os.path.abspath(path))[0]
+
+    def remember(self, path, digest):
+        # Yazarken hesaplanan özet; dosya yeniden okunup özetlenmez
+        path = os.path.abspath(path)
+        st = os.stat(path)
+        with self._lock:
+            self._digests[path] = (st.st_mtime_ns, st.st_size, digest)
+
+    def get(self, path, loader=load_frame):
+        path = os.path.abspath(path)
+        key = self._key(path)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._keys_by_path[path] = key
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        df = loader(path)
+        nbytes = int(df.memory_usage(index=True, deep=True).sum())
+
+        # Bütçeden büyük veri setleri önbelleğe alınmaz
+        if nbytes > self.max_bytes:
+            return df
+
+        with self._lock:
+            old_key = self._keys_by_path.get(path)
+            if old_key is not None and old_key != key:
+                self._drop(old_key)
+            if key not in self._entries:
+                self._entries[key] = (df, nbytes)
+                self.current_bytes += nbytes
+            self._keys_by_path[path] = key
+            while self.current_bytes > self.max_bytes and self._entries:
+                old, _ = next(iter(self._entries.items()))
+                self._drop(old)
+                self.evictions += 1
+        return df
+
+    def _drop(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.current_bytes -= entry[1]
+
+    def invalidate(self, path):
+        path = os.path.abspath(path)
+        with self._lock:
+            self._digests.pop(path, None)
+            key = self._keys_by_path.pop(path, None)
+            if key is not None and key not in self._keys_by_path.values():
+                self._drop(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._digests.clear()
+            self._keys_by_path.clear()
+            self.current_bytes = 0
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / total, 4) if total else None,
+            }
+
+
+dataset_cache = DatasetCache(DATASET_CACHE_MB * 1024 * 1024)
+
+
+def read_dataset(path):
+    with span("read"):
+        return dataset_cache.get(path)
+
+
+def write_dataset(df, folder, name, profile=None):
+    path = stored_path(folder, name)
+    tmp = path + ".tmp"
+    profile = profile if profile is not None else build_profile(df)
+    feather.write_feather(to_arrow_table(downcast_frame(df, profile)), tmp, compression=STORE_COMPRESSION)
+    os.replace(tmp, path)
+    dataset_cache.invalidate(path)
+    save_stats(path, profile)
+    return path
+
+
+# ----------------------------
+# İstatistik indeksi
+# ----------------------------
+_stats = OrderedDict()      # path -> (digest, profile)
+_stats_lock = threading.Lock()
+
+
+def stats_path(path):
+    return path + STATS_SUFFIX
+
+
+def build_profile(df):
+    profile = DatasetProfile()
+    for start in range(0, max(len(df), 1), CHUNK_ROWS):
+        profile.update(df.iloc[start:start + CHUNK_ROWS])
+    return profile
+
+
+def save_stats(path, profile):
+    path = os.path.abspath(path)
+    digest = dataset_cache.digest(path)
+    tmp = stats_path(path) + ".tmp"
+    with open(tmp, "wb") as f:
+        pickle.dump({"digest": digest, "profile": profile}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, stats_path(path))
+    _remember_stats(path, digest, profile)
+
+
+def _remember_stats(path, digest, profile):
+    with _stats_lock:
+        _stats[path] = (digest, profile)
+        _stats.move_to_end(path)
+        while len(_stats) > STATS_CACHE_SIZE:
+            _stats.popitem(last=False)
+
+
+def dataset_stats(path):
+    # Veri setinin profili; indeks yoksa ya da veri değişmişse bir kez
+    # yeniden hesaplanıp kaydedilir.
+    path = os.path.abspath(path)
+    digest = dataset_cache.digest(path)
+    with _stats_lock:
+        memo = _stats.get(path)
+    if memo is not None and memo[0] == digest:
+        return memo[1]
+
+    try:
+        with open(stats_path(path), "rb") as f:
+            saved = pickle.load(f)
+        if saved["digest"] == digest:
+            _remember_stats(path, digest, saved["profile"])
+            return saved["profile"]
+    except (OSError, EOFError, pickle.UnpicklingError, KeyError, AttributeError):
+        pass
+
+    profile = build_profile(read_dataset(path))
+    save_stats(path, profile)
+    return profile
+
+
+# ----------------------------
+# Akışlı yazma
+# ----------------------------
+class DatasetWriter:
+    # Parça parça Arrow IPC dosyası yazar. Parçalar arasında farklılaşan
+    # kategori sözlükleri tek bir büyüyen sözlükte birleştirilir (delta).
+
+    def __init__(self, path, schema, levels=None):
+        self.path = path
+        self.schema = schema
+        self.levels = levels or {}
+        self._tmp = path + ".tmp"
+        self._dicts = {}
+        options = pa.ipc.IpcWriteOptions(
+            compression=None if STORE_COMPRESSION == "uncompressed" else STORE_COMPRESSION,
+            emit_dictionary_deltas=True,
+        )
+        # Özet yazarken hesaplanır; save_stats() dosyayı yeniden okumaz
+        self._sink = HashingFile(self._tmp)
+        self._writer = pa.ipc.new_file(self._sink, schema, options=options)
+
+    def _unify(self, name, arr):
+        values, codes = self._dicts.setdefault(name, ([], {}))
+        dictionary = arr.dictionary.to_pylist()
+        for v in dictionary:
+            if v not in codes:
+                codes[v] = len(values)
+                values.append(v)
+        mapping = np.array([codes[v] for v in dictionary] or [0], dtype="int64")
+        mask = arr.is_null().to_numpy(zero_copy_only=False)
+        indices = mapping[arr.indices.fill_null(0).to_numpy(zero_copy_only=False)]
+        return pa.DictionaryArray.from_arrays(
+            pa.array(indices, type=arr.type.index_type, mask=mask),
+            pa.array(values, type=arr.type.value_type),
+            ordered=arr.type.ordered,
+        )
+
+    def write_batch(self, batch):
+        columns = []
+        for field, col in zip(self.schema, batch.columns):
+            if pa.types.is_dictionary(field.type):
+                col = self._unify(field.name, col)
+            columns.append(col)
+        self._writer.write_batch(pa.record_batch(columns, schema=self.schema))
+
+    def write_frame(self, chunk):
+        arrays = []
+        for field in self.schema:
+            s = chunk[field.name]
+            if field.name in self.levels:
+                # Sabit (sıralı) kategori kümesi: tüm parçalarda aynı sözlük
+                s = pd.Series(pd.Categorical(s, categories=self.levels[field.name]), index=s.index)
+            try:
+                arr = pa.array(s, type=field.type, from_pandas=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError):
+                try:
+                    arr = pa.array(s.where(s.isna(), s.astype(str)), type=field.type, from_pandas=True)
+                except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError) as e:
+                    raise ValueError(f"'{field.name}' kolonu {field.type} türüne çevrilemedi: {e}") from e
+            # pyarrow destekli pandas kolonları parçalı dizi dönebilir
+            if isinstance(arr, pa.ChunkedArray):
+                arr = arr.combine_chunks()
+            arrays.append(arr)
+        self.write_batch(pa.record_batch(arrays, schema=self.schema))
+
+    def close(self):
+        self._writer.close()
+        self._sink.close()
+        os.replace(self._tmp, self.path)
+        dataset_cache.invalidate(self.path)
+        dataset_cache.remember(self.path, self._sink.hexdigest())
+
+    def abort(self):
+        self._writer.close()
+        self._sink.close()
+        os.remove(self._tmp)
+
+
+def _csv_columns(path):
+    header = pd.read_csv(path, nrows=0).columns
+    return [c for c in header if not str(c).startswith("Unnamed")]
+
+
+def _ingest_csv(raw_path, path):
+    usecols = _csv_columns(raw_path)
+
+    # 1. geçiş: profil + kolon türlerinin belirlenmesi
+    profile = DatasetProfile()
+    for chunk in pd.read_csv(raw_path, usecols=usecols, chunksize=CHUNK_ROWS):
+        profile.update(chunk)
+
+    fields = []
+    for name in usecols:
+        col = profile.columns.get(name)
+        kind = col.kind if col is not None else None
+        if kind == "int" and col.missing:
+            kind = "float"
+        fields.append(pa.field(str(name), ARROW_TYPES[kind]))
+    schema, levels = storage_schema(profile, pa.schema(fields))
+
+    # 2. geçiş: belirlenen şemayla depoya yazım
+    dtype = {c.name: str for c in profile.columns.values() if c.kind == "str"}
+    writer = DatasetWriter(path, schema, levels)
+    try:
+        for chunk in pd.read_csv(raw_path, usecols=usecols, dtype=dtype, chunksize=CHUNK_ROWS):
+            writer.write_frame(chunk)
+    except BaseException:
+        # Yarım dosya depoya taşınmaz
+        writer.abort()
+        raise
+    writer.close()
+    return profile
+
+
+def _iter_arrow_batches(raw_path):
+    ext = os.path.splitext(raw_path)[1].lower()
+    if ext in (".parquet", ".pq"):
+        pf = pq.ParquetFile(raw_path)
+        return pf.schema_arrow, pf.iter_batches(batch_size=CHUNK_ROWS)
+    reader = pa.ipc.open_file(pa.memory_map(raw_path))
+    return reader.schema, (reader.get_batch(i) for i in range(reader.num_record_batches))
+
+
+def _ingest_arrow(raw_path, path):
+    # Parquet/Feather zaten tipli; profil geçişinden sonra küçültülmüş
+    # şemayla yazılır (küçültme kapalıysa tek geçiş)
+    schema, batches = _iter_arrow_batches(raw_path)
+    keep = [i for i, name in enumerate(schema.names) if not name.startswith("Unnamed")]
+    schema = pa.schema([schema.field(i) for i in keep]).remove_metadata()
+
+    profile = DatasetProfile()
+    if not DOWNCAST:
+        writer = DatasetWriter(path, schema)
+        try:
+            for batch in batches:
+                batch = batch.select(keep)
+                profile.update(batch.to_pandas())
+                writer.write_batch(batch)
+        except BaseException:
+            writer.abort()
+            raise
+        writer.close()
+        return profile
+
+    for batch in batches:
+        profile.update(batch.select(keep).to_pandas())
+    schema, levels = storage_schema(profile, schema)
+    writer = DatasetWriter(path, schema, levels)
+    try:
+        for batch in _iter_arrow_batches(raw_path)[1]:
+            writer.write_frame(batch.select(keep).to_pandas())
+    except BaseException:
+        writer.abort()
+        raise
+    writer.close()
+    return profile
+
+
+def iter_frames(raw_path, text_columns=()):
+    # Ham dosyayı CHUNK_ROWS satırlık DataFrame parçaları halinde okur
+    ext = os.path.splitext(raw_path)[1].lower()
+    if ext == ".csv":
+        usecols = _csv_columns(raw_path)
+        dtype = {c: str for c in text_columns if c in usecols}
+        yield from pd.read_csv(raw_path, usecols=usecols, dtype=dtype, chunksize=CHUNK_ROWS)
+    elif ext in (".parquet", ".pq", ".feather", ".arrow"):
+        schema, batches = _iter_arrow_batches(raw_path)
+        keep = [i for i, name in enumerate(schema.names) if not name.startswith("Unnamed")]
+        for batch in batches:
+            yield batch.select(keep).to_pandas()
+    else:
+        yield load_frame(raw_path)
+
+
+def iter_dataset(path):
+    # Depodaki veri seti CHUNK_ROWS satırlık DataFrame parçaları halinde;
+    # tablo memory-map ile açıldığından yalnızca o anki parça çözülür
+    if not path.endswith(STORE_SUFFIX):
+        yield from iter_frames(path)
+        return
+    for batch in open_table(path).to_batches(max_chunksize=CHUNK_ROWS):
+        yield batch.to_pandas()
+
+
+def write_frames(frames, folder, name, schema):
+    # Parçaları verilen şemayla depoya yazar; hata olursa yarım dosya bırakmaz
+    path = stored_path(folder, name)
+    profile = DatasetProfile()
+    writer = DatasetWriter(path, schema)
+    try:
+        for frame in frames:
+            profile.update(frame)
+            writer.write_frame(frame)
+    except BaseException:
+        writer.abort()
+        raise
+    writer.close()
+    save_stats(path, profile)
+    return path, profile
+
+
+def ingest_file(raw_path):
+    # Yüklenen ham dosyayı parça parça profiller ve kolonlu depoya yazar;
+    # dosyanın tamamı hiçbir zaman belleğe alınmaz (Excel hariç).
+    folder, name = os.path.split(raw_path)
+    path = stored_path(folder, name)
+    ext = os.path.splitext(name)[1].lower()
+
+    if ext == ".csv":
+        profile = _ingest_csv(raw_path, path)
+    elif ext in (".parquet", ".pq", ".feather", ".arrow"):
+        profile = _ingest_arrow(raw_path, path)
+    else:
+        df = load_frame(raw_path)
+        profile = DatasetProfile()
+        profile.update(df)
+        write_dataset(df, folder, name, profile)
+        os.remove(raw_path)
+        return path, profile
+
+    save_stats(path, profile)
+    os.remove(raw_path)
+    return path, profile
+
+
+# ----------------------------
+# Satır aralığı sorguları
+# ----------------------------
+FILTER_OPS = {
+    "eq": pc.equal,
+    "ne": pc.not_equal,
+    "lt": pc.less,
+    "le": pc.less_equal,
+    "gt": pc.greater,
+    "ge": pc.greater_equal,
+}
+ROW_INDEX_CACHE_SIZE = int(os.environ.get("LEBB_ROW_INDEX_CACHE", "32"))
+
+# (yol, mtime, sıralama, filtreler) -> satır indeksi (np.ndarray)
+_row_indexes = OrderedDict()
+_row_indexes_lock = threading.Lock()
+
+
+def parse_filter(expr):
+    # "kolon:op:değer" ("isnull"/"notnull" için değer yok)
+    parts = expr.split(":", 2)
+    if len(parts) < 2:
+        raise ValueError(f"Geçersiz filtre: {expr}")
+    col, op = parts[0], parts[1]
+    if op not in FILTER_OPS and op not in ("contains", "isnull", "notnull"):
+        raise ValueError(f"Desteklenmeyen filtre operatörü: {op}")
+    if op in FILTER_OPS or op == "contains":
+        if len(parts) < 3:
+            raise ValueError(f"Filtre değeri eksik: {expr}")
+        return (col, op, parts[2])
+    return (col, op, None)
+
+
+def open_table(path):
+    # Sıkıştırmasız depo memory-map ile kopyasız açılır
+    if path.endswith(STORE_SUFFIX):
+        return feather.read_table(path, memory_map=True)
+    return to_arrow_table(read_dataset(path))
+
+
+def _plain(col):
+    if pa.types.is_dictionary(col.type):
+        return col.cast(col.type.value_type)
+    return col
+
+
+def _filter_scalar(value, type_):
+    # Karşılaştırma değeri depo türüne (int8...) değil mantıksal türe
+    # çevrilir; 300 > int8 aralığı bir hata değil, boş sonuçtur
+    target = logical_type(type_)
+    try:
+        return pa.scalar(value).cast(target)
+    except pa.ArrowInvalid:
+        if not pa.types.is_integer(target):
+            raise
+        return pa.scalar(value).cast(pa.float64())
+
+
+def _filter_mask(table, filters):
+    mask = None
+    for col_name, op, value in filters:
+        if col_name not in table.column_names:
+            raise KeyError(col_name)
+        col = _plain(table[col_name])
+        if op == "isnull":
+            m = pc.is_null(col)
+        elif op == "notnull":
+            m = pc.is_valid(col)
+        elif op == "contains":
+            m = pc.match_substring(col.cast(pa.string()), value)
+        else:
+            m = FILTER_OPS[op](col, _filter_scalar(value, col.type))
+        m = pc.fill_null(m, False)
+        mask = m if mask is None else pc.and_(mask, m)
+    return mask
+
+
+def _row_index(path, table, sort, descending, filters):
+    key = (path, os.stat(path).st_mtime_ns, sort, descending, filters)
+    with _row_indexes_lock:
+        index = _row_indexes.get(key)
+        if index is not None:
+            _row_indexes.move_to_end(key)
+            return index
+
+    if sort:
+        if sort not in table.column_names:
+            raise KeyError(sort)
+        order = "descending" if descending else "ascending"
+        column = _plain(table[sort]).combine_chunks()
+        index = pc.array_sort_indices(column, order=order, null_placement="at_end").to_numpy()
+    else:
+        index = np.arange(table.num_rows)
+
+    if filters:
+        mask = _filter_mask(table, filters).to_numpy(zero_copy_only=False)
+        index = index[mask[index]]
+
+    with _row_indexes_lock:
+        _row_indexes[key] = index
+        while len(_row_indexes) > ROW_INDEX_CACHE_SIZE:
+            _row_indexes.popitem(last=False)
+    return index
+
+
+def query_rows(path, offset, limit, columns=None, sort=None, descending=False, filters=()):
+    # Sıralama/filtre indeksi bir kez kurulup önbelleğe alınır; sonraki her
+    # sayfa yalnızca istenen satırları okur.
+    table = open_table(path)
+    if columns:
+        missing = [c for c in columns if c not in table.column_names]
+        if missing:
+            raise KeyError(missing[0])
+
+    filters = tuple(filters)
+    if sort or filters:
+        index = _row_index(path, table, sort, descending, filters)
+        total = len(index)
+        page = table.take(index[offset:offset + limit])
+    else:
+        total = table.num_rows
+        page = table.slice(offset, limit)
+
+    if columns:
+        page = page.select(columns)
+    return total, page.to_pandas()
@@ -0,0 +1,121 @@
+# backend/export.py
+import os
+import tempfile
+import time
+
+from openpyxl import Workbook
+
+from dataset_store import STORE_SUFFIX, dataset_cache, dataset_stats, iter_dataset, open_table
+from serialization import records_json
+from telemetry import record, span
+
+# ----------------------------
+# Ayarlar
+# ----------------------------
+# Dışa aktarım biçimleri: uzantı -> MIME türü. Depodaki biçimle aynı olan
+# istek dosyadan doğrudan (sendfile, Range/ETag) sunulur; diğerleri
+# CHUNK_ROWS satırlık parçalarla dönüştürülür, veri seti belleğe alınmaz.
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "json": "application/json",
+    "ndjson": "application/x-ndjson",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "arrow": "application/vnd.apache.arrow.file",
+}
+# Excel sayfa sınırı (başlık satırı dahil)
+XLSX_MAX_ROWS = 1048576
+
+
+def stored_format(path):
+    # Depo dosyasının dışa aktarım biçimi (.arrow ya da eski ham dosyanın uzantısı)
+    if path.endswith(STORE_SUFFIX):
+        return "arrow"
+    return os.path.splitext(path)[1].lstrip(".").lower()
+
+
+def export_etag(path, fmt):
+    # İçerik özeti + biçim; veri değişmedikçe aynı kalır
+    return f"{dataset_cache.digest(path)[:32]}-{fmt}"
+
+
+# ----------------------------
+# Parçalı dönüştürücüler
+# ----------------------------
+def _timed(chunks, fmt):
+    # Gövde yanıt gönderilirken üretilir; süre akış bitince kaydedilir
+    started = time.perf_counter()
+    try:
+        yield from chunks
+    finally:
+        record("export", time.perf_counter() - started, format=fmt)
+
+
+def _csv_chunks(path):
+    first = True
+    for frame in iter_dataset(path):
+        yield frame.to_csv(index=False, header=first).encode("utf-8")
+        first = False
+    if first:
+        # Boş veri setinde yalnızca başlık
+        yield open_table(path).schema.empty_table().to_pandas().to_csv(index=False).encode("utf-8")
+
+
+def _json_chunks(path):
+    # Tek bir JSON dizisi; parçalar virgülle birleştirilir
+    yield b"["
+    first = True
+    for frame in iter_dataset(path):
+        text = records_json(frame)[1:-1]
+        if text:
+            yield (("" if first else ",") + text).encode("utf-8")
+            first = False
+    yield b"]"
+
+
+def _ndjson_chunks(path):
+    for frame in iter_dataset(path):
+        if len(frame):
+            yield (records_json(frame, lines=True).rstrip("\n") + "\n").encode("utf-8")
+
+
+STREAMERS = {
+    "csv": _csv_chunks,
+    "json": _json_chunks,
+    "ndjson": _ndjson_chunks,
+}
+
+
+def export_stream(path, fmt):
+    return _timed(STREAMERS[fmt](path), fmt)
+
+
+def _rows(frame):
+    # Eksik değerler boş hücre olur
+    cells = frame.astype(object).where(frame.notna(), None)
+    return cells.itertuples(index=False, name=None)
+
+
+def export_xlsx(path):
+    # XLSX bir zip arşivi olduğundan sonu yazılmadan gönderilemez; openpyxl
+    # write-only modunda satırlar geçici dosyaya akar, bellekte tutulmaz.
+    # Dönen dosya diskte adsız geçici dosyadır, kapatılınca silinir.
+    if dataset_stats(path).row_count + 1 > XLSX_MAX_ROWS:
+        raise ValueError(f"Excel en fazla {XLSX_MAX_ROWS - 1} satır destekler; CSV ya da JSON seçin.")
+    with span("export", format="xlsx"):
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet("Sheet1")
+        header = True
+        for frame in iter_dataset(path):
+            if header:
+                sheet.append([str(c) for c in frame.columns])
+                header = False
+            for row in _rows(frame):
+                sheet.append(row)
+        out = tempfile.TemporaryFile()
+        try:
+            workbook.save(out)
+        except BaseException:
+            out.close()
+            raise
+        out.seek(0)
+    return out
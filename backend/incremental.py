@@ -0,0 +1,253 @@
+# backend/incremental.py
+import os
+
+import numpy as np
+import pyarrow.compute as pc
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.linear_model import SGDClassifier, SGDRegressor
+from sklearn.metrics import calinski_harabasz_score, davies_bouldin_score, silhouette_score
+from sklearn.naive_bayes import GaussianNB
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+from aggregation import MAX_POINTS
+from dataset_store import iter_dataset, open_table
+
+# ----------------------------
+# Ayarlar
+# ----------------------------
+# SGD / mini-batch k-means için veri üzerinden geçiş sayısı
+OOC_EPOCHS = int(os.environ.get("LEBB_OOC_EPOCHS", "5"))
+# Grafikler (ROC, scatter) ve kümeleme metrikleri için tutulan en fazla test satırı
+OOC_SAMPLE = int(os.environ.get("LEBB_OOC_SAMPLE", "10000"))
+
+# partial_fit destekleyen tahmin ediciler; kümelemede KMeans mini-batch ile eğitilir
+INCREMENTAL_MAP = {
+    "classification": {"SGD": SGDClassifier, "NaiveBayes": GaussianNB},
+    "regression": {"SGD": SGDRegressor},
+    "clustering": {"KMeans": MiniBatchKMeans},
+}
+
+# Ölçeğe duyarlı; önce StandardScaler.partial_fit ile bir geçiş yapılır
+SCALED = (SGDClassifier, SGDRegressor)
+# Her satırı bir kez görmesi yeterli (tam istatistik)
+SINGLE_PASS = (GaussianNB,)
+
+
+# ----------------------------
+# Yardımcılar
+# ----------------------------
+def holdout_mask(row_ids, test_size, seed=42):
+    # Satır kimliğinin karmasıyla (splitmix64) test ayrımı: parça sırasından
+    # ve parça boyundan bağımsız, her geçişte aynı satırlar test kümesinde
+    with np.errstate(over="ignore"):
+        z = np.asarray(row_ids, dtype=np.uint64) + np.uint64(seed) * np.uint64(0x9E3779B97F4A7C15)
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        z = z ^ (z >> np.uint64(31))
+    return (z % np.uint64(1_000_000)) < np.uint64(round(test_size * 1_000_000))
+
+
+def _chunks(filepath, target=None):
+    # (X, y, satır kimlikleri) parçaları; satır kimliği = depodaki sıra.
+    # Hedefi eksik satırlar ne eğitime ne değerlendirmeye girer; kimlikler
+    # korunduğundan test ayrımı değişmez.
+    start = 0
+    for df in iter_dataset(filepath):
+        row_ids = np.arange(start, start + len(df))
+        start += len(df)
+        if target is None:
+            yield df.select_dtypes(include=["number"]).fillna(0), None, row_ids
+            continue
+        known = df[target].notna().to_numpy()
+        if not known.all():
+            df, row_ids = df[known], row_ids[known]
+        yield df.drop(columns=[target]), df[target].to_numpy(), row_ids
+
+
+def classes_of(filepath, target):
+    # partial_fit ilk çağrıda tüm sınıfları ister; yalnızca hedef kolon okunur
+    values = pc.unique(open_table(filepath).column(target)).drop_null()
+    return np.sort(np.asarray(values.to_pylist()))
+
+
+class _Sample:
+    # İlk k test satırı; test ayrımı karma ile yapıldığından rastgele bir örneklem
+
+    def __init__(self, limit=OOC_SAMPLE):
+        self.limit = limit
+        self.parts = []
+        self.size = 0
+
+    def add(self, *arrays):
+        room = self.limit - self.size
+        if room > 0:
+            self.parts.append(tuple(a[:room] for a in arrays))
+            self.size += min(room, len(arrays[0]))
+
+    def arrays(self):
+        if not self.parts:
+            return None
+        return [np.concatenate(col) for col in zip(*self.parts)]
+
+
+# ----------------------------
+# Eğitim
+# ----------------------------
+def incremental_model(model_type, algo, params, n_jobs=1):
+    ModelClass = INCREMENTAL_MAP.get(model_type, {}).get(algo)
+    if ModelClass is None:
+        raise ValueError(f"{algo} artımlı (out-of-core) eğitimi desteklemiyor.")
+    allowed = ModelClass().get_params()
+    model = ModelClass(**{k: v for k, v in params.items() if k in allowed})
+    if "n_jobs" in allowed and "n_jobs" not in params:
+        model.set_params(n_jobs=n_jobs)
+    return model
+
+
+def fit_incremental(filepath, opts, model, epochs=OOC_EPOCHS, check=None):
+    # Bellekte en fazla bir parça (CHUNK_ROWS satır) tutulur; check verilirse
+    # her geçişten önce çağrılır (ör. iptal denetimi)
+    model_type = opts["model_type"]
+    target = opts["target"] if model_type != "clustering" else None
+    if target is not None and target not in open_table(filepath).column_names:
+        raise KeyError(target)
+    test_size = opts["test_size"] if target is not None else 0.0
+
+    scaler = None
+    if isinstance(model, SCALED):
+        scaler = StandardScaler()
+        for X, _, row_ids in _chunks(filepath, target):
+            train = ~holdout_mask(row_ids, test_size)
+            if train.any():
+                scaler.partial_fit(X[train])
+
+    fit_kwargs = {}
+    if model_type == "classification":
+        fit_kwargs["classes"] = classes_of(filepath, target)
+    if isinstance(model, SINGLE_PASS):
+        epochs = 1
+
+    for _ in range(max(1, epochs)):
+        if check is not None:
+            check()
+        for X, y, row_ids in _chunks(filepath, target):
+            train = ~holdout_mask(row_ids, test_size)
+            if not train.any():
+                continue
+            X_train = X[train]
+            if scaler is not None:
+                X_train = scaler.transform(X_train)
+            if y is None:
+                model.partial_fit(X_train)
+            else:
+                model.partial_fit(X_train, y[train], **fit_kwargs)
+
+    if scaler is not None:
+        model = Pipeline([("scaler", scaler), ("model", model)])
+    return model
+
+
+# ----------------------------
+# Artımlı metrikler (test parçaları üzerinden)
+# ----------------------------
+def evaluate_classification(filepath, opts, model, classes):
+    # Karışıklık matrisi parça parça toplanır; metrikler ondan türetilir
+    cm = np.zeros((len(classes), len(classes)), dtype=np.int64)
+    sample = _Sample()
+    binary = len(classes) == 2 and hasattr(model, "predict_proba")
+    unknown = 0
+    for X, y, row_ids in _chunks(filepath, opts["target"]):
+        test = holdout_mask(row_ids, opts["test_size"])
+        if not test.any():
+            continue
+        y_true, X_test = y[test], X[test]
+        # Modelin sınıfları arasında olmayan etiketler matrise girmez
+        t = np.minimum(np.searchsorted(classes, y_true), len(classes) - 1)
+        known = classes[t] == y_true
+        if not known.all():
+            unknown += int((~known).sum())
+            y_true, X_test, t = y_true[known], X_test[known], t[known]
+            if not len(y_true):
+                continue
+        y_pred = model.predict(X_test)
+        p = np.searchsorted(classes, y_pred)
+        np.add.at(cm, (t, p), 1)
+        if binary:
+            sample.add(y_true, model.predict_proba(X_test)[:, 1])
+
+    support = cm.sum(axis=1)
+    predicted = cm.sum(axis=0)
+    tp = np.diag(cm).astype(float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        precision = np.where(predicted > 0, tp / predicted, 0.0)
+        recall = np.where(support > 0, tp / support, 0.0)
+        f1 = np.where(precision + recall > 0, 2 * precision * recall / (precision + recall), 0.0)
+    total = support.sum()
+    weights = support / total if total else support
+    metrics = {
+        "accuracy": round(float(tp.sum() / total), 4) if total else None,
+        "precision": round(float((precision * weights).sum()), 4),
+        "recall": round(float((recall * weights).sum()), 4),
+        "f1": round(float((f1 * weights).sum()), 4),
+    }
+    if unknown:
+        metrics["info"] = f"Eğitimde görülmeyen etiketli {unknown} test satırı değerlendirmeye alınmadı."
+    return metrics, cm, sample.arrays()
+
+
+def evaluate_regression(filepath, opts, model):
+    # Kareler toplamı ilk değere göre kaydırılarak biriktirilir (sayısal kararlılık)
+    n, sse, sy, syy, shift = 0, 0.0, 0.0, 0.0, None
+    sample = _Sample(MAX_POINTS)
+    for X, y, row_ids in _chunks(filepath, opts["target"]):
+        test = holdout_mask(row_ids, opts["test_size"])
+        if not test.any():
+            continue
+        y_true = y[test].astype("float64")
+        y_pred = model.predict(X[test])
+        if shift is None:
+            shift = float(y_true[0])
+        n += len(y_true)
+        sse += float(((y_true - y_pred) ** 2).sum())
+        sy += float((y_true - shift).sum())
+        syy += float(((y_true - shift) ** 2).sum())
+        sample.add(y_true, y_pred)
+    if n == 0:
+        return {"r2": None, "mse": None, "rmse": None}, None
+    mse = sse / n
+    sst = syy - sy * sy / n
+    return {
+        "r2": round(1 - sse / sst, 4) if sst > 0 else None,
+        "mse": round(mse, 4),
+        "rmse": round(float(np.sqrt(mse)), 4),
+    }, sample.arrays()
+
+
+def evaluate_clustering(filepath, model):
+    # Etiket dağılımı tüm veriden; silhouette vb. örneklem üzerinden
+    counts = {}
+    sample = _Sample()
+    fraction = min(1.0, OOC_SAMPLE / max(open_table(filepath).num_rows, 1))
+    for X, _, row_ids in _chunks(filepath):
+        labels = model.predict(X)
+        ids, c = np.unique(labels, return_counts=True)
+        for k, v in zip(ids.tolist(), c.tolist()):
+            counts[k] = counts.get(k, 0) + v
+        pick = holdout_mask(row_ids, fraction)
+        sample.add(X.to_numpy(dtype="float64")[pick], labels[pick])
+
+    metrics = {
+        "n_clusters": len(counts),
+        "silhouette": None,
+        "calinski_harabasz": None,
+        "davies_bouldin": None,
+        "engine": type(model).__name__,
+    }
+    arrays = sample.arrays()
+    if arrays is not None and len(np.unique(arrays[1])) >= 2:
+        Xs, ys = arrays
+        metrics["silhouette"] = round(float(silhouette_score(Xs, ys)), 4)
+        metrics["calinski_harabasz"] = round(float(calinski_harabasz_score(Xs, ys)), 4)
+        metrics["davies_bouldin"] = round(float(davies_bouldin_score(Xs, ys)), 4)
+    return metrics, counts
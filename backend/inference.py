@@ -0,0 +1,154 @@
+# backend/inference.py
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import GradientBoostingClassifier, RandomForestClassifier
+from sklearn.tree import DecisionTreeClassifier
+
+from model_store import load_model_file, resolve_model
+from telemetry import record
+
+# ----------------------------
+# Ayarlar
+# ----------------------------
+# Bellekte yüklü tutulan en fazla model/pipeline sayısı
+MODEL_CACHE_SIZE = int(os.environ.get("LEBB_MODEL_CACHE", "8"))
+
+# predict() sonucu predict_proba() argmax'ı olan modeller
+PROBA_ARGMAX = (RandomForestClassifier, DecisionTreeClassifier, GradientBoostingClassifier)
+
+
+class ModelRegistry:
+    # Yol + mtime ile anahtarlanan LRU; her istekte joblib.load yapılmaz,
+    # dosya yeniden yazılırsa (yeni eğitim) bir sonraki istekte tazelenir.
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()   # path -> (mtime_ns, obj)
+        self._lock = threading.Lock()
+
+    def get(self, path, loader=joblib.load):
+        path = os.path.abspath(path)
+        mtime = os.stat(path).st_mtime_ns
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == mtime:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return entry[1], True
+            self.misses += 1
+
+        obj = loader(path)
+        with self._lock:
+            self._entries[path] = (mtime, obj)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return obj, False
+
+    def invalidate(self, path):
+        with self._lock:
+            self._entries.pop(os.path.abspath(path), None)
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / total, 4) if total else None,
+            }
+
+
+model_registry = ModelRegistry(MODEL_CACHE_SIZE)
+
+
+def model_path(algo, model_type, version=None):
+    # Sürüm verilmezse son eğitilen; bulunamazsa None
+    return resolve_model(algo, model_type, version)
+
+
+def load_model(path):
+    # Küçük toplu isteklerde iş parçacığı havuzu kurmak tahminden pahalı
+    model = load_model_file(path)
+    if "n_jobs" in getattr(model, "get_params", dict)():
+        model.set_params(n_jobs=1)
+    return model
+
+
+def prepare_features(model, df, plan=None, model_type=None):
+    # Kaydedilmiş ön işleme (satır silmeden) ve modelin eğitimdeki kolonları
+    if plan is not None:
+        if plan.target in plan.input_columns and plan.target not in df.columns:
+            df = df.assign(**{plan.target: np.nan})
+        df = plan.transform(df, drop_rows=False)
+    columns = getattr(model, "feature_names_in_", None)
+    if columns is not None:
+        missing = [c for c in columns if c not in df.columns]
+        if missing:
+            raise KeyError(missing[0])
+        df = df[list(columns)]
+    if model_type == "clustering":
+        # Eğitimdeki gibi: sayısal kolonlar, eksikler 0
+        df = df.select_dtypes(include=["number"]).fillna(0)
+    return df
+
+
+def predict_frame(model, X):
+    if not hasattr(model, "predict"):
+        raise ValueError("Bu model yeni veri için tahmin desteklemiyor.")
+    if isinstance(model, PROBA_ARGMAX):
+        # predict() bu modellerde zaten argmax(predict_proba); ağaçlar bir kez gezilir
+        probabilities = model.predict_proba(X)
+        return model.classes_.take(probabilities.argmax(axis=1)), probabilities, model.classes_
+    predictions = model.predict(X)
+    probabilities, classes = None, None
+    if hasattr(model, "predict_proba"):
+        try:
+            probabilities = model.predict_proba(X)
+            classes = getattr(model, "classes_", None)
+        except Exception:
+            probabilities = None
+    return predictions, probabilities, classes
+
+
+class Timer:
+    # İstek içi aşama süreleri (ms)
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self._last = self.start
+        self.spans = {}
+
+    def mark(self, name):
+        # Aynı aşama birden çok kez işaretlenirse (parça parça) süreler toplanır
+        now = time.perf_counter()
+        self.spans[name] = self.spans.get(name, 0.0) + (now - self._last) * 1000
+        record(f"predict_{name}", now - self._last)
+        self._last = now
+
+    def result(self):
+        spans = {k: round(v, 3) for k, v in self.spans.items()}
+        return dict(spans, total=round((time.perf_counter() - self.start) * 1000, 3))
+
+
+def rows_frame(payload):
+    # {"rows": [{...}, ...]} satır bazlı ya da {"columns": {"a": [...]}} kolon bazlı
+    if "columns" in payload:
+        return pd.DataFrame(payload["columns"])
+    rows = payload.get("rows")
+    if not isinstance(rows, list) or not rows:
+        raise ValueError("Tahmin için 'rows' ya da 'columns' gerekli.")
+    return pd.DataFrame.from_records(rows)
@@ -0,0 +1,384 @@
+# backend/jobs.py
+import json
+import math
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import CancelledError, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+
+from threadpoolctl import threadpool_limits
+from werkzeug.exceptions import TooManyRequests
+
+from config import JOB_FOLDER
+from dataset_store import dataset_cache
+from telemetry import merge, record
+from training import TrainingError, compare_models, train_algorithm
+from tuning import candidates, evaluate_config, rung_rows, train_rows
+
+# ----------------------------
+# Ayarlar
+# ----------------------------
+# Eğitimin toplamda kullanabileceği çekirdek sayısı
+CPU_BUDGET = int(os.environ.get("LEBB_CPU_BUDGET", str(os.cpu_count() or 1)))
+# Havuzdaki işçi süreç sayısı; 0 ise eğitim süreç içinde sırayla çalışır
+TRAIN_WORKERS = int(os.environ.get("LEBB_TRAIN_WORKERS", str(max(1, CPU_BUDGET // 2))))
+# Biten işlerin durum bilgisi bu süre (sn) boyunca tutulur
+JOB_TTL = int(os.environ.get("LEBB_JOB_TTL", "3600"))
+# Aynı anda kabul edilen (bekleyen + çalışan) en fazla iş; dolarsa yeni
+# istekler 429 + Retry-After ile geri çevrilir. 0 ise sınır yok.
+MAX_PENDING_JOBS = int(os.environ.get("LEBB_MAX_PENDING_JOBS", str(max(TRAIN_WORKERS, 1) * 2)))
+# Henüz biten iş yokken önerilen bekleme süresi (sn)
+RETRY_AFTER = int(os.environ.get("LEBB_RETRY_AFTER", "10"))
+
+
+def threads_per_task(workers=TRAIN_WORKERS, budget=CPU_BUDGET):
+    # Her görev bütçenin eşit payını alır: işçi x pay <= bütçe
+    return max(1, budget // max(workers, 1))
+
+
+def _init_worker(n_threads):
+    # BLAS/OpenMP iş parçacıkları da görev payıyla sınırlanır
+    threadpool_limits(limits=n_threads)
+
+
+class PoolSaturated(TooManyRequests):
+    description = "Eğitim havuzu dolu, lütfen daha sonra tekrar deneyin."
+
+
+def snapshot_path(job_id):
+    return os.path.join(JOB_FOLDER, f"{job_id}.json")
+
+
+def cancel_flag_path(job_id):
+    # İşçi süreçleri iptali bu dosyanın varlığından anlar
+    return os.path.join(JOB_FOLDER, f"{job_id}.cancel")
+
+
+def read_snapshot(job_id):
+    # Başka bir sunucu sürecinde çalışan/bitmiş işin son durumu
+    if not job_id.isalnum():
+        return None
+    try:
+        with open(snapshot_path(job_id), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+# ----------------------------
+# Eğitim işi
+# ----------------------------
+class Job:
+
+    def __init__(self, opts, tune=False):
+        self.id = uuid.uuid4().hex
+        self.opts = opts
+        self.tune = tune
+        self.leaderboard = {}
+        self.best_params = {}
+        self.status = "queued"
+        self.created_at = time.time()
+        self.finished_at = None
+        self.total = len(opts["algorithms"])
+        self.done = 0
+        self.results = {}
+        self.timings = []
+        self.comparison_plot = None
+        self.metrics_table = None
+        self.error = None
+        self.error_status = None
+        self.cancel_event = threading.Event()
+        self.finished_event = threading.Event()
+        self.futures = {}
+
+    @property
+    def finished(self):
+        return self.status in ("done", "failed", "cancelled")
+
+    def wait(self, timeout=None):
+        return self.finished_event.wait(timeout)
+
+    def ordered_results(self):
+        return [self.results[a] for a in self.opts["algorithms"] if a in self.results]
+
+    def train_opts(self, algo):
+        # Arama sonrası eğitimde algoritmanın en iyi parametreleri kullanılır
+        if algo not in self.best_params:
+            return self.opts
+        return dict(self.opts, params=dict(self.opts["params"], **{algo: self.best_params[algo]}))
+
+    def record(self, algo, params, rows, rung, outcome):
+        # Aday başına en son (en büyük veriyle) değerlendirme tutulur
+        key = (algo, json.dumps(params, sort_keys=True, default=str))
+        self.leaderboard[key] = {
+            "algorithm": algo, "params": params, "rows": rows, "rung": rung,
+            "score": outcome["score"], "fitSeconds": outcome["fit_seconds"], "error": outcome["error"],
+        }
+
+    def ranking(self):
+        # Önce en çok veriyle denenenler, sonra skor; hatalı adaylar sonda
+        entries = list(self.leaderboard.values())
+        return sorted(entries, key=lambda e: (e["score"] is not None, e["rows"], e["score"] or 0), reverse=True)
+
+    def result(self):
+        result = {
+            "results": self.ordered_results(),
+            "comparison_plot": self.comparison_plot,
+            "metrics_table": self.metrics_table
+        }
+        if self.tune:
+            result["leaderboard"] = self.ranking()
+        return result
+
+    def save(self):
+        # Durum diske de yazılır; çok süreçli sunucuda iş başka bir web
+        # işçisinden de sorgulanabilir
+        path = snapshot_path(self.id)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, default=str)
+        os.replace(tmp, path)
+
+    def to_dict(self):
+        futures = dict(self.futures)
+        running = list(dict.fromkeys(algo for f, algo in futures.items() if f.running()))
+        status = self.status
+        if status == "queued" and running:
+            status = "running"
+        return {
+            "job_id": self.id,
+            "status": status,
+            "progress": {"done": self.done, "total": self.total, "running": running},
+            "error": self.error,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+            **self.result(),
+        }
+
+
+class JobManager:
+    # Bir işin algoritmaları sınırlı işlem havuzuna aynı anda gönderilir;
+    # koordinatör iş parçacığı biten her algoritmayla ilerlemeyi günceller.
+
+    def __init__(self, workers=TRAIN_WORKERS, budget=CPU_BUDGET):
+        self.workers = workers
+        self.n_jobs = threads_per_task(workers, budget)
+        self.max_pending = MAX_PENDING_JOBS
+        self._executor = None
+        self._jobs = {}
+        self._durations = []    # son biten işlerin süreleri (sn)
+        self._lock = threading.Lock()
+
+    def _pool(self):
+        with self._lock:
+            if self._executor is None:
+                if self.workers == 0:
+                    self._executor = ThreadPoolExecutor(max_workers=1)
+                else:
+                    # Çok iş parçacıklı sunucuda fork güvenli değil
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=_init_worker,
+                        initargs=(self.n_jobs,),
+                    )
+            return self._executor
+
+    def submit(self, filepath, opts, tune=False):
+        # Özet bir kez burada hesaplanır; işçiler model sürümü için yeniden okumaz
+        job = Job(dict(opts, n_jobs=self.n_jobs, dataset_digest=dataset_cache.digest(filepath)), tune)
+        job.opts["cancel_flag"] = cancel_flag_path(job.id)
+        with self._lock:
+            self._purge()
+            pending = sum(not j.finished for j in self._jobs.values())
+            if self.max_pending and pending >= self.max_pending:
+                raise PoolSaturated(retry_after=self._retry_after(pending))
+            self._jobs[job.id] = job
+        job.save()
+        search = self._search if tune else None
+        threading.Thread(target=self._run, args=(job, filepath, search), daemon=True).start()
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id):
+        # Bekleyen görevler hemen iptal edilir; çalışanlar bir sonraki
+        # aşamada (kat, tur, geçiş) bayrağı görüp durur. O zamana kadar iş
+        # "cancelling" görünür ve havuzdaki yerini tutmaya devam eder;
+        # koordinatör görevler bitince "cancelled" olarak kapatır.
+        job = self.get(job_id)
+        if job is None:
+            return None
+        with self._lock:
+            if job.finished or job.cancel_event.is_set():
+                return job
+            with open(cancel_flag_path(job.id), "w"):
+                pass
+            job.cancel_event.set()
+            job.status = "cancelling"
+        for future in list(job.futures):
+            future.cancel()
+        job.save()
+        return job
+
+    def _retry_after(self, pending):
+        # Sıradaki işlerin havuzdan çıkması için tahmini süre
+        if not self._durations:
+            return RETRY_AFTER
+        mean = sum(self._durations) / len(self._durations)
+        waves = math.ceil((pending - self.max_pending + 1) / max(self.workers, 1))
+        return min(max(math.ceil(mean * waves), 1), 300)
+
+    def _purge(self):
+        now = time.time()
+        for job_id, job in list(self._jobs.items()):
+            if job.finished and now - job.finished_at > JOB_TTL:
+                del self._jobs[job_id]
+        for name in os.listdir(JOB_FOLDER):
+            path = os.path.join(JOB_FOLDER, name)
+            try:
+                if name.endswith((".json", ".cancel")) and now - os.path.getmtime(path) > JOB_TTL:
+                    os.remove(path)
+            except OSError:
+                pass
+
+    def _run(self, job, filepath, search=None):
+        pool = self._pool()
+        try:
+            if search is not None:
+                search(job, filepath, pool)
+                if job.cancel_event.is_set():
+                    return
+            self._train(job, filepath, pool)
+            if job.cancel_event.is_set():
+                return
+            job.status = "done"
+        except CancelledError:
+            return
+        except TrainingError as e:
+            job.error = e.message
+            job.error_status = e.status
+            job.status = "failed"
+        except Exception as e:
+            job.error = str(e)
+            job.error_status = 500
+            job.status = "failed"
+        finally:
+            # Hata/iptal durumunda kalan algoritmalar havuzu meşgul etmesin;
+            # çalışmakta olanların çıkması beklenir (iptalde bayrağı görürler)
+            for future in list(job.futures):
+                future.cancel()
+            wait(list(job.futures))
+            job.futures = {}
+            with self._lock:
+                # İptal edilen iş, sonradan biten/hata veren görevlerle ezilmez
+                if job.cancel_event.is_set():
+                    job.status = "cancelled"
+                job.finished_at = time.time()
+                if job.status == "done":
+                    self._durations = (self._durations + [job.finished_at - job.created_at])[-20:]
+            if job.cancel_event.is_set():
+                try:
+                    os.remove(cancel_flag_path(job.id))
+                except OSError:
+                    pass
+            job.save()
+            job.finished_event.set()
+
+    def _train(self, job, filepath, pool):
+        opts = job.opts
+        if job.cancel_event.is_set():
+            return
+        job.futures = {
+            pool.submit(train_algorithm, filepath, job.train_opts(algo), algo): algo
+            for algo in opts["algorithms"]
+        }
+        for future in as_completed(job.futures):
+            if job.cancel_event.is_set():
+                return
+            result = future.result()
+            job.status = "running"
+            job.done += 1
+            algo = job.futures[future]
+            if result is not None:
+                # İşçide ölçülen aşama süreleri bu sürecin metriklerine eklenir
+                timings = result.pop("timings", [])
+                merge(timings)
+                job.timings.extend(timings)
+                if algo in job.best_params:
+                    result = dict(result, bestParams=job.best_params[algo])
+                job.results[algo] = result
+            job.save()
+
+        summary = {r["algorithm"]: r["metrics"] for r in job.ordered_results()}
+        future = pool.submit(compare_models, opts["model_type"], summary)
+        job.futures = {future: None}
+        job.comparison_plot, job.metrics_table = future.result()
+
+    def _search(self, job, filepath, pool):
+        # Ardışık yarılama: tüm adaylar küçük alt örnekte denenir, her turda
+        # en iyi 1/ETA'sı ETA kat veriyle devam eder. Algoritmalar aynı turda
+        # birlikte havuza gönderilir; sıralama her sonuçla güncellenir.
+        opts = job.opts
+        eta = opts["eta"]
+        deadline = job.created_at + opts["budget"]
+        n_train = train_rows(filepath, opts["test_size"])
+        survivors = {algo: candidates(opts, algo) for algo in opts["algorithms"]}
+        ladders = {algo: rung_rows(n_train, len(c), eta) for algo, c in survivors.items()}
+        job.total = len(opts["algorithms"]) + sum(
+            math.ceil(len(survivors[algo]) / eta ** r) for algo in survivors for r in range(len(ladders[algo]))
+        )
+
+        rung = 0
+        while time.time() < deadline and not job.cancel_event.is_set():
+            active = {algo: c for algo, c in survivors.items() if rung < len(ladders[algo])}
+            if not active:
+                break
+            tasks = {
+                pool.submit(evaluate_config, filepath, opts, algo, params, ladders[algo][rung]): (algo, i)
+                for algo, configs in active.items() for i, params in enumerate(configs)
+            }
+            job.futures = {future: algo for future, (algo, _) in tasks.items()}
+            scores = {algo: {} for algo in active}
+            for future in as_completed(tasks):
+                if job.cancel_event.is_set():
+                    return
+                algo, i = tasks[future]
+                outcome = future.result()
+                job.status = "running"
+                job.done += 1
+                job.record(algo, active[algo][i], ladders[algo][rung], rung, outcome)
+                record("tune_fit", outcome["fit_seconds"], algorithm=algo, rung=rung)
+                if outcome["score"] is not None:
+                    scores[algo][i] = outcome["score"]
+                if time.time() >= deadline:
+                    # Bütçe doldu: bekleyen adaylar iptal, eldeki sıralama kullanılır
+                    for pending in tasks:
+                        pending.cancel()
+                    break
+
+            for algo, configs in active.items():
+                ranked = sorted(scores[algo], key=scores[algo].get, reverse=True)
+                if not ranked:
+                    if rung == 0:
+                        raise TrainingError(f"{algo} için geçerli parametre kombinasyonu bulunamadı.")
+                    continue
+                keep = max(1, math.ceil(len(configs) / eta))
+                survivors[algo] = [configs[i] for i in ranked[:keep]]
+            job.save()
+            rung += 1
+
+        job.best_params = {algo: configs[0] for algo, configs in survivors.items()}
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+job_manager = JobManager()
@@ -0,0 +1,205 @@
+# backend/model_store.py
+import hashlib
+import json
+import os
+import threading
+import time
+
+import joblib
+import sklearn
+
+from config import MODEL_FOLDER
+
+# ----------------------------
+# Ayarlar
+# ----------------------------
+# joblib sıkıştırma seviyesi (0-9). 0 dışındaki değerlerde model dosyası
+# küçülür ama memory-map ile açılamaz.
+MODEL_COMPRESS = int(os.environ.get("LEBB_MODEL_COMPRESS", "0"))
+# Sıkıştırmasız modellerdeki büyük diziler (ağaçlar, KNN eğitim verisi)
+# memory-map ile açılır; aynı dosyayı açan işçiler tek kopyayı paylaşır.
+MODEL_MMAP = os.environ.get("LEBB_MODEL_MMAP", "1") != "0"
+# Model deposu için disk bütçesi (MB); aşılırsa en uzun süredir
+# kullanılmayan sürümler silinir (her algoritmanın son sürümü korunur)
+MODEL_STORE_MB = int(os.environ.get("LEBB_MODEL_STORE_MB", "1024"))
+
+STORE_FOLDER = os.path.join(MODEL_FOLDER, "store")
+
+_store_lock = threading.Lock()
+
+
+# ----------------------------
+# Sürüm kimliği ve yollar
+# ----------------------------
+def model_version(dataset_digest, model_type, algo, params, training=None):
+    # (veri seti özeti, model türü, algoritma, çözümlenmiş parametreler,
+    # eğitim ayarları) -> sabit sürüm kimliği
+    key = {
+        "dataset": dataset_digest,
+        "model_type": model_type,
+        "algorithm": algo,
+        "params": params,
+        "training": training or {},
+    }
+    payload = json.dumps(key, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def _algo_folder(algo, model_type):
+    return os.path.join(STORE_FOLDER, model_type, algo)
+
+
+def version_path(algo, model_type, version):
+    return os.path.join(_algo_folder(algo, model_type), f"{version}.joblib")
+
+
+def meta_path(path):
+    return os.path.splitext(path)[0] + ".json"
+
+
+def legacy_path(algo, model_type):
+    return os.path.join(MODEL_FOLDER, f"{algo}_{model_type}.pkl")
+
+
+def _write_json(path, data):
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(data, f, default=str)
+    os.replace(tmp, path)
+
+
+def read_meta(path):
+    try:
+        with open(meta_path(path)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+# ----------------------------
+# Kaydetme / bulma / yükleme
+# ----------------------------
+def save_model(model, algo, model_type, version, metadata=None, compress=MODEL_COMPRESS):
+    folder = _algo_folder(algo, model_type)
+    os.makedirs(folder, exist_ok=True)
+    path = version_path(algo, model_type, version)
+
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        joblib.dump(model, tmp, compress=compress)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+    meta = dict(metadata or {})
+    meta.update({
+        "version": version,
+        "algorithm": algo,
+        "model_type": model_type,
+        "created_at": time.time(),
+        "size_bytes": os.path.getsize(path),
+        "compress": compress,
+        "sklearn_version": sklearn.__version__,
+    })
+    _write_json(meta_path(path), meta)
+    _set_latest(algo, model_type, version)
+    _prune()
+    return meta
+
+
+def _set_latest(algo, model_type, version):
+    # Son eğitilen sürüm; sürüm verilmeyen indirme/tahmin istekleri bunu kullanır
+    with _store_lock:
+        _write_json(os.path.join(_algo_folder(algo, model_type), "latest.json"), {"version": version})
+
+
+def cached_result(algo, model_type, version):
+    # Aynı anahtarla daha önce eğitilmiş sürümün kayıtlı sonucu; model
+    # dosyası silinmişse (bütçe) None
+    path = version_path(algo, model_type, version)
+    meta = read_meta(path)
+    if meta is None or "result" not in meta or not os.path.exists(path):
+        return None
+    try:
+        # Kullanım zamanı: bütçe budamasında en son kullanılanlar kalır
+        os.utime(meta_path(path))
+    except FileNotFoundError:
+        return None
+    _set_latest(algo, model_type, version)
+    return meta["result"]
+
+
+def _prune():
+    budget = MODEL_STORE_MB * 1024 * 1024
+    with _store_lock:
+        entries, total = [], 0
+        for folder, _, names in os.walk(STORE_FOLDER):
+            try:
+                with open(os.path.join(folder, "latest.json")) as f:
+                    latest = json.load(f).get("version")
+            except (OSError, ValueError):
+                latest = None
+            for name in names:
+                if not name.endswith(".joblib"):
+                    continue
+                path = os.path.join(folder, name)
+                try:
+                    size = os.path.getsize(path)
+                    used = os.stat(meta_path(path)).st_mtime
+                except FileNotFoundError:
+                    continue
+                total += size
+                if name[:-len(".joblib")] != latest:
+                    entries.append((used, size, path))
+        for _, size, path in sorted(entries):
+            if total <= budget:
+                break
+            for p in (meta_path(path), path):
+                try:
+                    os.remove(p)
+                except FileNotFoundError:
+                    pass
+            total -= size
+
+
+def resolve_model(algo, model_type, version=None):
+    # Sürüm verilmezse en son eğitilen; depoda yoksa eski tek dosya düzeni
+    if version is None:
+        try:
+            with open(os.path.join(_algo_folder(algo, model_type), "latest.json")) as f:
+                version = json.load(f)["version"]
+        except (OSError, ValueError, KeyError):
+            path = legacy_path(algo, model_type)
+            return path if os.path.exists(path) else None
+    if not all(c in "0123456789abcdef" for c in version):
+        return None
+    path = version_path(algo, model_type, version)
+    return path if os.path.exists(path) else None
+
+
+def list_models(algo=None, model_type=None):
+    models = []
+    if not os.path.isdir(STORE_FOLDER):
+        return models
+    for mt in os.listdir(STORE_FOLDER):
+        if model_type and mt != model_type:
+            continue
+        for al in os.listdir(os.path.join(STORE_FOLDER, mt)):
+            if algo and al != algo:
+                continue
+            folder = os.path.join(STORE_FOLDER, mt, al)
+            for name in os.listdir(folder):
+                if name.endswith(".joblib"):
+                    meta = read_meta(os.path.join(folder, name))
+                    if meta is not None:
+                        models.append(meta)
+    return sorted(models, key=lambda m: m.get("created_at", 0), reverse=True)
+
+
+def load_model_file(path):
+    # Sıkıştırmasız sürümler memory-map ile açılır (salt okunur)
+    meta = read_meta(path)
+    mmap = MODEL_MMAP and meta is not None and meta.get("compress", 0) == 0
+    return joblib.load(path, mmap_mode="r" if mmap else None)
@@ -0,0 +1,315 @@
+# backend/plots.py
+import matplotlib
+matplotlib.use('Agg')
+
+import hashlib
+import io
+import json
+import os
+import re
+import threading
+
+import matplotlib.pyplot as plt
+from matplotlib.colors import LogNorm
+import numpy as np
+import pandas as pd
+import seaborn as sns
+
+from aggregation import chart_data
+from config import PLOT_FOLDER
+from dataset_store import dataset_cache, dataset_stats
+from telemetry import span
+
+# ----------------------------
+# Ayarlar
+# ----------------------------
+# Render edilmiş görseller ve grafik tanımları için disk bütçesi (MB)
+PLOT_CACHE_MB = int(os.environ.get("LEBB_PLOT_CACHE_MB", "256"))
+
+PLOT_FORMATS = {"png": "image/png", "svg": "image/svg+xml"}
+PLOT_ID_RE = re.compile(r"^[0-9a-f]{40}$")
+
+CHART_TYPES = ("histogram", "bar", "scatter", "box", "pie", "line", "heatmap", "violin", "count", "kde")
+XY_CHART_TYPES = ("scatter", "box", "line", "violin")
+
+# pyplot durum makinesi iş parçacığı güvenli değil
+_render_lock = threading.Lock()
+
+
+# ----------------------------
+# Yardımcılar
+# ----------------------------
+def _json_default(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+def plot_id(spec):
+    payload = json.dumps(spec, sort_keys=True, default=_json_default)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def _spec_path(pid):
+    return os.path.join(PLOT_FOLDER, f"{pid}.json")
+
+
+def _image_path(pid, fmt):
+    return os.path.join(PLOT_FOLDER, f"{pid}.{fmt}")
+
+
+def _write_atomic(path, data, mode="w"):
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, mode) as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _prune():
+    # Bütçe aşılırsa en eski dosyalar silinir
+    entries = []
+    for name in os.listdir(PLOT_FOLDER):
+        path = os.path.join(PLOT_FOLDER, name)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            continue
+        entries.append((st.st_mtime, st.st_size, path))
+    total = sum(e[1] for e in entries)
+    budget = PLOT_CACHE_MB * 1024 * 1024
+    for _, size, path in sorted(entries):
+        if total <= budget:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+
+
+# ----------------------------
+# Kayıt: grafik tanımı -> kimlik
+# ----------------------------
+def register(kind, data=None, **options):
+    # Grafik render edilmez; yalnızca tanımı kaydedilir. Görsel ilk kez
+    # /plots/<id>.<format> istendiğinde üretilir.
+    spec = {"kind": kind, "data": data, "options": options}
+    pid = plot_id(spec)
+    path = _spec_path(pid)
+    if not os.path.exists(path):
+        _write_atomic(path, json.dumps(spec, default=_json_default))
+    return {"id": pid, "url": f"/plots/{pid}.png", "kind": kind, "data": data}
+
+
+def load_spec(pid):
+    if not PLOT_ID_RE.match(pid):
+        raise KeyError(pid)
+    try:
+        with open(_spec_path(pid)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        raise KeyError(pid)
+
+
+def render_plot(pid, fmt="png"):
+    # Önbellekte varsa doğrudan dosya yolu döner
+    path = _image_path(pid, fmt)
+    if os.path.exists(path):
+        return path
+
+    spec = load_spec(pid)
+    renderer = RENDERERS[spec["kind"]]
+    with _render_lock, span("render", kind=spec["kind"], format=fmt):
+        try:
+            renderer(spec.get("data"), **spec.get("options", {}))
+            buf = _savefig(fmt, spec.get("options", {}).get("bbox"))
+        finally:
+            plt.close("all")
+    _write_atomic(path, buf, mode="wb")
+    _prune()
+    return path
+
+
+def _savefig(fmt, bbox=None):
+    buf = io.BytesIO()
+    if bbox:
+        plt.savefig(buf, format=fmt, bbox_inches=bbox)
+    else:
+        plt.tight_layout()
+        plt.savefig(buf, format=fmt)
+    return buf.getvalue()
+
+
+# ----------------------------
+# Veri seti grafikleri (/visualize)
+# ----------------------------
+def register_dataset_chart(path, df, chart_type, x_col, y_col=None):
+    # Grafik tam veriden değil, nokta bütçesiyle sınırlı özetten çizilir;
+    # aynı özet istemciye de döner.
+    # Korelasyon matrisi istatistik indeksinden gelir
+    stats = dataset_stats(path) if chart_type == "heatmap" else None
+    data = chart_data(df, chart_type, x_col, y_col, stats)
+    ref = register(
+        "dataset", data,
+        path=os.path.abspath(path), digest=dataset_cache.digest(path),
+        chart_type=chart_type, x=x_col, y=y_col,
+    )
+    ref["chartType"] = chart_type
+    return ref
+
+
+def _render_bars(labels, counts, x_label):
+    sns.barplot(x=labels, y=counts, color="C0")
+    plt.xlabel(x_label)
+    plt.ylabel("count")
+    if len(labels) > 10:
+        plt.xticks(rotation=90)
+
+
+def _render_dataset(data, chart_type, x, y=None, **_):
+    plt.figure(figsize=(7, 5))
+
+    if chart_type in ("histogram", "kde") and "labels" in data:
+        _render_bars(data["labels"], data["counts"], x)
+
+    elif chart_type == "histogram":
+        plt.stairs(data["counts"], data["edges"], fill=True, alpha=0.5)
+        plt.stairs(data["counts"], data["edges"], color="C0")
+        if "kde" in data:
+            plt.plot(data["kde"]["x"], data["kde"]["y"], color="C0")
+        plt.xlabel(x)
+        plt.ylabel("Count")
+
+    elif chart_type in ("bar", "count"):
+        _render_bars(data["labels"], data["counts"], x)
+
+    elif chart_type == "scatter" and data["mode"] == "density":
+        counts = np.array(data["counts"], dtype=float).T
+        plt.pcolormesh(
+            data["xEdges"], data["yEdges"], np.ma.masked_equal(counts, 0),
+            norm=LogNorm(), cmap="viridis"
+        )
+        plt.colorbar(label="count")
+        plt.xlabel(x)
+        plt.ylabel(y)
+
+    elif chart_type == "scatter":
+        sns.scatterplot(x=data["x"], y=data["y"])
+        plt.xlabel(x)
+        plt.ylabel(y)
+
+    elif chart_type == "box":
+        ax = plt.gca()
+        ax.bxp(data["groups"], showfliers=True)
+        plt.xlabel(x)
+        plt.ylabel(y)
+
+    elif chart_type == "pie":
+        labels, counts = list(data["labels"]), list(data["counts"])
+        if data.get("other"):
+            labels.append("Diğer")
+            counts.append(data["other"])
+        plt.pie(counts, labels=labels, autopct="%1.1f%%")
+        plt.axis("equal")
+
+    elif chart_type == "line":
+        xs = pd.to_datetime(data["x"]) if data.get("xType") == "datetime" else data["x"]
+        plt.plot(xs, data["y"])
+        plt.xlabel(x)
+        plt.ylabel(y)
+
+    elif chart_type == "heatmap":
+        corr = pd.DataFrame(data["matrix"], index=data["columns"], columns=data["columns"])
+        sns.heatmap(corr, annot=len(corr) <= 20, cmap="coolwarm")
+
+    elif chart_type == "violin":
+        ax = plt.gca()
+        for i, g in enumerate(data["groups"], start=1):
+            width = np.array(g["density"]) * 0.4
+            ax.fill_betweenx(g["y"], i - width, i + width, alpha=0.6, color="C0")
+            ax.vlines(i, g["q1"], g["q3"], color="k", linewidth=4)
+            ax.vlines(i, g["whislo"], g["whishi"], color="k", linewidth=1)
+            ax.plot(i, g["med"], "o", color="w")
+        ax.set_xticks(range(1, len(data["groups"]) + 1), [g["label"] for g in data["groups"]])
+        plt.xlabel(x)
+        plt.ylabel(y)
+
+    elif chart_type == "kde":
+        plt.fill_between(data["x"], data["y"], alpha=0.5)
+        plt.plot(data["x"], data["y"])
+        plt.xlabel(x)
+        plt.ylabel("Density")
+
+
+# ----------------------------
+# Model grafikleri
+# ----------------------------
+def _render_confusion_matrix(data, **_):
+    plt.figure(figsize=(5, 4))
+    sns.heatmap(np.array(data["matrix"]), annot=True, fmt="d", cmap="Blues")
+    plt.title("Confusion Matrix")
+
+
+def _render_roc_curve(data, **_):
+    plt.figure(figsize=(5, 4))
+    plt.plot(data["fpr"], data["tpr"], label=f"AUC = {data['auc']:.2f}")
+    plt.plot([0, 1], [0, 1], 'k--')
+    plt.xlabel("False Positive Rate")
+    plt.ylabel("True Positive Rate")
+    plt.title("ROC Curve")
+    plt.legend(loc="lower right")
+
+
+def _render_regression_scatter(data, **_):
+    plt.figure(figsize=(5, 4))
+    sns.scatterplot(x=data["y_true"], y=data["y_pred"])
+    plt.xlabel("Gerçek Değerler")
+    plt.ylabel("Tahmin Edilen Değerler")
+    plt.title("Gerçek vs Tahmin")
+
+
+def _render_feature_importance(data, **_):
+    plt.figure()
+    sns.barplot(x=data["importances"], y=data["features"])
+    plt.title("Özellik Önemi")
+
+
+def _render_cluster_counts(data, **_):
+    plt.figure(figsize=(6, 5))
+    sns.barplot(x=[str(label) for label in data["labels"]], y=data["counts"], color="C0")
+    plt.xlabel("cluster")
+    plt.title("Küme Dağılımı")
+
+
+def _render_model_comparison(data, **_):
+    plt.figure(figsize=(10, 5))
+    sns.barplot(x=data["algorithms"], y=data["values"])
+    plt.ylabel(data["metric"])
+    plt.title("Model Başarı Karşılaştırması")
+
+
+def _render_metrics_table(data, **_):
+    fig, ax = plt.subplots(figsize=(10, 4))
+    ax.axis("off")
+    tbl = ax.table(
+        cellText=(np.array(data["values"], dtype=float) * 100).round(2),
+        colLabels=data["columns"],
+        rowLabels=data["algorithms"],
+        cellLoc='center',
+        loc='center'
+    )
+    tbl.scale(1, 2)
+
+
+RENDERERS = {
+    "dataset": _render_dataset,
+    "confusion_matrix": _render_confusion_matrix,
+    "roc_curve": _render_roc_curve,
+    "regression_scatter": _render_regression_scatter,
+    "feature_importance": _render_feature_importance,
+    "cluster_counts": _render_cluster_counts,
+    "model_comparison": _render_model_comparison,
+    "metrics_table": _render_metrics_table,
+}
@@ -0,0 +1,270 @@
+# backend/preprocessing.py
+import os
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from config import MODEL_FOLDER
+from telemetry import span
+
+# /preprocess seçenekleri bu sırayla uygulanır
+STEPS = (
+    "fillMissing", "encodeCategorical", "standardize", "normalize", "removeOutliers",
+    "convertDtype", "selectColumns", "labelEncode", "oneHotEncode", "renameColumns",
+)
+
+
+# ----------------------------
+# Yardımcılar
+# ----------------------------
+def numeric_columns(df, exclude=None):
+    return [c for c in df.select_dtypes(include=["number"]).columns if c != exclude]
+
+
+def text_columns(df):
+    # Depoda az değerli metin kolonları kategori olarak saklanır
+    return list(df.select_dtypes(include=["object", "category"]).columns)
+
+
+def _as_strings(s):
+    # LabelEncoder().fit_transform(s.astype(str)) ile aynı: eksikler "nan" olur
+    return s.astype(object).where(s.notna(), "nan").astype(str)
+
+
+def label_codes(s, classes=None):
+    # Fit sırasında görülmemiş değerler -1 alır
+    strings = _as_strings(s)
+    if classes is None:
+        classes = np.unique(strings.to_numpy())
+    return pd.Categorical(strings, categories=classes).codes.astype("int64"), classes
+
+
+def outlier_bounds(df, cols):
+    # Tüm kolonların çeyrekleri tek seferde, aynı (süzülmemiş) veri üzerinde
+    q = df[cols].quantile([0.25, 0.75])
+    iqr = q.loc[0.75] - q.loc[0.25]
+    return q.loc[0.25] - 1.5 * iqr, q.loc[0.75] + 1.5 * iqr
+
+
+def outlier_mask(df, lower, upper):
+    # Tek birleşik maske; kolon başına yalnızca geçici bir bool dizi üretilir
+    keep = np.ones(len(df), dtype=bool)
+    flagged = {}
+    for col in lower.index:
+        values = df[col].to_numpy(dtype="float64", na_value=np.nan)
+        ok = (values >= lower[col]) & (values <= upper[col])
+        flagged[col] = int(len(ok) - ok.sum())
+        keep &= ok
+    return keep, flagged
+
+
+# ----------------------------
+# Ön işleme planı
+# ----------------------------
+class PreprocessPlan:
+    # Seçenekler tek bir yürütme planına derlenir. Adımlar kolon kolon
+    # çalışır: DataFrame yüzeysel kopyalanır ve yalnızca dönüştürülen
+    # kolonlar için yeni dizi ayrılır; satır süzme tek maskeyle bir kez yapılır.
+    #
+    # fit_transform() her adımın öğrendiği değerleri (ortalamalar, ölçekler,
+    # sınıflar, aykırı değer sınırları...) state'e yazar; transform() yeni
+    # veriyi yeniden fit etmeden aynı değerlerle dönüştürür.
+
+    def __init__(self, options, params=None, target=None):
+        self.steps = [step for step in STEPS if options.get(step)]
+        self.params = params or {}
+        self.target = target
+        self.state = {}
+        self.input_columns = None
+        self.text_inputs = []
+        self.schema = None
+
+    @property
+    def fitted(self):
+        return self.input_columns is not None
+
+    def fit_transform(self, df):
+        self.state = {}
+        self.input_columns = list(df.columns)
+        self.text_inputs = text_columns(df)
+        return self._execute(df, fit=True)
+
+    def transform(self, df, drop_rows=True):
+        if not self.fitted:
+            raise ValueError("Ön işleme planı henüz fit edilmedi.")
+        missing = [c for c in self.input_columns if c not in df.columns]
+        if missing:
+            raise KeyError(missing[0])
+        df, _ = self._execute(df[self.input_columns], fit=False, drop_rows=drop_rows)
+        return df
+
+    def _execute(self, df, fit, drop_rows=True):
+        df = df.copy(deep=False)
+        log = []
+        for step in self.steps:
+            with span("preprocess", step=step):
+                df = getattr(self, "_" + step)(df, log, fit, drop_rows)
+        return df, log
+
+    # ---- adımlar ----
+    def _fillMissing(self, df, log, fit, drop_rows):
+        if fit:
+            means = df[numeric_columns(df)].mean()
+            self.state["fillMissing"] = {c: float(v) for c, v in means.items() if not np.isnan(v)}
+        for col, mean in self.state["fillMissing"].items():
+            if df[col].hasnans:
+                df[col] = df[col].fillna(mean)
+        log.append("Eksik değerler ortalama ile dolduruldu.")
+        return df
+
+    def _encode(self, df, log, fit, key, cols, message):
+        if fit:
+            self.state[key] = {}
+            for col in cols:
+                try:
+                    df[col], self.state[key][col] = label_codes(df[col])
+                    log.append(message.format(col))
+                except Exception:
+                    log.append(f"{col} sütunu encode edilemedi.")
+            return df
+        for col, classes in self.state[key].items():
+            df[col], _ = label_codes(df[col], classes)
+        return df
+
+    def _encodeCategorical(self, df, log, fit, drop_rows):
+        return self._encode(
+            df, log, fit, "encodeCategorical", text_columns(df) if fit else None,
+            "{} sütunu LabelEncoder ile sayısala çevrildi."
+        )
+
+    def _scale(self, df, fit, key, fit_column):
+        if fit:
+            self.state[key] = {}
+            for col in numeric_columns(df, exclude=self.target):
+                values = df[col].to_numpy(dtype="float64", na_value=np.nan)
+                self.state[key][col] = fit_column(values)
+        for col, (offset, scale) in self.state[key].items():
+            values = df[col].to_numpy(dtype="float64", na_value=np.nan)
+            df[col] = (values - offset) / scale
+        return df
+
+    def _standardize(self, df, log, fit, drop_rows):
+        # StandardScaler: popülasyon std'si, sabit kolonlarda ölçek 1
+        def fit_column(values):
+            scale = float(np.nanstd(values))
+            return float(np.nanmean(values)), scale if scale > 0 else 1.0
+
+        df = self._scale(df, fit, "standardize", fit_column)
+        if self.state["standardize"]:
+            log.append("Veriler StandardScaler ile standartlaştırıldı.")
+        return df
+
+    def _normalize(self, df, log, fit, drop_rows):
+        # MinMaxScaler: sabit kolonlarda aralık 1
+        def fit_column(values):
+            low, high = float(np.nanmin(values)), float(np.nanmax(values))
+            return low, (high - low) if high > low else 1.0
+
+        df = self._scale(df, fit, "normalize", fit_column)
+        if self.state["normalize"]:
+            log.append("Veriler MinMaxScaler ile normalize edildi.")
+        return df
+
+    def _removeOutliers(self, df, log, fit, drop_rows):
+        if fit:
+            cols = numeric_columns(df, exclude=self.target)
+            self.state["removeOutliers"] = outlier_bounds(df, cols) if cols else None
+        bounds = self.state["removeOutliers"]
+        if bounds is None or not drop_rows:
+            return df
+        keep, flagged = outlier_mask(df, *bounds)
+        for col, count in flagged.items():
+            log.append(f"{col} sütununda {count} aykırı değer bulundu.")
+        log.append(f"Toplam {len(df) - int(keep.sum())} satır aykırı değer nedeniyle çıkarıldı.")
+        return df[keep] if not keep.all() else df
+
+    def _convertDtype(self, df, log, fit, drop_rows):
+        if fit:
+            self.state["convertDtype"] = []
+            for col in text_columns(df):
+                try:
+                    df[col] = pd.to_numeric(df[col])
+                    self.state["convertDtype"].append(col)
+                except (ValueError, TypeError):
+                    continue
+        else:
+            # Fit'te sayısal bulunan kolonlarda yeni veri hatalıysa NaN olur
+            for col in self.state["convertDtype"]:
+                df[col] = pd.to_numeric(df[col], errors="coerce")
+        log.append("Veri tipleri dönüştürülmeye çalışıldı.")
+        return df
+
+    def _selectColumns(self, df, log, fit, drop_rows):
+        if fit:
+            selected = self.params.get("selected_columns", [])
+            self.state["selectColumns"] = [col for col in selected if col in df.columns] if selected else None
+        existing = self.state["selectColumns"]
+        if existing is None:
+            log.append("Seçilen kolonlar parametresi boş.")
+            return df
+        log.append(f"Sadece seçilen {len(existing)} kolon tutuldu.")
+        return df[existing]
+
+    def _labelEncode(self, df, log, fit, drop_rows):
+        return self._encode(
+            df, log, fit, "labelEncode", text_columns(df) if fit else None,
+            "{} sütunu LabelEncoder ile encode edildi."
+        )
+
+    def _oneHotEncode(self, df, log, fit, drop_rows):
+        if fit:
+            # pd.get_dummies ile aynı kategori kümesi ve sırası
+            self.state["oneHotEncode"] = {
+                col: list(pd.Categorical(df[col]).categories) for col in text_columns(df)
+            }
+        categories = self.state["oneHotEncode"]
+        if categories:
+            # pd.get_dummies sırası: kalan kolonlar, ardından kukla kolonlar
+            parts = [df.drop(columns=list(categories))]
+            parts += [
+                pd.get_dummies(
+                    pd.Series(pd.Categorical(df[col], categories=cats), index=df.index), prefix=str(col)
+                )
+                for col, cats in categories.items()
+            ]
+            df = pd.concat(parts, axis=1)
+            log.append("One-Hot Encoding uygulandı.")
+        return df
+
+    def _renameColumns(self, df, log, fit, drop_rows):
+        if fit:
+            self.state["renameColumns"] = dict(self.params.get("rename_map", {}))
+        log.append("Kolon adları yeniden adlandırıldı.")
+        return df.rename(columns=self.state["renameColumns"])
+
+
+# ----------------------------
+# Kalıcı pipeline
+# ----------------------------
+def pipeline_name(filename):
+    return f"preprocess_{filename}.pkl"
+
+
+def pipeline_path(filename):
+    return os.path.join(MODEL_FOLDER, pipeline_name(filename))
+
+
+def save_pipeline(plan, filename):
+    path = pipeline_path(filename)
+    tmp = path + ".tmp"
+    joblib.dump(plan, tmp)
+    os.replace(tmp, path)
+    return path
+
+
+def load_pipeline(filename):
+    path = pipeline_path(filename)
+    if not os.path.exists(path):
+        raise FileNotFoundError(pipeline_name(filename))
+    return joblib.load(path)
@@ -0,0 +1,331 @@
+# backend/profiling.py
+import os
+
+import numpy as np
+import pandas as pd
+
+# ----------------------------
+# Ayarlar
+# ----------------------------
+# Kantil tahmini için sütun başına tutulan örnek sayısı; satır sayısı bunu
+# aşmadıkça Q1/medyan/Q3 kesin hesaplanır.
+SKETCH_SIZE = int(os.environ.get("LEBB_SKETCH_SIZE", "20000"))
+# Metin kolonlarında izlenen en fazla farklı değer (kategori adayı)
+CATEGORY_LEVELS = int(os.environ.get("LEBB_CATEGORY_LEVELS", "1000"))
+
+DESCRIBE_COLUMNS = ["Feature", "count", "mean", "std", "min", "25%", "50%", "75%", "max"]
+DESCRIBE_RENAME = {
+    "mean": "Mean",
+    "std": "Std Dev",
+    "min": "Min",
+    "25%": "Q1 (25%)",
+    "50%": "Median (50%)",
+    "75%": "Q3 (75%)",
+    "max": "Max",
+}
+
+
+# ----------------------------
+# Kantil özeti
+# ----------------------------
+class QuantileSketch:
+    # Sabit boyutlu, birleştirilebilir rastgele örneklem (reservoir sampling)
+
+    def __init__(self, size=SKETCH_SIZE, seed=0):
+        self.size = size
+        self.seen = 0
+        self.sample = np.empty(0, dtype="float64")
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values):
+        values = np.asarray(values, dtype="float64")
+        room = self.size - len(self.sample)
+        if room > 0:
+            self.sample = np.concatenate([self.sample, values[:room]])
+            self.seen += min(room, len(values))
+            values = values[room:]
+        if len(values) == 0:
+            return
+        # i. yeni eleman k/(seen+i) olasılıkla rastgele bir yuvaya yazılır
+        positions = self._rng.integers(0, self.seen + np.arange(1, len(values) + 1))
+        keep = positions < self.size
+        self.sample[positions[keep]] = values[keep]
+        self.seen += len(values)
+
+    def merge(self, other):
+        if other.seen == 0:
+            return
+        if self.seen + other.seen <= self.size:
+            self.sample = np.concatenate([self.sample, other.sample])
+        else:
+            # Her örneklemden temsil ettiği satır sayısıyla orantılı pay alınır
+            n_self = int(round(self.size * self.seen / (self.seen + other.seen)))
+            n_self = min(max(n_self, self.size - len(other.sample)), len(self.sample))
+            n_other = min(self.size - n_self, len(other.sample))
+            self.sample = np.concatenate([
+                self._rng.choice(self.sample, size=n_self, replace=False),
+                self._rng.choice(other.sample, size=n_other, replace=False),
+            ])
+        self.seen += other.seen
+
+    def quantile(self, q):
+        if len(self.sample) == 0:
+            return np.nan
+        return float(np.quantile(self.sample, q))
+
+
+# ----------------------------
+# Sütun profili
+# ----------------------------
+def chunk_kind(s):
+    if s.isna().all():
+        return None
+    if pd.api.types.is_bool_dtype(s):
+        return "bool"
+    if pd.api.types.is_integer_dtype(s):
+        return "int"
+    if pd.api.types.is_numeric_dtype(s):
+        return "float"
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        return "category"
+    if pd.api.types.is_datetime64_any_dtype(s):
+        return "datetime"
+    if pd.api.types.infer_dtype(s, skipna=True) == "boolean":
+        return "bool"
+    return "str"
+
+
+def merge_kind(a, b):
+    if a is None or a == b:
+        return b
+    if b is None:
+        return a
+    if {a, b} == {"int", "float"}:
+        return "float"
+    return "str"
+
+
+class ColumnProfile:
+
+    def __init__(self, name):
+        self.name = name
+        self.kind = None
+        self.rows = 0
+        self.missing = 0
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self.only_01 = True
+        self.float32_exact = True
+        self.levels = set()     # farklı metin değerleri; CATEGORY_LEVELS aşılınca None
+        self.sketch = QuantileSketch()
+
+    def update(self, s):
+        previous, kind = self.kind, chunk_kind(s)
+        self.kind = merge_kind(self.kind, kind)
+        if previous not in (None, self.kind):
+            # Önceki parçalar başka türde ayrıştırıldı; değer kümesi eksik kalır
+            self.levels = None
+        if kind not in (None, self.kind) and {kind, self.kind} != {"str", "category"}:
+            # Bu parça sayı olarak ayrıştırıldı (ör. "x,y" sonrası "1,2"); metin
+            # hâli bilinmediğinden değer kümesi tutulmaz
+            self.levels = None
+        n_missing = int(s.isna().sum())
+        self.rows += len(s)
+        self.missing += n_missing
+        if self.kind in ("str", "category") and self.levels is not None and len(s) > n_missing:
+            self.levels.update(s.dropna().unique().tolist())
+            if len(self.levels) > CATEGORY_LEVELS:
+                self.levels = None
+        if self.kind not in ("int", "float") or len(s) == n_missing:
+            return
+
+        values = pd.to_numeric(s.dropna(), errors="coerce").to_numpy(dtype="float64")
+        n = len(values)
+        if n == 0:
+            return
+        self.only_01 = self.only_01 and bool(np.isin(values, (0, 1)).all())
+        # float32'ye kayıpsız sığıyor mu (gidiş-dönüş aynı değer)
+        self.float32_exact = self.float32_exact and bool(
+            np.array_equal(values.astype("float32").astype("float64"), values)
+        )
+
+        # Chan et al. paralel ortalama/varyans birleştirme
+        c_mean = float(values.mean())
+        c_m2 = float(((values - c_mean) ** 2).sum())
+        total = self.count + n
+        delta = c_mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += c_m2 + delta ** 2 * self.count * n / total
+        self.count = total
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self.sketch.update(values)
+
+    @property
+    def is_numeric(self):
+        return self.kind in ("int", "float", None)
+
+    @property
+    def is_boolean(self):
+        return self.kind == "bool" and self.missing == 0
+
+    @property
+    def is_categorical(self):
+        return self.kind in ("str", "category") or (self.kind == "bool" and self.missing > 0)
+
+    def describe(self):
+        std = np.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else np.nan
+        empty = self.count == 0
+        return {
+            "Feature": self.name,
+            "count": float(self.count),
+            "mean": np.nan if empty else self.mean,
+            "std": std,
+            "min": np.nan if empty else self.min,
+            "25%": self.sketch.quantile(0.25),
+            "50%": self.sketch.quantile(0.5),
+            "75%": self.sketch.quantile(0.75),
+            "max": np.nan if empty else self.max,
+        }
+
+
+# ----------------------------
+# Korelasyon özeti
+# ----------------------------
+class CorrelationAccumulator:
+    # Çift bazında (pairwise complete) toplamlar; DataFrame.corr() ile aynı
+    # sonucu verir ve parça parça güncellenir. Sayısal kararlılık için
+    # değerler ilk görülen parçanın ortalamasına göre kaydırılır.
+
+    def __init__(self):
+        self.columns = []
+        self.shift = np.empty(0)
+        self.n = np.zeros((0, 0))
+        self.sx = np.zeros((0, 0))      # sx[i, j]: i ve j dolu satırlarda x_i toplamı
+        self.sxx = np.zeros((0, 0))
+        self.sxy = np.zeros((0, 0))
+
+    def _add_columns(self, names, shift):
+        k = len(names)
+        self.columns.extend(names)
+        self.shift = np.concatenate([self.shift, shift])
+        for attr in ("n", "sx", "sxx", "sxy"):
+            setattr(self, attr, np.pad(getattr(self, attr), ((0, k), (0, k))))
+
+    def update(self, frame):
+        new = [c for c in frame.columns if c not in self.columns]
+        if new:
+            means = frame[new].astype("float64").mean().fillna(0.0).to_numpy()
+            self._add_columns(new, means)
+        if len(frame) == 0 or not self.columns:
+            return
+
+        X = frame.reindex(columns=self.columns).to_numpy(dtype="float64") - self.shift
+        present = ~np.isnan(X)
+        X0 = np.where(present, X, 0.0)
+        self.sxy += X0.T @ X0
+        if present.all():
+            # Eksik yoksa maske çarpımları kolon toplamlarına iner
+            self.n += len(X0)
+            self.sx += X0.sum(axis=0)[:, None]
+            self.sxx += (X0 * X0).sum(axis=0)[:, None]
+        else:
+            mask = present.astype("float64")
+            self.n += mask.T @ mask
+            self.sx += X0.T @ mask
+            self.sxx += (X0 * X0).T @ mask
+
+    def correlation(self, columns):
+        ix = [self.columns.index(c) for c in columns]
+        sub = np.ix_(ix, ix)
+        n, sx, sxx, sxy = self.n[sub], self.sx[sub], self.sxx[sub], self.sxy[sub]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cov = n * sxy - sx * sx.T
+            var = (n * sxx - sx ** 2) * (n * sxx.T - sx.T ** 2)
+            corr = np.clip(cov / np.sqrt(var), -1.0, 1.0)
+        corr[(n < 2) | ~(var > 0)] = np.nan
+        return pd.DataFrame(corr, index=columns, columns=columns)
+
+
+# ----------------------------
+# Veri seti profili (tek geçiş, parça parça)
+# ----------------------------
+class DatasetProfile:
+
+    def __init__(self, preview_rows=5):
+        self.preview_rows = preview_rows
+        self.columns = {}
+        self.row_count = 0
+        self.preview = None
+        self.corr = CorrelationAccumulator()
+
+    def update(self, chunk):
+        if self.preview is None:
+            self.preview = chunk.head(self.preview_rows)
+        for col in chunk.columns:
+            profile = self.columns.get(col)
+            if profile is None:
+                profile = self.columns[col] = ColumnProfile(col)
+            profile.update(chunk[col])
+        self.corr.update(chunk.select_dtypes(include=["number", "bool"]))
+        self.row_count += len(chunk)
+
+    def correlation(self):
+        # DataFrame.corr(numeric_only=True) karşılığı; tam veri taranmaz
+        names = [
+            c.name for c in self.columns.values()
+            if c.name in self.corr.columns and (c.kind in ("int", "float", None) or c.is_boolean)
+        ]
+        return self.corr.correlation(names)
+
+    def insights(self):
+        cols = list(self.columns.values())
+        boolean_cols = [c.name for c in cols if c.is_boolean]
+        numerical_cols = [c.name for c in cols if c.is_numeric]
+        categorical_cols = [c.name for c in cols if c.is_categorical]
+
+        for c in cols:
+            if c.is_numeric and c.count > 0 and c.only_01:
+                boolean_cols.append(c.name)
+                numerical_cols.remove(c.name)
+
+        column_types = {
+            "Numerical": numerical_cols,
+            "Categorical": categorical_cols,
+            "Boolean": boolean_cols
+        }
+
+        missing_values = sum(c.missing for c in cols)
+
+        desc = pd.DataFrame(
+            [self.columns[name].describe() for name in numerical_cols], columns=DESCRIBE_COLUMNS
+        )
+        desc[DESCRIBE_COLUMNS[1:]] = desc[DESCRIBE_COLUMNS[1:]].astype("float64").round(2)
+        descriptive_stats = desc.rename(columns=DESCRIBE_RENAME).to_dict(orient="records")
+
+        missing_info = []
+        for c in cols:
+            pct = round(c.missing / self.row_count * 100, 2) if self.row_count else np.nan
+            if pct > 0:
+                missing_info.append({"Feature": c.name, "MissingPercentage": pct})
+
+        suggestions = {
+            "fillMissing": bool(missing_values > 0),
+            "encodeCategorical": bool(len(categorical_cols) > 0),
+            "scaleNumerical": bool(len(numerical_cols) > 0)
+        }
+
+        return {
+            "row_count": int(self.row_count),
+            "column_count": int(len(cols)),
+            "missing_values": int(missing_values),
+            "missing_info": missing_info,
+            "numerical_columns": numerical_cols,
+            "categorical_columns": categorical_cols,
+            "suggestions": suggestions,
+            "descriptive_stats": descriptive_stats,
+            "column_types": column_types
+        }
@@ -0,0 +1,270 @@
+# backend/serialization.py
+import io
+import json
+import os
+import zlib
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from flask import Response, request
+
+from telemetry import span
+
+try:
+    import msgpack
+except ImportError:     # isteğe bağlı; yoksa yalnızca JSON/Arrow sunulur
+    msgpack = None
+
+# ----------------------------
+# Ayarlar
+# ----------------------------
+# Bu satır sayısından büyük tablolar parça parça (chunked) gönderilir
+STREAM_ROWS = int(os.environ.get("LEBB_STREAM_ROWS", "5000"))
+# Akışta parça başına satır
+STREAM_CHUNK = int(os.environ.get("LEBB_STREAM_CHUNK", "2000"))
+# Bu boyuttan küçük yanıtlar sıkıştırılmaz
+COMPRESS_MIN_BYTES = int(os.environ.get("LEBB_COMPRESS_MIN_BYTES", "1024"))
+GZIP_LEVEL = int(os.environ.get("LEBB_GZIP_LEVEL", "5"))
+# JSON'da ondalık hassasiyeti (pandas üst sınırı 15)
+DOUBLE_PRECISION = 15
+
+JSON = "application/json"
+ARROW = "application/vnd.apache.arrow.stream"
+MSGPACK = "application/msgpack"
+ZSTD = pa.Codec.is_available("zstd")
+
+
+# ----------------------------
+# Kolon -> JSON
+# ----------------------------
+def column_json(s):
+    # Tek kolonun JSON dizisi; satır başına Python nesnesi üretilmez.
+    # NaN/NaT -> null, zaman damgaları ISO 8601.
+    values = s.to_numpy() if not isinstance(s.dtype, pd.CategoricalDtype) else None
+    if values is not None and values.dtype.kind == "f":
+        # Yalnızca sayı içeren dizide NaN/Infinity belirteçleri güvenle null olur
+        text = json.dumps(values.tolist())
+        return text.replace("-Infinity", "null").replace("Infinity", "null").replace("NaN", "null")
+    if values is not None and values.dtype.kind in "iub":
+        return json.dumps(values.tolist())
+    if values is not None and values.dtype.kind == "M":
+        iso = np.datetime_as_string(values, unit="auto")
+        return json.dumps([None if v == "NaT" else v for v in iso.tolist()])
+    return json.dumps(_objects(s), ensure_ascii=False, default=str)
+
+
+def _objects(s):
+    # Metin/kategori/karışık kolonlar: eksikler None, diğerleri olduğu gibi
+    out = s.astype(object)
+    return out.where(s.notna(), None).tolist()
+
+
+def records_json(df, lines=False):
+    # Satır bazlı JSON (to_dict + jsonify yerine, pandas'ın C kodlayıcısı);
+    # lines=True ise satır başına bir nesne (NDJSON)
+    return df.to_json(orient="records", lines=lines, date_format="iso", force_ascii=False,
+                      double_precision=DOUBLE_PRECISION)
+
+
+def _records_chunks(df):
+    # "[...]" dizisini parça parça üretir; bellekte en fazla bir parça
+    yield "["
+    for start in range(0, len(df), STREAM_CHUNK):
+        text = records_json(df.iloc[start:start + STREAM_CHUNK])[1:-1]
+        if text:
+            yield ("," if start else "") + text
+    yield "]"
+
+
+def _columns_chunks(df):
+    # {"columns": [...], "data": [[kolon0], [kolon1], ...]}
+    yield '{"columns":' + json.dumps([str(c) for c in df.columns], ensure_ascii=False) + ',"data":['
+    for i, col in enumerate(df.columns):
+        yield ("," if i else "") + column_json(df[col])
+    yield "]}"
+
+
+def _frame_chunks(df, layout):
+    return _columns_chunks(df) if layout == "columns" else _records_chunks(df)
+
+
+def _envelope_chunks(envelope, frames, layout):
+    # Küçük alanlar tek seferde, tablolar parça parça
+    yield "{"
+    first = True
+    for key, value in envelope.items():
+        yield ("" if first else ",") + json.dumps(key) + ":" + json.dumps(_plain(value), ensure_ascii=False, default=str)
+        first = False
+    for key, df in frames.items():
+        yield ("" if first else ",") + json.dumps(key) + ":"
+        first = False
+        if df is None:
+            yield "[]"
+        else:
+            yield from _frame_chunks(df, layout)
+    yield "}"
+
+
+def _plain(value):
+    # Zarf içindeki numpy/NaN değerleri (insights vb.) geçerli JSON'a
+    if isinstance(value, dict):
+        return {k: _plain(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(v) for v in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not np.isfinite(value):
+        return None
+    return value
+
+
+# ----------------------------
+# Diğer biçimler
+# ----------------------------
+def _arrow_body(envelope, df):
+    # Tek tablo Arrow IPC akışı; zarf şema meta verisinde
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.replace_schema_metadata({"lebb": json.dumps(_plain(envelope), default=str)})
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table, max_chunksize=STREAM_CHUNK)
+    return sink.getvalue().to_pybytes()
+
+
+def _msgpack_body(envelope, frames):
+    payload = dict(_plain(envelope))
+    for key, df in frames.items():
+        payload[key] = None if df is None else {
+            "columns": [str(c) for c in df.columns],
+            "data": [json.loads(column_json(df[c])) for c in df.columns],
+        }
+    return msgpack.packb(payload, use_bin_type=True, default=str)
+
+
+def negotiate():
+    offers = [JSON, ARROW] + ([MSGPACK] if msgpack is not None else [])
+    return request.accept_mimetypes.best_match(offers, default=JSON)
+
+
+# ----------------------------
+# Yanıt
+# ----------------------------
+def frame_response(envelope, status=200, **frames):
+    # Tablo içeren yanıt: istemcinin Accept başlığına göre JSON (satır ya da
+    # ?layout=columns ile kolon bazlı), Arrow IPC ya da MessagePack. Büyük
+    # tablolar chunked aktarılır.
+    response = _frame_response(negotiate(), envelope, status, frames)
+    response.vary.add("Accept")
+    return response
+
+
+def _frame_response(mimetype, envelope, status, frames):
+    if mimetype == ARROW and len(frames) == 1 and next(iter(frames.values())) is not None:
+        with span("serialize", format="arrow"):
+            body = _arrow_body(envelope, next(iter(frames.values())))
+        return Response(body, status=status, mimetype=ARROW)
+    if mimetype == MSGPACK:
+        with span("serialize", format="msgpack"):
+            body = _msgpack_body(envelope, frames)
+        return Response(body, status=status, mimetype=MSGPACK)
+
+    layout = "columns" if request.args.get("layout") == "columns" else "records"
+    rows = sum(len(df) for df in frames.values() if df is not None)
+    chunks = _envelope_chunks(envelope, frames, layout)
+    if rows > STREAM_ROWS:
+        return stream_response((chunk.encode("utf-8") for chunk in chunks), status, JSON)
+    with span("serialize", format="json"):
+        body = "".join(chunks)
+    return Response(body, status=status, mimetype=JSON)
+
+
+def accepted_encoding():
+    accepted = request.accept_encodings
+    if ZSTD and accepted["zstd"]:
+        return "zstd"
+    if accepted["gzip"]:
+        return "gzip"
+    return None
+
+
+class _Sink(io.BytesIO):
+    # CompressedOutputStream kapanırken alttaki dosyayı da kapatır; son blok
+    # okunabilsin diye kapatma yok sayılır
+    def close(self):
+        pass
+
+
+class _Compressor:
+    # gzip (zlib) ya da zstd (pyarrow codec) için ortak artımlı arayüz
+
+    def __init__(self, encoding):
+        self.encoding = encoding
+        if encoding == "gzip":
+            self._z = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+        else:
+            self._buffer = _Sink()
+            self._z = pa.CompressedOutputStream(self._buffer, "zstd")
+
+    def _drain(self):
+        data = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return data
+
+    def compress(self, data):
+        if self.encoding == "gzip":
+            return self._z.compress(data)
+        self._z.write(data)
+        return self._drain()
+
+    def flush(self):
+        if self.encoding == "gzip":
+            return self._z.flush(zlib.Z_SYNC_FLUSH)
+        self._z.flush()
+        return self._drain()
+
+    def finish(self):
+        if self.encoding == "gzip":
+            return self._z.flush()
+        self._z.close()
+        return self._drain()
+
+
+def stream_response(chunks, status=200, mimetype=JSON):
+    # Uzunluk bilinmez -> chunked aktarım. Kodlama istek bağlamı kapanmadan
+    # seçilir; üreteç yanıt gönderilirken çalışır.
+    encoding = accepted_encoding()
+    response = Response(chunks if encoding is None else _compressed(chunks, encoding),
+                        status=status, mimetype=mimetype)
+    if encoding is not None:
+        response.headers["Content-Encoding"] = encoding
+    response.vary.add("Accept-Encoding")
+    return response
+
+
+def compress_response(response):
+    # Tamponlanmış yanıtlar; küçük, zaten kodlanmış ya da dosya akışı olanlar atlanır
+    if (response.is_streamed or response.direct_passthrough or response.status_code < 200
+            or response.status_code in (204, 304) or "Content-Encoding" in response.headers):
+        return response
+    response.vary.add("Accept-Encoding")
+    encoding = accepted_encoding()
+    if encoding is None or (response.content_length or 0) < COMPRESS_MIN_BYTES:
+        return response
+    with span("compress", encoding=encoding):
+        compressor = _Compressor(encoding)
+        body = compressor.compress(response.get_data()) + compressor.finish()
+    response.set_data(body)
+    response.headers["Content-Encoding"] = encoding
+    return response
+
+
+def _compressed(chunks, encoding):
+    compressor = _Compressor(encoding)
+    for chunk in chunks:
+        # Her parça hemen gönderilsin diye kodlayıcı parça sonunda boşaltılır
+        data = compressor.compress(chunk) + compressor.flush()
+        if data:
+            yield data
+    yield compressor.finish()
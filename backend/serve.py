@@ -0,0 +1,130 @@
+# backend/serve.py
+# Üretim sunucusu. Geliştirme sunucusu (python app.py) yerine:
+#
+#   python serve.py                          # gunicorn, LEBB_WEB_* ayarlarıyla
+#   python serve.py --workers 4 --threads 8 --port 8000
+#
+# Sıra: gunicorn (Linux/macOS), yoksa waitress (Windows), o da yoksa uyarıyla
+# Werkzeug'un çok iş parçacıklı sunucusu. Flask bir WSGI uygulamasıdır; ASGI
+# sunucusu gerekmez.
+#
+# Her web işçisi kendi eğitim havuzunu açar; CPU bütçesi işçilere bölünür.
+# Veri setleri kolonlu depodan memory-map ile açıldığından ve modeller
+# memory-map ile yüklendiğinden işçiler aynı sayfaları paylaşır.
+import argparse
+import logging
+import os
+import sys
+
+# ----------------------------
+# Ayarlar
+# ----------------------------
+HOST = os.environ.get("LEBB_HOST", "0.0.0.0")
+PORT = int(os.environ.get("LEBB_PORT", "5000"))
+# Web işçi süreçleri ve süreç başına iş parçacığı
+WEB_WORKERS = int(os.environ.get("LEBB_WEB_WORKERS", "2"))
+WEB_THREADS = int(os.environ.get("LEBB_WEB_THREADS", "8"))
+# /train-models eğitim bitene kadar bekler; istek zaman aşımı buna göre uzun
+WEB_TIMEOUT = int(os.environ.get("LEBB_WEB_TIMEOUT", "900"))
+SERVER = os.environ.get("LEBB_SERVER", "auto")
+
+SERVERS = ("auto", "gunicorn", "waitress", "werkzeug")
+
+log = logging.getLogger("lebb.serve")
+
+
+def share_budget(workers):
+    # Eğitim CPU bütçesi web işçilerine bölünür (açıkça verilmediyse);
+    # app içe aktarılmadan önce çağrılmalı
+    if workers > 1 and "LEBB_CPU_BUDGET" not in os.environ:
+        os.environ["LEBB_CPU_BUDGET"] = str(max(1, (os.cpu_count() or 1) // workers))
+
+
+def _available(module):
+    try:
+        __import__(module)
+    except ImportError:
+        return False
+    return True
+
+
+def pick_server(name):
+    if name != "auto":
+        return name
+    for candidate in ("gunicorn", "waitress"):
+        if _available(candidate):
+            return candidate
+    return "werkzeug"
+
+
+def run_gunicorn(args):
+    from gunicorn.app.base import BaseApplication
+
+    class Application(BaseApplication):
+
+        def __init__(self, options):
+            self.options = options
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            from app import app
+            return app
+
+    Application({
+        "bind": f"{args.host}:{args.port}",
+        "workers": args.workers,
+        "threads": args.threads,
+        "worker_class": "gthread",
+        "timeout": args.timeout,
+        "graceful_timeout": 30,
+        # Kütüphaneler ana süreçte bir kez yüklenir, işçiler fork ile paylaşır.
+        # Eğitim havuzu ilk işte açıldığından fork'tan etkilenmez.
+        "preload_app": True,
+        "accesslog": "-",
+    }).run()
+
+
+def run_waitress(args):
+    from waitress import serve
+    from app import app
+
+    serve(app, host=args.host, port=args.port, threads=args.threads, channel_timeout=args.timeout)
+
+
+def run_werkzeug(args):
+    from app import app
+
+    log.warning("gunicorn/waitress kurulu değil; Werkzeug sunucusu kullanılıyor (üretim için önerilmez)")
+    app.run(host=args.host, port=args.port, debug=False, threaded=True)
+
+
+RUNNERS = {"gunicorn": run_gunicorn, "waitress": run_waitress, "werkzeug": run_werkzeug}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="LEBB backend sunucusu")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--workers", type=int, default=WEB_WORKERS, help="web işçi süreçleri")
+    parser.add_argument("--threads", type=int, default=WEB_THREADS, help="işçi başına iş parçacığı")
+    parser.add_argument("--timeout", type=int, default=WEB_TIMEOUT, help="istek zaman aşımı (sn)")
+    parser.add_argument("--server", choices=SERVERS, default=SERVER)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    server = pick_server(args.server)
+    if server != "gunicorn" and args.workers > 1:
+        log.warning("%s tek süreçli çalışır; --workers %d yok sayıldı", server, args.workers)
+        args.workers = 1
+    share_budget(args.workers)
+    log.info("%s: %s:%d, %d işçi x %d iş parçacığı", server, args.host, args.port, args.workers, args.threads)
+    RUNNERS[server](args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,266 @@
+# backend/telemetry.py
+import atexit
+import contextvars
+import json
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:     # Windows
+    resource = None
+
+from config import LOG_FOLDER
+
+# ----------------------------
+# Ayarlar
+# ----------------------------
+# Kullanıcı işlemleri bu JSONL dosyasına eklenir; boş ise kayıt tutulmaz
+ACTION_LOG = os.environ.get("LEBB_ACTION_LOG", os.path.join(LOG_FOLDER, "actions.jsonl"))
+# Yazılmayı bekleyen en fazla kayıt; dolarsa yeni kayıtlar düşürülür (istek beklemez)
+ACTION_BUFFER = int(os.environ.get("LEBB_ACTION_BUFFER", "10000"))
+# Tampon bu aralıkla (sn) diske boşaltılır
+ACTION_FLUSH = float(os.environ.get("LEBB_ACTION_FLUSH", "2"))
+
+# Süre histogramı kovaları (sn)
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+
+
+# ----------------------------
+# Bellek
+# ----------------------------
+def rss_bytes():
+    # Anlık bellek (Linux /proc); yoksa tepe değer
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return peak_rss_bytes()
+
+
+def peak_rss_bytes():
+    # Sürecin ulaştığı en yüksek bellek (ru_maxrss Linux'ta KB)
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+# ----------------------------
+# Metrik kayıt defteri (Prometheus metin biçimi)
+# ----------------------------
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
+
+
+def _labels(labels, extra=None):
+    items = list(labels) + ([extra] if extra else [])
+    if not items:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in items) + "}"
+
+
+class Registry:
+    # Süreç içi histogram/sayaç/gösterge değerleri; /metrics bunları yazar.
+    # İşlem havuzundaki ölçümler sonuçla birlikte gelip burada birleştirilir.
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self._histograms = {}   # (ad, etiketler) -> [kova sayıları, toplam, adet]
+        self._counters = {}     # (ad, etiketler) -> değer
+        self._gauges = {}       # (ad, etiketler) -> değer
+        self._help = {}
+        self._lock = threading.Lock()
+
+    def describe(self, name, text):
+        self._help[name] = text
+
+    def observe(self, name, seconds, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            entry = self._histograms.get(key)
+            if entry is None:
+                entry = self._histograms[key] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    entry[0][i] += 1
+            entry[1] += seconds
+            entry[2] += 1
+
+    def inc(self, name, value=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def set_max(self, name, value, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._gauges[key] = max(self._gauges.get(key, 0), value)
+
+    def set(self, name, value, **labels):
+        with self._lock:
+            self._gauges[(name, tuple(sorted(labels.items())))] = value
+
+    def render(self):
+        lines = []
+        with self._lock:
+            for kind, series in (("histogram", self._histograms), ("counter", self._counters),
+                                 ("gauge", self._gauges)):
+                names = sorted({name for name, _ in series})
+                for name in names:
+                    if name in self._help:
+                        lines.append(f"# HELP {name} {self._help[name]}")
+                    lines.append(f"# TYPE {name} {kind}")
+                    for (n, labels), value in sorted(series.items(), key=lambda kv: str(kv[0])):
+                        if n != name:
+                            continue
+                        if kind != "histogram":
+                            lines.append(f"{name}{_labels(labels)} {value}")
+                            continue
+                        counts, total, count = value
+                        for bound, c in zip(self.buckets, counts):
+                            lines.append(f"{name}_bucket{_labels(labels, ('le', bound))} {c}")
+                        lines.append(f"{name}_bucket{_labels(labels, ('le', '+Inf'))} {count}")
+                        lines.append(f"{name}_sum{_labels(labels)} {round(total, 6)}")
+                        lines.append(f"{name}_count{_labels(labels)} {count}")
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+registry.describe("lebb_stage_seconds", "Aşama süreleri (okuma, ön işleme, fit, CV katı, render, JSON)")
+registry.describe("lebb_request_seconds", "HTTP istek süreleri")
+registry.describe("lebb_peak_rss_bytes", "Süreç tepe belleği (web / işçi)")
+registry.describe("lebb_actions_total", "Kaydedilen kullanıcı işlemleri")
+registry.describe("lebb_actions_dropped_total", "Tampon dolu olduğu için düşürülen işlem kayıtları")
+
+
+# ----------------------------
+# Zaman aralıkları (span)
+# ----------------------------
+# Etkin istek/iş için toplanan aralıklar; None ise yalnızca metriklere yazılır
+_trace = contextvars.ContextVar("lebb_trace", default=None)
+# collect() içinde metrikler sonradan merge() ile ana süreçte yazılır
+_deferred = contextvars.ContextVar("lebb_trace_deferred", default=False)
+
+
+def record(stage, seconds, rss=None, **labels):
+    # Ölçülmüş bir aralığı metriklere ve (varsa) etkin izlemeye ekler
+    if not _deferred.get():
+        registry.observe("lebb_stage_seconds", seconds, stage=stage, **labels)
+    trace = _trace.get()
+    if trace is not None:
+        entry = {"stage": stage, **labels, "ms": round(seconds * 1000, 3)}
+        if rss is not None:
+            entry["rss_mb"] = round(rss / 2 ** 20, 1)
+        trace.append(entry)
+
+
+@contextmanager
+def span(stage, **labels):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(stage, time.perf_counter() - started, rss_bytes(), **labels)
+
+
+@contextmanager
+def collect():
+    # Blok içindeki aralıkları liste olarak toplar (ör. işçi süreçte eğitim);
+    # liste sonuçla birlikte ana sürece taşınır.
+    spans = []
+    token, deferred = _trace.set(spans), _deferred.set(True)
+    try:
+        yield spans
+    finally:
+        _deferred.reset(deferred)
+        _trace.reset(token)
+        peak = peak_rss_bytes()
+        if peak is not None:
+            spans.append({"stage": "peak_rss", "pid": os.getpid(), "rss_mb": round(peak / 2 ** 20, 1)})
+
+
+def merge(spans, process="worker"):
+    # Başka süreçte toplanmış aralıkları buradaki metriklere ekler
+    for entry in spans or ():
+        if entry["stage"] == "peak_rss":
+            registry.set_max("lebb_peak_rss_bytes", int(entry["rss_mb"] * 2 ** 20), process=process)
+            continue
+        labels = {k: v for k, v in entry.items() if k not in ("stage", "ms", "rss_mb")}
+        registry.observe("lebb_stage_seconds", entry["ms"] / 1000, stage=entry["stage"], **labels)
+
+
+def attach(spans):
+    # Metriklere zaten eklenmiş aralıkları etkin izlemeye ekler
+    trace = _trace.get()
+    if trace is not None:
+        trace.extend(spans or ())
+
+
+def start_trace():
+    return _trace.set([])
+
+
+def end_trace(token):
+    spans = _trace.get()
+    _trace.reset(token)
+    return spans
+
+
+# ----------------------------
+# Kullanıcı işlem kaydı (tamponlu)
+# ----------------------------
+class ActionLog:
+    # log() yalnızca kuyruğa ekler; yazma arka plan iş parçacığında toplu
+    # yapılır. Kuyruk doluysa kayıt düşürülür ve sayılır, istek hiç beklemez.
+
+    def __init__(self, path=ACTION_LOG, capacity=ACTION_BUFFER, interval=ACTION_FLUSH):
+        self.path = path
+        self.interval = interval
+        self._queue = queue.Queue(maxsize=capacity)
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def log(self, user, action, filename=None, details=None):
+        if not self.path:
+            return
+        record = {"ts": time.time(), "user": user, "action": action, "filename": filename, "details": details}
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            registry.inc("lebb_actions_dropped_total")
+            return
+        registry.inc("lebb_actions_total", action=action)
+        self._ensure_thread()
+
+    def _ensure_thread(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+                atexit.register(self.flush)
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            self.flush()
+
+    def flush(self):
+        batch = []
+        while True:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        if not batch:
+            return
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("".join(json.dumps(r, ensure_ascii=False, default=str) + "\n" for r in batch))
+
+
+action_log = ActionLog()
@@ -0,0 +1,51 @@
+# backend/tests/conftest.py
+# Testler geçici bir veri kökünde (LEBB_DATA_DIR) ve süreç içi eğitimle
+# (LEBB_TRAIN_WORKERS=0) çalışır; ayarlar modüller içe aktarılmadan önce verilir.
+import io
+import os
+import shutil
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+import pytest
+
+DATA_DIR = tempfile.mkdtemp(prefix="lebb-test-")
+os.environ["LEBB_DATA_DIR"] = DATA_DIR
+os.environ["LEBB_TRAIN_WORKERS"] = "0"
+os.environ["LEBB_RESULT_CACHE"] = "0"
+os.environ["LEBB_ACTION_LOG"] = ""
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(DATA_DIR, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def app():
+    from app import app as flask_app
+    yield flask_app
+    from jobs import job_manager
+    job_manager.shutdown()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+def make_frame(rows=300, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "age": rng.integers(18, 90, rows),
+        "income": rng.normal(50_000, 10_000, rows).round(2),
+        "city": rng.choice(["a", "b", "c"], rows),
+        "label": rng.integers(0, 2, rows),
+    })
+
+
+def upload(client, name, df):
+    body = {"file": (io.BytesIO(df.to_csv(index=False).encode()), name)}
+    return client.post("/analyze", data=body, content_type="multipart/form-data")
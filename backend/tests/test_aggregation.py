@@ -0,0 +1,82 @@
+# backend/tests/test_aggregation.py
+import numpy as np
+import pandas as pd
+
+import aggregation
+from aggregation import MAX_POINTS, chart_data, lttb, value_counts
+from conftest import make_frame, upload
+
+
+def test_lttb_keeps_ends_and_spikes():
+    x = np.arange(10_000, dtype="float64")
+    y = np.zeros_like(x)
+    y[4321] = 100.0
+    idx = lttb(x, y, 50)
+    assert len(idx) == 50
+    assert idx[0] == 0 and idx[-1] == len(x) - 1
+    assert 4321 in idx
+    assert (np.diff(idx) > 0).all()
+
+
+def test_scatter_switches_to_density_over_budget():
+    rng = np.random.default_rng(0)
+    big = pd.DataFrame({"a": rng.normal(size=MAX_POINTS + 500), "b": rng.normal(size=MAX_POINTS + 500)})
+    data = chart_data(big, "scatter", "a", "b")
+    assert data["mode"] == "density"
+    assert sum(map(sum, data["counts"])) == len(big)
+
+    small = big.head(100)
+    data = chart_data(small, "scatter", "a", "b")
+    assert data["mode"] == "points"
+    assert data["x"] == small["a"].tolist()
+
+
+def test_histogram_counts_all_values_within_bin_limit(monkeypatch):
+    monkeypatch.setattr(aggregation, "MAX_BINS", 10)
+    values = np.random.default_rng(1).normal(size=50_000)
+    df = pd.DataFrame({"v": values})
+    df.loc[::100, "v"] = np.nan
+    data = chart_data(df, "histogram", "v")
+    assert len(data["counts"]) <= 10
+    assert sum(data["counts"]) == int(df["v"].notna().sum())
+    assert len(data["kde"]["x"]) == len(data["kde"]["y"])
+
+
+def test_box_matches_group_quantiles():
+    df = pd.DataFrame({"g": ["a"] * 50 + ["b"] * 50, "v": np.r_[np.arange(50.0), np.arange(50.0) * 2]})
+    df.loc[49, "v"] = 1000.0    # "a" grubunda tek aykırı değer
+    groups = {g["label"]: g for g in chart_data(df, "box", "g", "v")["groups"]}
+    a = df.loc[df["g"] == "a", "v"]
+    assert groups["a"]["med"] == a.median()
+    assert groups["a"]["q1"] == a.quantile(0.25)
+    assert groups["a"]["outliers"] == 1
+    assert groups["a"]["whishi"] == 48.0
+    assert groups["b"]["outliers"] == 0
+    assert groups["b"]["n"] == 50
+
+
+def test_value_counts_folds_rare_groups_into_other():
+    s = pd.Series(list("aaaabbbccdef"))
+    data = value_counts(s, limit=3)
+    assert data["labels"] == ["a", "b", "c"]
+    assert data["counts"] == [4, 3, 2]
+    assert data["other"] == 3
+
+
+def test_visualize_returns_summaries_not_rows(client):
+    r = upload(client, "visualize.csv", make_frame(rows=3000, seed=51))
+    name = r.get_json()["filename"]
+    r = client.post(f"/visualize?filename={name}", json=[
+        {"chartType": "scatter", "xColumn": "age", "yColumn": "income"},
+        {"chartType": "histogram", "xColumn": "income"},
+        {"chartType": "box", "xColumn": "city", "yColumn": "income"},
+        {"chartType": "scatter", "xColumn": "age"},         # y eksik: atlanır
+        {"chartType": "histogram", "xColumn": "missing"},   # kolon yok: atlanır
+    ])
+    assert r.status_code == 200
+    charts = r.get_json()
+    assert [c["chartType"] for c in charts] == ["scatter", "histogram", "box"]
+    assert charts[0]["data"]["mode"] == "density"
+    assert sum(charts[1]["data"]["counts"]) == 3000
+    assert {g["label"] for g in charts[2]["data"]["groups"]} == {"a", "b", "c"}
+    assert all(c["url"].startswith("/plots/") for c in charts)
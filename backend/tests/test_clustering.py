@@ -0,0 +1,61 @@
+# backend/tests/test_clustering.py
+import numpy as np
+import pytest
+from sklearn.cluster import DBSCAN, KMeans
+from sklearn.datasets import make_blobs
+from sklearn.metrics import adjusted_rand_score
+from sklearn.neighbors import NearestNeighbors
+
+from clustering import ChunkedDBSCAN, ClusteringTimeout, TimedMiniBatchKMeans, _Deadline, scalable_model
+
+
+class RecordingNeighbors:
+    # radius_neighbors çağrılarının satır sayılarını kaydeder
+
+    def __init__(self, nn):
+        self.nn = nn
+        self.sizes = []
+
+    def radius_neighbors(self, X, return_distance=False):
+        self.sizes.append(len(X))
+        return self.nn.radius_neighbors(X, return_distance=return_distance)
+
+
+def test_chunked_dbscan_matches_dbscan():
+    X, _ = make_blobs(2000, centers=3, cluster_std=0.5, random_state=1)
+    expected = DBSCAN(eps=0.5, min_samples=5).fit(X).labels_
+    labels = ChunkedDBSCAN(eps=0.5, min_samples=5, neighbor_budget=5000).fit(X).labels_
+    np.testing.assert_array_equal(labels, expected)
+
+
+def test_first_dbscan_chunk_fits_neighbor_budget():
+    # Tüm noktalar birbirinin komşusu: ilk parça bile bütçeyi aşmamalı
+    X = np.zeros((500, 2))
+    model = ChunkedDBSCAN(eps=1.0, neighbor_budget=2000)
+    nn = RecordingNeighbors(NearestNeighbors(radius=1.0).fit(X))
+    chunks = list(model._chunks(nn, np.arange(len(X)), X, _Deadline(60)))
+    assert all(sum(len(nb) for nb in neighbors) <= 2000 for _, neighbors in chunks)
+    assert nn.sizes[0] == 4
+
+
+def test_timed_kmeans_matches_kmeans():
+    X, _ = make_blobs(30000, centers=4, random_state=0)
+    expected = KMeans(n_clusters=4, random_state=0).fit(X).labels_
+    model = TimedMiniBatchKMeans(n_clusters=4, random_state=0).fit(X)
+    assert adjusted_rand_score(expected, model.labels_) > 0.95
+    assert model.n_iter_ <= model.max_iter
+    np.testing.assert_array_equal(model.predict(X[:100]), model.labels_[:100])
+
+
+def test_timed_kmeans_stops_at_deadline():
+    X, _ = make_blobs(30000, centers=4, random_state=0)
+    with pytest.raises(ClusteringTimeout):
+        TimedMiniBatchKMeans(n_clusters=4, timeout=0).fit(X)
+
+
+def test_scalable_kmeans_accepts_kmeans_params():
+    model = scalable_model("KMeans", {"n_clusters": 3, "n_init": "auto", "max_iter": 5}, 10 ** 6)
+    assert isinstance(model, TimedMiniBatchKMeans)
+    assert model.max_iter == 5
+    X, _ = make_blobs(1000, centers=3, random_state=2)
+    assert len(np.unique(model.fit(X).labels_)) == 3
@@ -0,0 +1,29 @@
+# backend/tests/test_data.py
+from conftest import make_frame, upload
+
+
+def _query(client, name, *filters):
+    query = "".join(f"&filter={f}" for f in filters)
+    return client.get(f"/data?filename={name}&limit=1000{query}")
+
+
+def test_filter_beyond_storage_width(client):
+    # age int8 olarak saklanır; bu aralığın dışındaki değerle filtre boş döner
+    name = upload(client, "filters.csv", make_frame(seed=31)).get_json()["filename"]
+    r = _query(client, name, "age:gt:300")
+    assert r.status_code == 200
+    assert r.get_json()["rows"] == []
+
+    r = _query(client, name, "age:lt:300")
+    assert r.get_json()["total_rows"] == 300
+    assert len(r.get_json()["rows"]) == 300
+
+    r = _query(client, name, "age:ge:50.5")
+    assert r.status_code == 200
+    assert all(row["age"] >= 51 for row in r.get_json()["rows"])
+
+
+def test_filter_with_bad_value(client):
+    name = upload(client, "filters_bad.csv", make_frame(seed=32)).get_json()["filename"]
+    r = _query(client, name, "age:gt:abc")
+    assert r.status_code == 400
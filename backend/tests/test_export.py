@@ -0,0 +1,50 @@
+# backend/tests/test_export.py
+import io
+import json
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from conftest import make_frame, upload
+
+
+@pytest.fixture
+def processed(client):
+    name = upload(client, "export.csv", make_frame(seed=41)).get_json()["filename"]
+    r = client.post("/preprocess", json={"filename": name, "options": {}})
+    return r.get_json()["download_name"]
+
+
+def _read(fmt, body):
+    if fmt == "csv":
+        return pd.read_csv(io.BytesIO(body))
+    if fmt == "json":
+        return pd.DataFrame(json.loads(body))
+    if fmt == "ndjson":
+        return pd.read_json(io.BytesIO(body), lines=True)
+    if fmt == "xlsx":
+        return pd.read_excel(io.BytesIO(body))
+    return pa.ipc.open_file(body).read_pandas()
+
+
+@pytest.mark.parametrize("fmt", ["csv", "json", "ndjson", "xlsx", "arrow"])
+def test_formats_round_trip(client, processed, fmt):
+    r = client.get(f"/download?filename={processed}&format={fmt}")
+    assert r.status_code == 200
+    df = _read(fmt, r.get_data())
+    assert list(df.columns) == ["age", "income", "city", "label"]
+    assert len(df) == 300
+
+    etag = r.headers["ETag"]
+    assert client.get(f"/download?filename={processed}&format={fmt}", headers={"If-None-Match": etag}).status_code == 304
+
+
+def test_stored_format_supports_range(client, processed):
+    r = client.get(f"/download?filename={processed}&format=arrow", headers={"Range": "bytes=0-9"})
+    assert r.status_code == 206
+    assert len(r.get_data()) == 10
+
+
+def test_unknown_format(client, processed):
+    assert client.get(f"/download?filename={processed}&format=pdf").status_code == 400
@@ -0,0 +1,79 @@
+# backend/tests/test_incremental.py
+import numpy as np
+import pandas as pd
+from sklearn.naive_bayes import GaussianNB
+
+import dataset_store
+from conftest import upload
+from dataset_store import write_dataset
+from incremental import evaluate_classification, fit_incremental, holdout_mask
+
+OPTS = {"model_type": "classification", "target": "label", "test_size": 0.3}
+
+
+def _frame(rows=400, seed=0):
+    rng = np.random.default_rng(seed)
+    x = rng.normal(size=rows)
+    return pd.DataFrame({"x": x, "label": (x > 0).astype("float64")})
+
+
+def test_missing_targets_are_skipped(tmp_path):
+    df = _frame()
+    df.loc[::7, "label"] = np.nan
+    path = write_dataset(df, str(tmp_path), "nan_target.csv")
+
+    model = fit_incremental(path, OPTS, GaussianNB())
+    metrics, cm, _ = evaluate_classification(path, OPTS, model, model.classes_)
+
+    known = df["label"].notna().to_numpy()
+    test = holdout_mask(np.arange(len(df)), OPTS["test_size"])
+    assert cm.sum() == int((known & test).sum())
+    assert metrics["accuracy"] > 0.9
+
+
+def test_holdout_labels_unknown_to_model_are_skipped(tmp_path):
+    df = _frame(seed=1)
+    test = holdout_mask(np.arange(len(df)), OPTS["test_size"])
+    # Yalnızca test satırlarında görülen iki etiket: biri sınıfların
+    # arasında, biri hepsinden büyük
+    df.loc[np.flatnonzero(test)[:3], "label"] = 0.5
+    df.loc[np.flatnonzero(test)[3:5], "label"] = 7.0
+    path = write_dataset(df, str(tmp_path), "holdout_only.csv")
+
+    model = GaussianNB().fit(df[["x"]][~test], df["label"][~test])
+    metrics, cm, _ = evaluate_classification(path, OPTS, model, model.classes_)
+
+    assert cm.shape == (2, 2)
+    assert cm.sum() == int(test.sum()) - 5
+    assert "5 test satırı" in metrics["info"]
+
+
+def test_out_of_core_training_end_to_end(client, monkeypatch):
+    # Küçük parçalar: eğitim ve değerlendirme gerçekten parça parça akar
+    monkeypatch.setattr(dataset_store, "CHUNK_ROWS", 64)
+    df = _frame(rows=1000, seed=2)
+    df.loc[::50, "label"] = np.nan
+    name = upload(client, "out_of_core.csv", df).get_json()["filename"]
+
+    body = {"filename": name, "target": "label", "outOfCore": True, "epochs": 3}
+    r = client.post("/train-models", json=dict(
+        body, modelType="classification", algorithms=["SGD", "NaiveBayes"],
+    ))
+    assert r.status_code == 200, r.get_json()
+    results = {res["algorithm"]: res for res in r.get_json()["results"]}
+    assert set(results) == {"SGD", "NaiveBayes"}
+    assert all(res["metrics"]["accuracy"] > 0.9 for res in results.values())
+
+    line = _frame(rows=1000, seed=3).drop(columns=["label"]).assign(y=lambda d: 3 * d["x"] + 1)
+    r = client.post("/train-models", json=dict(
+        body, filename=upload(client, "out_of_core_line.csv", line).get_json()["filename"],
+        target="y", modelType="regression", algorithms=["SGD"],
+    ))
+    assert r.status_code == 200, r.get_json()
+    assert r.get_json()["results"][0]["metrics"]["r2"] > 0.99
+
+    # partial_fit desteklemeyen algoritma açık bir hatayla reddedilir
+    r = client.post("/train-models", json=dict(
+        body, modelType="classification", algorithms=["RandomForest"],
+    ))
+    assert r.status_code == 400
@@ -0,0 +1,109 @@
+# backend/tests/test_jobs.py
+import os
+import threading
+
+from conftest import make_frame, upload
+
+
+def _prepare(client, name):
+    r = upload(client, name, make_frame())
+    assert r.status_code == 200
+    # Aynı içerik tekrar yüklenirse ilk adı döner
+    name = r.get_json()["filename"]
+    r = client.post("/preprocess", json={
+        "filename": name, "options": {"encodeCategorical": True}, "target_column": "label"
+    })
+    assert r.status_code == 200
+    return r.get_json()["download_name"]
+
+
+def _body(filename, algorithms):
+    return {"filename": filename, "modelType": "classification", "target": "label", "algorithms": algorithms}
+
+
+def _settle(job_id, timeout=60):
+    # İptal, çalışan görevler çıkınca tamamlanır
+    from jobs import job_manager
+    assert job_manager.get(job_id).wait(timeout)
+
+
+def test_submit_and_status(client):
+    name = _prepare(client, "jobs_status.csv")
+    r = client.post("/jobs", json=_body(name, ["DecisionTree", "NaiveBayes"]))
+    assert r.status_code == 202
+    job_id = r.get_json()["job_id"]
+
+    from jobs import job_manager
+    assert job_manager.get(job_id).wait(60)
+    status = client.get(f"/jobs/{job_id}").get_json()
+    assert status["status"] == "done"
+    assert status["progress"]["done"] == 2
+    assert [r["algorithm"] for r in status["results"]] == ["DecisionTree", "NaiveBayes"]
+
+
+def test_cancel_is_final(client):
+    name = _prepare(client, "jobs_cancel.csv")
+    r = client.post("/jobs", json=_body(name, ["RandomForest", "GradientBoosting", "KNN", "SVM"]))
+    job_id = r.get_json()["job_id"]
+
+    r = client.delete(f"/jobs/{job_id}")
+    assert r.status_code == 200
+    assert r.get_json()["status"] in ("cancelling", "cancelled")
+
+    _settle(job_id)
+    assert client.get(f"/jobs/{job_id}").get_json()["status"] == "cancelled"
+
+    from jobs import cancel_flag_path, read_snapshot
+    assert read_snapshot(job_id)["status"] == "cancelled"
+    assert not os.path.exists(cancel_flag_path(job_id))
+
+
+def test_cancel_stops_running_task_and_holds_slot(client, monkeypatch):
+    import jobs
+    from training import TrainingError, check_cancelled
+
+    started, release, stopped = threading.Event(), threading.Event(), []
+
+    def blocking_training(filepath, opts, algo):
+        # Bir aşamanın ortasında iptal edilen görev: aşama bitince bayrağı görür
+        started.set()
+        release.wait(30)
+        try:
+            check_cancelled(opts)
+        except TrainingError:
+            stopped.append(algo)
+            raise
+
+    name = _prepare(client, "jobs_running.csv")
+    monkeypatch.setattr(jobs, "train_algorithm", blocking_training)
+    monkeypatch.setattr(jobs.job_manager, "max_pending", 1)
+    job_id = client.post("/jobs", json=_body(name, ["DecisionTree"])).get_json()["job_id"]
+    try:
+        assert started.wait(30)
+        assert client.delete(f"/jobs/{job_id}").get_json()["status"] == "cancelling"
+        # Görev çıkana kadar havuzdaki yeri tutulur
+        assert client.post("/jobs", json=_body(name, ["NaiveBayes"])).status_code == 429
+    finally:
+        release.set()
+    _settle(job_id)
+    assert stopped == ["DecisionTree"]
+    assert client.get(f"/jobs/{job_id}").get_json()["status"] == "cancelled"
+
+
+def test_unknown_job(client):
+    assert client.get("/jobs/nope").status_code == 404
+    assert client.delete("/jobs/nope").status_code == 404
+
+
+def test_saturated_pool_returns_429(client, monkeypatch):
+    from jobs import job_manager
+    name = _prepare(client, "jobs_busy.csv")
+    monkeypatch.setattr(job_manager, "max_pending", 1)
+    first = client.post("/jobs", json=_body(name, ["RandomForest", "GradientBoosting"])).get_json()["job_id"]
+    try:
+        r = client.post("/jobs", json=_body(name, ["DecisionTree"]))
+        assert r.status_code == 429
+        assert int(r.headers["Retry-After"]) >= 1
+    finally:
+        client.delete(f"/jobs/{first}")
+        _settle(first)
@@ -0,0 +1,71 @@
+# backend/tests/test_model_store.py
+import os
+
+import numpy as np
+from sklearn.neighbors import KNeighborsClassifier
+from sklearn.tree import DecisionTreeClassifier
+
+import model_store
+from model_store import (
+    list_models, load_model_file, model_version, read_meta, resolve_model, save_model, version_path,
+)
+
+
+def _tree(seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(200, 3))
+    return DecisionTreeClassifier(random_state=0).fit(X, (X[:, 0] > 0).astype(int)), X
+
+
+def test_version_depends_on_data_params_and_training():
+    base = model_version("abc", "classification", "DecisionTree", {"max_depth": 5}, {"test_size": 0.2})
+    assert base == model_version("abc", "classification", "DecisionTree", {"max_depth": 5}, {"test_size": 0.2})
+    assert base != model_version("abd", "classification", "DecisionTree", {"max_depth": 5}, {"test_size": 0.2})
+    assert base != model_version("abc", "classification", "DecisionTree", {"max_depth": 6}, {"test_size": 0.2})
+    assert base != model_version("abc", "classification", "DecisionTree", {"max_depth": 5}, {"test_size": 0.3})
+
+
+def test_latest_version_is_resolved():
+    first, X = _tree(seed=1)
+    second, _ = _tree(seed=2)
+    save_model(first, "StoreTree", "classification", "a1", {"metrics": {"accuracy": 0.9}})
+    save_model(second, "StoreTree", "classification", "b2")
+
+    assert resolve_model("StoreTree", "classification") == version_path("StoreTree", "classification", "b2")
+    assert resolve_model("StoreTree", "classification", "a1") == version_path("StoreTree", "classification", "a1")
+    # Onaltılık olmayan sürüm yol olarak kullanılmaz
+    assert resolve_model("StoreTree", "classification", "../a1") is None
+
+    loaded = load_model_file(resolve_model("StoreTree", "classification", "a1"))
+    np.testing.assert_array_equal(loaded.predict(X), first.predict(X))
+
+    versions = [m["version"] for m in list_models("StoreTree", "classification")]
+    assert sorted(versions) == ["a1", "b2"]
+    assert read_meta(version_path("StoreTree", "classification", "a1"))["metrics"] == {"accuracy": 0.9}
+
+
+def test_uncompressed_arrays_are_memory_mapped():
+    # KNN eğitim verisini olduğu gibi tutar; sıkıştırmasızda dosyadan okunur
+    _, X = _tree(seed=3)
+    model = KNeighborsClassifier(algorithm="brute").fit(X, X[:, 0] > 0)
+    save_model(model, "StoreKNN", "classification", "c3")
+    save_model(model, "StoreKNN", "classification", "c4", compress=3)
+
+    mapped = load_model_file(version_path("StoreKNN", "classification", "c3"))
+    packed = load_model_file(version_path("StoreKNN", "classification", "c4"))
+    assert isinstance(mapped._fit_X, np.memmap)
+    assert not isinstance(packed._fit_X, np.memmap)
+    np.testing.assert_array_equal(mapped.predict(X), model.predict(X))
+    np.testing.assert_array_equal(packed.predict(X), model.predict(X))
+
+
+def test_prune_keeps_latest_version(monkeypatch):
+    for i, version in enumerate(["d1", "d2", "d3"]):
+        save_model(_tree(seed=i)[0], "StorePruned", "classification", version)
+    # Bütçe sıfır: son sürüm dışındakiler silinir
+    monkeypatch.setattr(model_store, "MODEL_STORE_MB", 0)
+    save_model(_tree(seed=9)[0], "StorePruned", "classification", "d4")
+
+    kept = [m["version"] for m in list_models("StorePruned", "classification")]
+    assert kept == ["d4"]
+    assert not os.path.exists(version_path("StorePruned", "classification", "d1"))
@@ -0,0 +1,74 @@
+# backend/tests/test_predict.py
+import io
+
+from conftest import make_frame, upload
+
+
+def _learnable(seed):
+    df = make_frame(rows=400, seed=seed)
+    df["label"] = (df["age"] > 50).astype(int)
+    return df
+
+
+def _train(client, df, name, algo="DecisionTree"):
+    # Yükle -> ön işle (kategorik kodlama) -> eğit; işlenmiş dosyanın adı döner
+    name = upload(client, name, df).get_json()["filename"]
+    r = client.post("/preprocess", json={
+        "filename": name, "options": {"encodeCategorical": True}, "target_column": "label"
+    })
+    processed = r.get_json()["download_name"]
+    r = client.post("/train-models", json={
+        "filename": processed, "modelType": "classification", "target": "label", "algorithms": [algo],
+    })
+    assert r.status_code == 200, r.get_json()
+    return processed
+
+
+def test_predict_rows_through_saved_pipeline(client):
+    df = _learnable(seed=41)
+    processed = _train(client, df, "predict_rows.csv")
+    rows = df.drop(columns=["label"]).head(50).to_dict(orient="records")
+
+    body = {"algo": "DecisionTree", "model_type": "classification", "filename": processed, "rows": rows}
+    first = client.post("/predict", json=body).get_json()
+    assert first["rows"] == 50
+    # Ham satırlar (metin "city") pipeline ile kodlanır; hedef yaşa bağlı
+    assert first["predictions"] == df["label"].head(50).tolist()
+    assert first["classes"] == [0, 1]
+    assert len(first["probabilities"]) == 50
+
+    second = client.post("/predict", json=body).get_json()
+    assert second["model_cached"]
+    assert second["predictions"] == first["predictions"]
+
+
+def test_predict_columns_and_file_agree(client):
+    df = _learnable(seed=42)
+    processed = _train(client, df, "predict_file.csv", algo="NaiveBayes")
+    X = df.drop(columns=["label"]).head(30)
+
+    by_columns = client.post("/predict", json={
+        "algo": "NaiveBayes", "model_type": "classification", "filename": processed,
+        "columns": X.to_dict(orient="list"),
+    }).get_json()
+    by_file = client.post("/predict", data={
+        "algo": "NaiveBayes", "model_type": "classification", "filename": processed,
+        "file": (io.BytesIO(X.to_csv(index=False).encode()), "rows.csv"),
+    }, content_type="multipart/form-data").get_json()
+    assert by_file["rows"] == by_columns["rows"] == 30
+    assert by_file["predictions"] == by_columns["predictions"]
+
+
+def test_predict_errors(client):
+    df = _learnable(seed=43)
+    processed = _train(client, df, "predict_errors.csv")
+
+    r = client.post("/predict", json={"algo": "DecisionTree"})
+    assert r.status_code == 400
+    r = client.post("/predict", json={"algo": "NoSuchModel", "model_type": "classification", "rows": [{}]})
+    assert r.status_code == 404
+    r = client.post("/predict", json={
+        "algo": "DecisionTree", "model_type": "classification", "filename": processed, "rows": [{"age": 30}],
+    })
+    assert r.status_code == 400
+    assert r.get_json()["error"].startswith("Kolon bulunamadı")
@@ -0,0 +1,43 @@
+# backend/tests/test_profiling.py
+import io
+
+import numpy as np
+import pandas as pd
+
+import dataset_store
+from conftest import make_frame, upload
+from profiling import ColumnProfile, DatasetProfile
+
+
+def test_mixed_chunk_kinds_drop_levels():
+    col = ColumnProfile("v")
+    col.update(pd.Series(["x", "y", "x", "y"]))
+    col.update(pd.Series([1, 2]))
+    assert col.kind == "str"
+    assert col.levels is None
+
+
+def test_chunked_profile_matches_pandas():
+    df = make_frame(rows=500, seed=51)
+    profile = DatasetProfile()
+    for start in range(0, len(df), 64):
+        profile.update(df.iloc[start:start + 64])
+    age = profile.columns["age"]
+    assert age.count == 500
+    assert np.isclose(age.mean, df["age"].mean())
+    assert np.isclose(age.describe()["std"], df["age"].std())
+    assert (age.min, age.max) == (df["age"].min(), df["age"].max())
+    assert profile.columns["city"].levels == {"a", "b", "c"}
+
+
+def test_upload_text_then_numbers_across_chunks(client, monkeypatch):
+    monkeypatch.setattr(dataset_store, "CHUNK_ROWS", 4)
+    # Az farklı değer -> sözlük kolonu; son parça sayı olarak ayrıştırılır
+    values = ["x", "y"] * 4 + ["1", "2"] * 2
+    text = "v,n\n" + "".join(f"{v},{i}\n" for i, v in enumerate(values))
+    body = {"file": (io.BytesIO(text.encode()), "mixed_chunks.csv")}
+    r = client.post("/analyze", data=body, content_type="multipart/form-data")
+    assert r.status_code == 200, r.get_json()
+
+    rows = client.get(f"/data?filename={r.get_json()['filename']}").get_json()["rows"]
+    assert [str(row["v"]) for row in rows] == values
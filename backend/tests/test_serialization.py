@@ -0,0 +1,47 @@
+# backend/tests/test_serialization.py
+import gzip
+import json
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from conftest import upload
+
+
+def _dataset(client, name):
+    df = pd.DataFrame({
+        "n": np.arange(6000),
+        "f": np.where(np.arange(6000) % 5 == 0, np.nan, 0.5),
+        "s": ["x", None, "ğü"] * 2000,
+    })
+    return upload(client, name, df).get_json()["filename"]
+
+
+def test_records_json_nulls(client):
+    name = _dataset(client, "ser.csv")
+    rows = client.get(f"/data?filename={name}&limit=3").get_json()["rows"]
+    assert rows == [{"n": 0, "f": None, "s": "x"}, {"n": 1, "f": 0.5, "s": None}, {"n": 2, "f": 0.5, "s": "ğü"}]
+
+
+def test_column_layout(client):
+    name = _dataset(client, "ser.csv")
+    body = client.get(f"/data?filename={name}&limit=3&layout=columns").get_json()["rows"]
+    assert body == {"columns": ["n", "f", "s"], "data": [[0, 1, 2], [None, 0.5, 0.5], ["x", None, "ğü"]]}
+
+
+def test_arrow_negotiation(client):
+    name = _dataset(client, "ser.csv")
+    r = client.get(f"/data?filename={name}&limit=10", headers={"Accept": "application/vnd.apache.arrow.stream"})
+    assert r.mimetype == "application/vnd.apache.arrow.stream"
+    table = pa.ipc.open_stream(r.get_data()).read_all()
+    assert table.num_rows == 10
+    assert json.loads(table.schema.metadata[b"lebb"])["total_rows"] == 6000
+
+
+def test_large_body_is_streamed_and_compressed(client):
+    name = _dataset(client, "ser.csv")
+    r = client.get(f"/data?filename={name}&limit=6000", headers={"Accept-Encoding": "gzip"}, buffered=False)
+    assert r.is_streamed
+    assert r.headers["Content-Encoding"] == "gzip"
+    assert len(json.loads(gzip.decompress(r.get_data()))["rows"]) == 6000
@@ -0,0 +1,54 @@
+# backend/tests/test_training.py
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.base import BaseEstimator
+
+from training import cross_validate_oof
+
+
+class SignLabels(BaseEstimator):
+    # Negatif girdiye kısa, diğerlerine uzun etiket; her kat kendi
+    # genişliğinde (<U1 / <U6) dizi döner
+
+    def fit(self, X, y):
+        return self
+
+    def predict(self, X):
+        return np.array(["a" if v < 0 else "bbbbbb" for v in X["x"]])
+
+
+def test_oof_keeps_wider_labels_from_later_folds():
+    x = np.r_[-np.ones(10), np.ones(20)]
+    X = pd.DataFrame({"x": x})
+    y = np.where(x < 0, "a", "bbbbbb")
+
+    result = cross_validate_oof(SignLabels(), X, y, 3, {"accuracy": "accuracy"})
+
+    np.testing.assert_array_equal(result["oof_pred"], y)
+    assert [m["accuracy"] for m in result["fold_metrics"]] == [1.0, 1.0, 1.0]
+
+
+class CountingFits(SignLabels):
+    fits = 0
+
+    def fit(self, X, y):
+        CountingFits.fits += 1
+        return self
+
+
+def test_cv_check_stops_between_folds():
+    X = pd.DataFrame({"x": np.r_[-np.ones(10), np.ones(20)]})
+    y = np.where(X["x"] < 0, "a", "bbbbbb")
+    calls = []
+
+    def check():
+        # İkinci kat grubundan önce iptal
+        calls.append(1)
+        if len(calls) > 1:
+            raise RuntimeError("iptal")
+
+    CountingFits.fits = 0
+    with pytest.raises(RuntimeError):
+        cross_validate_oof(CountingFits(), X, y, 3, {"accuracy": "accuracy"}, n_jobs=1, check=check)
+    assert CountingFits.fits == 1
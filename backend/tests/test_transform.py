@@ -0,0 +1,67 @@
+# backend/tests/test_transform.py
+import io
+
+import pandas as pd
+
+from conftest import make_frame, upload
+
+
+def _fit(client, name, df, options):
+    r = upload(client, name, df)
+    assert r.status_code == 200
+    name = r.get_json()["filename"]
+    r = client.post("/preprocess", json={"filename": name, "options": options, "target_column": "label"})
+    assert r.status_code == 200
+    return name, r.get_json()
+
+
+def _transform(client, pipeline, name, df):
+    body = {"filename": pipeline, "file": (io.BytesIO(df.to_csv(index=False).encode()), name)}
+    return client.post("/transform", data=body, content_type="multipart/form-data")
+
+
+def _download(client, name):
+    r = client.get(f"/download?filename={name}&format=csv")
+    assert r.status_code == 200
+    return pd.read_csv(io.BytesIO(r.get_data()))
+
+
+def test_round_trip_matches_preprocess(client):
+    df = make_frame(seed=21)
+    name, fitted = _fit(client, "rt.csv", df, {"encodeCategorical": True, "standardize": True})
+
+    r = _transform(client, name, "rt_new.csv", df)
+    assert r.status_code == 200
+    assert r.get_json()["row_count"] == len(df)
+
+    expected = _download(client, fitted["download_name"])
+    actual = _download(client, r.get_json()["download_name"])
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+
+
+def test_values_outside_training_range(client):
+    # Eğitim verisinde age int8'e sığar; yeni dosyadaki büyük değerler de yazılmalı
+    df = make_frame(seed=22)
+    name, fitted = _fit(client, "wide.csv", df, {"encodeCategorical": True})
+
+    new = make_frame(seed=23)
+    new["age"] = new["age"] + 500
+    new.loc[0, "income"] = 123456789.125
+    r = _transform(client, name, "wide_new.csv", new)
+    assert r.status_code == 200, r.get_json()
+
+    out = _download(client, r.get_json()["download_name"])
+    assert out["age"].min() >= 518
+    assert out["income"].max() == 123456789.125
+
+
+def test_incompatible_values_are_a_client_error(client):
+    df = make_frame(seed=24)
+    name, fitted = _fit(client, "bad.csv", df, {})
+
+    new = make_frame(seed=25)
+    new["age"] = new["age"].astype(str)
+    new.loc[0, "age"] = "yaşlı"
+    r = _transform(client, name, "bad_new.csv", new)
+    assert r.status_code == 400
+    assert "error" in r.get_json()
@@ -0,0 +1,69 @@
+# backend/tests/test_tuning.py
+from conftest import make_frame, upload
+from jobs import job_manager
+from tuning import candidates, rung_rows
+
+
+def _learnable(seed):
+    # Hedef yaşa bağlı; ağaç derinliği skoru gerçekten etkiler
+    df = make_frame(rows=600, seed=seed)
+    df["label"] = ((df["age"] > 50) ^ (df["income"] > 55_000)).astype(int)
+    return df
+
+
+def test_rung_rows_grow_by_eta():
+    rows = rung_rows(8100, 27, 3)
+    assert rows == [300, 900, 2700, 8100]
+    # Küçük veride ilk tur en az TUNE_MIN_ROWS (ya da tüm veri)
+    assert rung_rows(150, 27, 3) == [150]
+    assert rung_rows(1000, 1, 3) == [1000]
+
+
+def test_candidates_keep_fixed_params():
+    opts = {
+        "model_type": "classification", "candidates": 20, "space": {},
+        "params": {"DecisionTree": {"random_state": 0}},
+    }
+    configs = candidates(opts, "DecisionTree")
+    # Uzay 5 x 4; tekrarlar atılır, sabit parametre her adayda
+    assert len(configs) == 20
+    assert all(c["random_state"] == 0 for c in configs)
+    assert len({tuple(sorted(c.items(), key=str)) for c in configs}) == 20
+
+
+def test_tune_ranks_candidates_and_trains_best(client):
+    r = upload(client, "tune.csv", _learnable(seed=31))
+    name = r.get_json()["filename"]
+    r = client.post("/preprocess", json={
+        "filename": name, "options": {"encodeCategorical": True}, "target_column": "label"
+    })
+    name = r.get_json()["download_name"]
+
+    r = client.post("/tune", json={
+        "filename": name, "modelType": "classification", "target": "label",
+        "algorithms": ["DecisionTree"], "candidates": 8, "eta": 2,
+        "params": {"DecisionTree": {"random_state": 0}},
+    })
+    assert r.status_code == 202
+    job_id = r.get_json()["job_id"]
+    assert job_manager.get(job_id).wait(120)
+
+    status = client.get(f"/jobs/{job_id}").get_json()
+    assert status["status"] == "done"
+    board = status["leaderboard"]
+    assert len(board) == 8
+    # Son turdakiler (en çok satır) önde ve kendi aralarında skora göre sıralı
+    top = [e for e in board if e["rows"] == board[0]["rows"]]
+    assert [e["score"] for e in top] == sorted((e["score"] for e in top), reverse=True)
+    assert board[0]["rows"] > board[-1]["rows"]
+
+    result = status["results"][0]
+    assert result["algorithm"] == "DecisionTree"
+    assert result["bestParams"] == board[0]["params"]
+
+
+def test_tune_rejects_clustering(client):
+    r = client.post("/tune", json={
+        "filename": "x.csv", "modelType": "clustering", "algorithms": ["KMeans"],
+    })
+    assert r.status_code == 400
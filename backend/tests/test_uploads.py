@@ -0,0 +1,73 @@
+# backend/tests/test_uploads.py
+import os
+
+import pytest
+
+import dataset_store
+import uploads
+from conftest import DATA_DIR, make_frame, upload
+
+
+def _listing(root):
+    return {os.path.relpath(os.path.join(d, f), root) for d, _, files in os.walk(root) for f in files}
+
+
+def test_traversal_name_stays_in_upload_folder(client):
+    parent = os.path.dirname(DATA_DIR)
+    before = set(os.listdir(parent))
+    r = upload(client, "../../escaped.csv", make_frame(seed=11))
+    assert r.status_code == 200
+    assert r.get_json()["filename"] == "escaped.csv"
+    assert set(os.listdir(parent)) == before
+    assert "uploads/escaped.csv.arrow" in _listing(DATA_DIR)
+
+
+def test_name_without_usable_characters_is_rejected(client):
+    # Temizlenince uzantısı da giden ad ("csv") kabul edilmez
+    r = upload(client, ".. .csv", make_frame(seed=12))
+    assert r.status_code == 400
+    assert r.get_json()["error"] == "Geçersiz dosya adı."
+
+
+def test_same_content_is_deduplicated(client):
+    df = make_frame(seed=13)
+    first = upload(client, "dup.csv", df).get_json()
+    second = upload(client, "dup_again.csv", df).get_json()
+    assert not first["duplicate"]
+    assert second["duplicate"]
+    assert second["filename"] == "dup.csv"
+
+
+def test_name_clash_gets_unique_name(client):
+    first = upload(client, "clash.csv", make_frame(seed=14)).get_json()
+    second = upload(client, "clash.csv", make_frame(seed=15)).get_json()
+    assert first["filename"] == "clash.csv"
+    assert second["filename"].startswith("clash_") and second["filename"].endswith(".csv")
+    assert not second["duplicate"]
+
+
+def _failing_write(self, chunk):
+    raise ValueError("yazım hatası")
+
+
+def test_failed_ingest_does_not_publish_store(tmp_path, monkeypatch):
+    raw = tmp_path / "broken.csv"
+    make_frame(seed=16).to_csv(raw, index=False)
+    monkeypatch.setattr(dataset_store.DatasetWriter, "write_frame", _failing_write)
+    with pytest.raises(ValueError):
+        dataset_store.ingest_file(str(raw))
+    assert sorted(os.listdir(tmp_path)) == ["broken.csv"]
+
+
+
+def _failing_index(index):
+    raise OSError("disk dolu")
+
+
+def test_failed_upload_leaves_no_files(client, monkeypatch):
+    # Depo kopyası ve profili yazıldıktan sonra indeks kaydı başarısız olur
+    before = _listing(DATA_DIR)
+    monkeypatch.setattr(uploads, "_write_index", _failing_index)
+    r = upload(client, "fails.csv", make_frame(seed=17))
+    assert r.status_code >= 400
+    assert _listing(DATA_DIR) - before == set()
@@ -0,0 +1,599 @@
+# backend/training.py
+import pandas as pd
+import os
+import numpy as np
+from sklearn.base import is_classifier
+from sklearn.model_selection import check_cv, train_test_split, cross_validate
+
+from sklearn.metrics import (
+    accuracy_score, precision_score, recall_score, f1_score,
+    confusion_matrix, roc_curve, auc, mean_squared_error, r2_score
+)
+# Kümeleme metrikleri
+from sklearn.metrics import (
+    silhouette_score, calinski_harabasz_score, davies_bouldin_score
+)
+
+from sklearn.ensemble import (
+    RandomForestClassifier, RandomForestRegressor, GradientBoostingClassifier, GradientBoostingRegressor
+)
+from sklearn.linear_model import LogisticRegression, LinearRegression, Ridge, Lasso, SGDClassifier, SGDRegressor
+from sklearn.tree import DecisionTreeClassifier, DecisionTreeRegressor
+from sklearn.neighbors import KNeighborsClassifier, KNeighborsRegressor
+from sklearn.svm import SVC, SVR
+from sklearn.naive_bayes import GaussianNB
+from sklearn.cluster import KMeans, DBSCAN, AgglomerativeClustering
+
+import time
+
+from clustering import CLUSTER_TIMEOUT, ClusteringTimeout, scalable_model, silhouette_sample
+from dataset_store import dataset_cache, read_dataset
+from incremental import (
+    OOC_EPOCHS, evaluate_classification, evaluate_clustering, evaluate_regression, fit_incremental,
+    incremental_model
+)
+from model_store import cached_result, model_version, save_model as store_model
+from aggregation import MAX_POINTS, sample_indices, to_list
+from plots import register as register_plot
+from telemetry import collect, record, span
+
+CLF_MAP = {
+    "classification": {
+        "RandomForest": RandomForestClassifier,
+        "LogisticRegression": LogisticRegression,
+        "DecisionTree": DecisionTreeClassifier,
+        "KNN": KNeighborsClassifier,
+        "SVM": SVC,
+        "NaiveBayes": GaussianNB,
+        "GradientBoosting": GradientBoostingClassifier,
+        "SGD": SGDClassifier,
+    },
+    "regression": {
+        "LinearRegression": LinearRegression,
+        "RandomForest": RandomForestRegressor,
+        "DecisionTree": DecisionTreeRegressor,
+        "KNN": KNeighborsRegressor,
+        "SVR": SVR,
+        "Ridge": Ridge,
+        "Lasso": Lasso,
+        "GradientBoosting": GradientBoostingRegressor,
+        "SGD": SGDRegressor,
+    },
+    "clustering": {
+        "KMeans": KMeans,
+        "DBSCAN": DBSCAN,
+        "AgglomerativeClustering": AgglomerativeClustering,
+    }
+}
+
+# Aynı anahtarla eğitilmiş sonuçlar model deposundan döner (LEBB_RESULT_CACHE=0 kapatır)
+CACHE_RESULTS = os.environ.get("LEBB_RESULT_CACHE", "1") != "0"
+
+# n_jobs ile çok çekirdek kullanabilen tahmin ediciler
+PARALLEL_ESTIMATORS = (
+    RandomForestClassifier, RandomForestRegressor, KNeighborsClassifier, KNeighborsRegressor, DBSCAN
+)
+
+class TrainingError(Exception):
+    # İstemci hatası (4xx); işlem havuzundan geri taşınabilmesi için
+    # argümanlar Exception.args içinde tutulur.
+
+    def __init__(self, message, status=400):
+        super().__init__(message, status)
+        self.message = message
+        self.status = status
+
+    def __str__(self):
+        return self.message
+
+
+def check_cancelled(opts):
+    # İş iptal edildiyse (jobs.py bayrak dosyası) sonraki aşamaya geçilmez;
+    # işçi süreçleri iptali bu dosyadan görür
+    flag = opts.get("cancel_flag")
+    if flag and os.path.exists(flag):
+        raise TrainingError("Eğitim iptal edildi.", 409)
+
+# ----------------------------
+# Yardımcılar
+# ----------------------------
+def generate_classification_plots(y_true, y_pred, y_prob=None):
+    plots = {}
+
+    # Confusion Matrix
+    labels = np.unique(np.concatenate([np.asarray(y_true), np.asarray(y_pred)]))
+    cm = confusion_matrix(y_true, y_pred, labels=labels)
+    plots["confusion_matrix"] = register_plot(
+        "confusion_matrix", {"labels": to_list(labels), "matrix": cm.tolist()}
+    )
+
+    # ROC (binary ise)
+    if y_prob is not None and len(np.unique(y_true)) == 2:
+        plots["roc_curve"] = generate_roc_plot(y_true, y_prob)
+
+    return plots
+
+def generate_roc_plot(y_true, y_prob):
+    fpr, tpr, _ = roc_curve(y_true, y_prob)
+    roc_auc = auc(fpr, tpr)
+    idx = np.unique(np.linspace(0, len(fpr) - 1, min(len(fpr), MAX_POINTS)).astype(int))
+    return register_plot(
+        "roc_curve", {"fpr": to_list(fpr[idx]), "tpr": to_list(tpr[idx]), "auc": float(roc_auc)}
+    )
+
+def generate_regression_scatter(y_true, y_pred):
+    y_true, y_pred = np.asarray(y_true), np.asarray(y_pred)
+    idx = sample_indices(len(y_true))
+    return register_plot(
+        "regression_scatter", {"y_true": to_list(y_true[idx]), "y_pred": to_list(y_pred[idx])}
+    )
+
+def generate_importance_plot(features, importances):
+    return register_plot(
+        "feature_importance", {"features": [str(f) for f in features], "importances": to_list(importances)}
+    )
+
+def model_key(algo, filepath, opts, params):
+    # Sürüm/önbellek anahtarı: (veri seti özeti, model türü, algoritma,
+    # varsayılanlar uygulanmış parametreler, eğitim ayarları)
+    digest = opts.get("dataset_digest") or dataset_cache.digest(filepath)
+    # Yalnızca fit'i etkileyen ayarlar: CV kapalıyken kat sayısı, açıkken
+    # test oranı, kümelemede hiçbiri anahtara girmez
+    if opts.get("out_of_core"):
+        training = {"out_of_core": True, "epochs": opts["epochs"]}
+        if opts["model_type"] != "clustering":
+            training.update(target=opts["target"], test_size=opts["test_size"])
+    elif opts["model_type"] == "clustering":
+        training = {}
+    elif opts["cv_enabled"]:
+        training = {"target": opts["target"], "cv_folds": opts["cv_folds"]}
+    else:
+        training = {"target": opts["target"], "test_size": opts["test_size"]}
+    return digest, training, model_version(digest, opts["model_type"], algo, params, training)
+
+def load_cached_result(algo, model_type, version):
+    result = cached_result(algo, model_type, version)
+    if result is None:
+        return None
+    # Grafik tanımları bütçe nedeniyle silinmiş olabilir; aynı kimlikle yeniden yazılır
+    for ref in result["plots"] + [result["importancePlot"]]:
+        if ref:
+            register_plot(ref["kind"], ref["data"])
+    return dict(result, cached=True)
+
+def save_model(model, algo, model_type, key, params, result, train_seconds):
+    # Kaydetme hatası yutulmaz; sonuç indirilemeyecek bir modeli göstermesin.
+    digest, training, version = key
+    try:
+        store_model(model, algo, model_type, version, {
+            "dataset_digest": digest,
+            "params": params,
+            "training": training,
+            "metrics": result["metrics"],
+            "train_seconds": round(train_seconds, 3),
+            "result": result,
+        })
+    except OSError as e:
+        raise TrainingError(f"Model kaydedilemedi: {e}", 500)
+
+def _cross_validate(model, X, y, cv_folds, scoring, n_jobs, check):
+    # check verilirse katlar n_jobs'lık gruplar halinde çalıştırılır ve her
+    # gruptan önce çağrılır (ör. iptal denetimi); sonuç cross_validate ile aynı
+    kwargs = dict(scoring=scoring, n_jobs=n_jobs, return_estimator=True, return_indices=True)
+    if check is None:
+        return cross_validate(model, X, y, cv=cv_folds, **kwargs)
+    splits = list(check_cv(cv_folds, y, classifier=is_classifier(model)).split(X, y))
+    step = max(1, n_jobs if n_jobs and n_jobs > 0 else len(splits))
+    scores = {}
+    for start in range(0, len(splits), step):
+        check()
+        part = cross_validate(model, X, y, cv=splits[start:start + step], **kwargs)
+        for key, value in part.items():
+            if key == "indices":
+                merged = scores.setdefault(key, {"train": [], "test": []})
+                for side in merged:
+                    merged[side].extend(value[side])
+            elif key == "estimator":
+                scores.setdefault(key, []).extend(value)
+            else:
+                scores[key] = np.concatenate([scores[key], value]) if key in scores else value
+    return scores
+
+def cross_validate_oof(model, X, y, cv_folds, scoring, n_jobs=1, with_proba=False, check=None):
+    # Tek geçişte k katlı CV: kat skorları, katlarda eğitilmiş modeller ve
+    # katlar dışı (OOF) tahminler. Tam veride ayrıca fit edilmez (k+1 yerine k).
+    scores = _cross_validate(model, X, y, cv_folds, scoring, n_jobs, check)
+    estimators = scores["estimator"]
+    test_folds = scores["indices"]["test"]
+    classes = np.unique(y) if with_proba else None
+
+    oof_prob = None
+    preds = []
+    for est, test_idx in zip(estimators, test_folds):
+        X_test = X.iloc[test_idx]
+        preds.append(est.predict(X_test))
+        if with_proba:
+            if oof_prob is None:
+                oof_prob = np.zeros((len(X), len(classes)))
+            # Katta eksik sınıf olabilir; sütunlar genel sınıf sırasına yerleşir
+            cols = np.searchsorted(classes, est.classes_)
+            oof_prob[np.ix_(test_idx, cols)] = est.predict_proba(X_test)
+
+    # Tür tüm katlardan belirlenir; sonraki katlardaki daha uzun etiketler kırpılmaz
+    oof_pred = np.empty(len(X), dtype=np.result_type(*preds))
+    for pred, test_idx in zip(preds, test_folds):
+        oof_pred[test_idx] = pred
+
+    # Skorlar "neg_" ise işaret çevrilir
+    fold_metrics = []
+    for i in range(len(estimators)):
+        row = {"fold": i + 1}
+        for name, scorer in scoring.items():
+            value = scores[f"test_{name}"][i]
+            row[name] = round(float(-value if scorer.startswith("neg_") else value), 4)
+        fold_metrics.append(row)
+
+    first = next(iter(scoring))
+    best = int(np.argmax(scores[f"test_{first}"]))
+
+    importances = None
+    if all(hasattr(est, "feature_importances_") for est in estimators):
+        importances = np.mean([est.feature_importances_ for est in estimators], axis=0)
+
+    return {
+        "scores": scores,
+        "fold_metrics": fold_metrics,
+        "estimators": estimators,
+        "best_estimator": estimators[best],
+        "oof_pred": oof_pred,
+        "oof_prob": oof_prob,
+        "importances": importances,
+    }
+
+def training_options(data):
+    return {
+        "filename": data.get("filename"),
+        "model_type": data.get("modelType"),
+        "algorithms": data.get("algorithms", []),
+        "params": data.get("params", {}),
+        "target": data.get("target"),
+        "test_size": float(data.get("testSize", 0.2)),
+        "cv_enabled": data.get("cvEnabled", False),
+        "cv_folds": int(data.get("cvFolds", 5)),
+        "out_of_core": bool(data.get("outOfCore", False)),
+        "epochs": int(data.get("epochs", OOC_EPOCHS)),
+    }
+
+def resolve_params(algo, params, model_type=None):
+    params = dict(params)
+    if algo in ["RandomForest", "GradientBoosting"]:
+        params.setdefault("n_estimators", 100)
+        params.setdefault("random_state", 42)
+    if algo == "LogisticRegression":
+        params.setdefault("max_iter", 1000)
+        params.setdefault("solver", "lbfgs")
+    if algo == "DecisionTree":
+        params.setdefault("max_depth", 5)
+    if algo == "KNN":
+        params.setdefault("n_neighbors", 5)
+    if algo in ["SVM", "SVR"]:
+        params.setdefault("kernel", "rbf")
+        params.setdefault("C", 1)
+    if algo in ["Ridge", "Lasso"]:
+        params.setdefault("alpha", 1)
+    if algo == "KMeans":
+        params.setdefault("n_clusters", 4)  # daha güvenli başlangıç
+        params.setdefault("random_state", 42)
+    if algo == "DBSCAN":
+        params.setdefault("eps", 0.5)
+    if algo == "AgglomerativeClustering":
+        params.setdefault("n_clusters", 2)
+    if algo == "SGD":
+        params.setdefault("random_state", 42)
+        if model_type == "classification":
+            params.setdefault("loss", "log_loss")  # predict_proba için
+    return params
+
+# ----------------------------
+# Tek algoritma eğitimi
+# ----------------------------
+def train_algorithm(filepath, opts, algo):
+    # İşlem havuzunda da çalışır: veri seti yol üzerinden işçinin kendi
+    # önbelleğinden okunur. Aşama süreleri sonuçla birlikte döner
+    # ("timings"); ana süreç bunları /metrics'e ekler.
+    with collect() as spans:
+        result = _train_algorithm(filepath, opts, algo)
+    return dict(result, timings=spans) if result is not None else None
+
+def _record_folds(algo, scores):
+    # cross_validate kat başına fit/skor sürelerini zaten ölçüyor
+    for i, (fit_time, score_time) in enumerate(zip(scores["fit_time"], scores["score_time"])):
+        record("cv_fold", fit_time + score_time, algorithm=algo, fold=i + 1)
+
+def _train_algorithm(filepath, opts, algo):
+    model_type = opts["model_type"]
+    target = opts["target"]
+    test_size = opts["test_size"]
+    cv_enabled = opts["cv_enabled"]
+    cv_folds = opts["cv_folds"]
+
+    ModelClass = CLF_MAP.get(model_type, {}).get(algo)
+    if not ModelClass:
+        return None
+
+    params = resolve_params(algo, dict(opts["params"].get(algo, {})), model_type)
+
+    # Aynı veri + parametrelerle eğitilmiş sürüm varsa yeniden fit edilmez
+    key = model_key(algo, filepath, opts, params)
+    if CACHE_RESULTS:
+        with span("cache", algorithm=algo):
+            result = load_cached_result(algo, model_type, key[2])
+        if result is not None:
+            return result
+
+    check_cancelled(opts)
+    started = time.perf_counter()
+    if opts.get("out_of_core"):
+        model, metrics, plots = train_out_of_core(filepath, opts, algo, params)
+        return finish_training(model, algo, model_type, key, params, started, metrics, plots)
+
+    df = read_dataset(filepath)
+
+    # X, y (clustering hariç)
+    if model_type in ["classification", "regression"]:
+        if target not in df.columns:
+            raise TrainingError("Hedef kolon bulunamadı.")
+        X = df.drop(columns=[target])
+        y = df[target]
+
+    metrics = {}
+    fold_metrics = None
+    plots = []
+    importance_plot = None
+
+    model = ModelClass(**params)
+    check_cancelled(opts)
+
+    # CV açıksa çekirdekler katlara, değilse tahmin ediciye verilir
+    n_jobs = opts.get("n_jobs", 1)
+    cv_jobs = n_jobs if cv_enabled else 1
+    if ModelClass in PARALLEL_ESTIMATORS and "n_jobs" not in params:
+        model.set_params(n_jobs=1 if cv_enabled else n_jobs)
+
+    # -------- Classification --------
+    if model_type == "classification":
+        if cv_enabled:
+            scoring = {
+                "accuracy": "accuracy",
+                "precision": "precision_weighted",
+                "recall": "recall_weighted",
+                "f1": "f1_weighted"
+            }
+            with span("cross_validate", algorithm=algo):
+                cv = cross_validate_oof(
+                    model, X, y, cv_folds, scoring, cv_jobs, with_proba=hasattr(model, "predict_proba"),
+                    check=lambda: check_cancelled(opts)
+                )
+            _record_folds(algo, cv["scores"])
+            metrics = {k: round(np.mean(cv["scores"][f"test_{k}"]), 4) for k in scoring}
+            fold_metrics = cv["fold_metrics"]
+
+            # Metrik ve grafikler katlar dışı tahminlerden; tam veride ek fit yok
+            model = cv["best_estimator"]
+            y_pred = cv["oof_pred"]
+            y_prob = cv["oof_prob"][:, 1] if cv["oof_prob"] is not None and cv["oof_prob"].shape[1] == 2 else None
+            plots_dict = generate_classification_plots(y, y_pred, y_prob)
+            plots = list(plots_dict.values())
+
+            if cv["importances"] is not None:
+                importance_plot = generate_importance_plot(X.columns, cv["importances"])
+
+        else:
+            X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=test_size, random_state=42)
+            with span("fit", algorithm=algo):
+                model.fit(X_train, y_train)
+            y_pred = model.predict(X_test)
+            y_prob = model.predict_proba(X_test)[:, 1] if hasattr(model, "predict_proba") else None
+
+            metrics = {
+                "accuracy": round(accuracy_score(y_test, y_pred), 4),
+                "precision": round(precision_score(y_test, y_pred, average="weighted", zero_division=0), 4),
+                "recall": round(recall_score(y_test, y_pred, average="weighted", zero_division=0), 4),
+                "f1": round(f1_score(y_test, y_pred, average="weighted", zero_division=0), 4)
+            }
+
+            plots_dict = generate_classification_plots(y_test, y_pred, y_prob)
+            plots = list(plots_dict.values())
+
+            if hasattr(model, "feature_importances_"):
+                importance_plot = generate_importance_plot(X.columns, model.feature_importances_)
+
+    # -------- Regression --------
+    elif model_type == "regression":
+        if cv_enabled:
+            scoring = {"r2": "r2", "mse": "neg_mean_squared_error"}
+            with span("cross_validate", algorithm=algo):
+                cv = cross_validate_oof(model, X, y, cv_folds, scoring, cv_jobs, check=lambda: check_cancelled(opts))
+            _record_folds(algo, cv["scores"])
+            y_pred = cv["oof_pred"]
+            metrics = {
+                "r2": round(r2_score(y, y_pred), 4),
+                "mse": round(mean_squared_error(y, y_pred), 4),
+                "rmse": round(np.sqrt(mean_squared_error(y, y_pred)), 4)
+            }
+            fold_metrics = cv["fold_metrics"]
+            scatter = generate_regression_scatter(y, y_pred)
+            plots = [scatter]
+
+            model = cv["best_estimator"]
+            importances = cv["importances"]
+
+        else:
+            X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=test_size, random_state=42)
+            with span("fit", algorithm=algo):
+                model.fit(X_train, y_train)
+            y_pred = model.predict(X_test)
+            metrics = {
+                "r2": round(r2_score(y_test, y_pred), 4),
+                "mse": round(mean_squared_error(y_test, y_pred), 4),
+                "rmse": round(np.sqrt(mean_squared_error(y_test, y_pred)), 4)
+            }
+            scatter = generate_regression_scatter(y_test, y_pred)
+            plots = [scatter]
+            importances = getattr(model, "feature_importances_", None)
+
+        if importances is not None:
+            importance_plot = generate_importance_plot(X.columns, importances)
+
+    # -------- Clustering --------
+    elif model_type == "clustering":
+        # Sayısal kolonlar
+        X_all = df.select_dtypes(include=["number"]).fillna(0)
+        if X_all.shape[1] == 0:
+            raise TrainingError("Kümeleme için sayısal kolon bulunamadı.")
+
+        # Büyük veride ölçeklenebilir eşdeğer: mini-batch, parçalı DBSCAN, örneklem + atama
+        scalable = scalable_model(algo, params, len(X_all), n_jobs)
+        if scalable is not None:
+            model = scalable
+        try:
+            with span("fit", algorithm=algo):
+                model.fit(X_all)
+        except ClusteringTimeout:
+            raise TrainingError(f"{algo} kümeleme süre sınırını ({CLUSTER_TIMEOUT:g} sn) aştı.")
+
+        labels = getattr(model, "labels_", None)
+        if labels is None and hasattr(model, "predict"):
+            try:
+                labels = model.predict(X_all)
+            except Exception:
+                labels = None
+
+        n_clusters = None
+        if labels is not None:
+            unique_labels = np.unique(labels)
+            n_clusters = int((unique_labels != -1).sum())
+
+        # Gürültüyü (-1) at
+        if labels is not None:
+            labels_np = np.asarray(labels)
+            valid_mask = labels_np != -1
+            Xv = X_all[valid_mask]
+            yv = labels_np[valid_mask]
+        else:
+            Xv, yv = None, None
+
+        metrics = {
+            "n_clusters": int(n_clusters) if n_clusters is not None else None,
+            "silhouette": None,
+            "calinski_harabasz": None,
+            "davies_bouldin": None,
+            "engine": type(model).__name__,
+            "info": f"{algo} kümeleme tamamlandı." if (n_clusters and n_clusters >= 2) else f"{algo} ile kümeleme yapıldı; anlamlı metrikler için en az 2 küme gerekir.",
+        }
+
+        reasons = []
+
+        def safe_metric(fn, name):
+            try:
+                val = fn()
+                return round(float(val), 4)
+            except Exception as e:
+                reasons.append(f"{name}: {type(e).__name__}")
+                return None
+
+        if yv is None or Xv.shape[0] < 2 or len(np.unique(yv)) < 2:
+            reasons.append("yetersiz_kume_sayisi_veya_ornek")
+        else:
+            # silhouette O(n²): büyük veride örneklem üzerinden tahmin
+            metrics["silhouette"] = safe_metric(
+                lambda: silhouette_score(Xv, yv, sample_size=silhouette_sample(len(Xv)), random_state=42), "silhouette"
+            )
+            metrics["calinski_harabasz"] = safe_metric(lambda: calinski_harabasz_score(Xv, yv), "calinski")
+            metrics["davies_bouldin"] = safe_metric(lambda: davies_bouldin_score(Xv, yv), "davies")
+
+        if labels is not None:
+            cluster_ids, counts = np.unique(np.asarray(labels), return_counts=True)
+            plots = [register_plot("cluster_counts", {"labels": to_list(cluster_ids), "counts": to_list(counts)})]
+        else:
+            plots = []
+
+        if reasons:
+            metrics["reason"] = ", ".join(reasons)
+
+    return finish_training(
+        model, algo, model_type, key, params, started, metrics, plots, fold_metrics, importance_plot
+    )
+
+def finish_training(model, algo, model_type, key, params, started, metrics, plots,
+                    fold_metrics=None, importance_plot=None):
+    # Sonuç kaydı
+    result = {
+        "algorithm": algo,
+        "modelVersion": key[2],
+        "metrics": metrics,
+        "foldMetrics": fold_metrics,
+        "importancePlot": importance_plot,
+        "plots": plots
+    }
+    with span("save", algorithm=algo):
+        save_model(model, algo, model_type, key, params, result, time.perf_counter() - started)
+    return dict(result, cached=False)
+
+# ----------------------------
+# Artımlı (out-of-core) eğitim
+# ----------------------------
+def train_out_of_core(filepath, opts, algo, params):
+    # Veri seti CHUNK_ROWS satırlık parçalarla partial_fit'e akıtılır; test
+    # ayrımı satır kimliği karmasıyla yapılır, metrikler parça parça birikir.
+    model_type = opts["model_type"]
+    try:
+        model = incremental_model(model_type, algo, params, opts.get("n_jobs", 1))
+        with span("fit", algorithm=algo):
+            model = fit_incremental(filepath, opts, model, opts["epochs"], check=lambda: check_cancelled(opts))
+    except KeyError:
+        raise TrainingError("Hedef kolon bulunamadı.")
+    except ValueError as e:
+        raise TrainingError(str(e))
+
+    check_cancelled(opts)
+    if model_type == "classification":
+        metrics, cm, sample = evaluate_classification(filepath, opts, model, model.classes_)
+        plots = [register_plot("confusion_matrix", {"labels": to_list(model.classes_), "matrix": cm.tolist()})]
+        if sample is not None and len(np.unique(sample[0])) == 2:
+            plots.append(generate_roc_plot(*sample))
+    elif model_type == "regression":
+        metrics, sample = evaluate_regression(filepath, opts, model)
+        plots = [generate_regression_scatter(*sample)] if sample is not None else []
+    else:
+        metrics, counts = evaluate_clustering(filepath, model)
+        metrics["info"] = f"{algo} mini-batch (out-of-core) kümeleme tamamlandı."
+        ids = sorted(counts)
+        plots = [register_plot("cluster_counts", {"labels": ids, "counts": [counts[k] for k in ids]})]
+    return model, metrics, plots
+
+# ----------------------------
+# Karşılaştırmalar
+# ----------------------------
+def compare_models(model_type, summary_metrics):
+    comparison_plot, metrics_table = None, None
+    if model_type in ["classification", "regression"] and len(summary_metrics) > 1:
+        df_metric = pd.DataFrame(summary_metrics).T
+        numeric_cols = df_metric.select_dtypes(include=["number"]).columns
+        if len(numeric_cols) > 0:
+            df_metric_num = df_metric[numeric_cols]
+
+            df_sorted = df_metric_num.sort_values(by=numeric_cols[0], ascending=False)
+            comparison_plot = register_plot("model_comparison", {
+                "metric": str(numeric_cols[0]),
+                "algorithms": [str(a) for a in df_sorted.index],
+                "values": to_list(df_sorted[numeric_cols[0]].to_numpy(dtype="float64")),
+            })
+
+            metrics_table = register_plot("metrics_table", {
+                "columns": [str(c) for c in df_metric_num.columns],
+                "algorithms": [str(a) for a in df_metric_num.index],
+                "values": [to_list(row) for row in df_metric_num.to_numpy(dtype="float64")],
+            }, bbox="tight")
+
+    return comparison_plot, metrics_table
@@ -0,0 +1,132 @@
+# backend/tuning.py
+import math
+import os
+import time
+
+import numpy as np
+from sklearn.metrics import get_scorer
+from sklearn.model_selection import ParameterSampler, train_test_split
+
+from dataset_store import open_table, read_dataset
+from training import CLF_MAP, PARALLEL_ESTIMATORS, TrainingError, check_cancelled, resolve_params
+
+# ----------------------------
+# Ayarlar
+# ----------------------------
+# Algoritma başına denenecek en fazla parametre kombinasyonu
+TUNE_CANDIDATES = int(os.environ.get("LEBB_TUNE_CANDIDATES", "27"))
+# Her turda kalan aday oranı 1/ETA; bir sonraki turda veri ETA katı
+TUNE_ETA = int(os.environ.get("LEBB_TUNE_ETA", "3"))
+# İlk turdaki en az eğitim satırı
+TUNE_MIN_ROWS = int(os.environ.get("LEBB_TUNE_MIN_ROWS", "200"))
+# Arama için toplam süre bütçesi (sn); dolunca o ana kadarki en iyiler kullanılır
+TUNE_BUDGET = float(os.environ.get("LEBB_TUNE_BUDGET", "600"))
+
+TUNE_METRICS = {"classification": "accuracy", "regression": "r2"}
+
+# Varsayılan arama uzayları; istekteki "space" ile algoritma bazında değiştirilebilir
+SEARCH_SPACES = {
+    "classification": {
+        "RandomForest": {"n_estimators": [50, 100, 200, 400], "max_depth": [None, 5, 10, 20], "min_samples_leaf": [1, 2, 5]},
+        "LogisticRegression": {"C": [0.01, 0.1, 1, 10, 100]},
+        "DecisionTree": {"max_depth": [3, 5, 8, 12, None], "min_samples_leaf": [1, 2, 5, 10]},
+        "KNN": {"n_neighbors": [3, 5, 7, 11, 15, 25], "weights": ["uniform", "distance"]},
+        "SVM": {"C": [0.1, 1, 10, 100], "gamma": ["scale", 0.01, 0.1, 1]},
+        "NaiveBayes": {"var_smoothing": [1e-11, 1e-9, 1e-7, 1e-5]},
+        "GradientBoosting": {"n_estimators": [50, 100, 200], "learning_rate": [0.03, 0.1, 0.3], "max_depth": [2, 3, 5]},
+        "SGD": {"alpha": [1e-5, 1e-4, 1e-3, 1e-2], "penalty": ["l2", "l1", "elasticnet"]},
+    },
+    "regression": {
+        "LinearRegression": {"fit_intercept": [True, False]},
+        "RandomForest": {"n_estimators": [50, 100, 200, 400], "max_depth": [None, 5, 10, 20], "min_samples_leaf": [1, 2, 5]},
+        "DecisionTree": {"max_depth": [3, 5, 8, 12, None], "min_samples_leaf": [1, 2, 5, 10]},
+        "KNN": {"n_neighbors": [3, 5, 7, 11, 15, 25], "weights": ["uniform", "distance"]},
+        "SVR": {"C": [0.1, 1, 10, 100], "gamma": ["scale", 0.01, 0.1, 1]},
+        "Ridge": {"alpha": [0.01, 0.1, 1, 10, 100]},
+        "Lasso": {"alpha": [0.001, 0.01, 0.1, 1, 10]},
+        "GradientBoosting": {"n_estimators": [50, 100, 200], "learning_rate": [0.03, 0.1, 0.3], "max_depth": [2, 3, 5]},
+        "SGD": {"alpha": [1e-5, 1e-4, 1e-3, 1e-2], "penalty": ["l2", "l1", "elasticnet"]},
+    },
+}
+
+
+def tuning_options(opts, data):
+    # training_options() + arama ayarları
+    return dict(
+        opts,
+        space=data.get("space", {}),
+        candidates=int(data.get("candidates", TUNE_CANDIDATES)),
+        eta=max(2, int(data.get("eta", TUNE_ETA))),
+        budget=float(data.get("budgetSeconds", TUNE_BUDGET)),
+    )
+
+
+def candidates(opts, algo):
+    # Sabit parametreler ("params") her adayda korunur; uzay onları ezer
+    space = opts["space"].get(algo) or SEARCH_SPACES[opts["model_type"]].get(algo, {})
+    fixed = opts["params"].get(algo, {})
+    if not space:
+        return [dict(fixed)]
+    space = {k: v if isinstance(v, list) else [v] for k, v in space.items()}
+    sampler = ParameterSampler(space, n_iter=opts["candidates"], random_state=42)
+    configs = []
+    for config in sampler:
+        config = dict(fixed, **config)
+        if config not in configs:
+            configs.append(config)
+    return configs
+
+
+def rung_rows(n_train, n_candidates, eta, min_rows=TUNE_MIN_ROWS):
+    # Tur başına eğitim satırı: son tur tüm eğitim verisi, öncekiler ETA kat küçük
+    rungs = max(1, math.ceil(math.log(max(n_candidates, 1), eta)) + 1) if n_candidates > 1 else 1
+    rows = [max(min(min_rows, n_train), n_train // eta ** (rungs - 1 - r)) for r in range(rungs)]
+    return sorted(set(rows))
+
+
+def validate(opts):
+    if opts["model_type"] not in TUNE_METRICS:
+        raise TrainingError("Ayar araması yalnızca sınıflandırma ve regresyon için destekleniyor.")
+    unknown = [a for a in opts["algorithms"] if a not in CLF_MAP[opts["model_type"]]]
+    if unknown:
+        raise TrainingError(f"Bilinmeyen algoritma: {unknown[0]}")
+
+
+# ----------------------------
+# Tek aday değerlendirmesi (işlem havuzunda)
+# ----------------------------
+def evaluate_config(filepath, opts, algo, params, n_rows):
+    # Sabit bir test ayrımı; turlar eğitim kısmının iç içe alt örnekleri
+    # üzerinde fit eder, böylece skorlar turlar arasında karşılaştırılabilir.
+    check_cancelled(opts)
+    df = read_dataset(filepath)
+    target = opts["target"]
+    if target not in df.columns:
+        raise TrainingError("Hedef kolon bulunamadı.")
+    X, y = df.drop(columns=[target]), df[target]
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=opts["test_size"], random_state=42
+    )
+    if n_rows < len(X_train):
+        order = np.random.default_rng(0).permutation(len(X_train))[:n_rows]
+        X_train, y_train = X_train.iloc[order], y_train.iloc[order]
+
+    ModelClass = CLF_MAP[opts["model_type"]][algo]
+    params = resolve_params(algo, params, opts["model_type"])
+    started = time.perf_counter()
+    try:
+        model = ModelClass(**params)
+        if ModelClass in PARALLEL_ESTIMATORS and "n_jobs" not in params:
+            model.set_params(n_jobs=opts.get("n_jobs", 1))
+        model.fit(X_train, y_train)
+        score = float(get_scorer(TUNE_METRICS[opts["model_type"]])(model, X_test, y_test))
+    except (ValueError, TypeError) as e:
+        # Geçersiz kombinasyon (ör. bilinmeyen parametre) aday olarak elenir
+        return {"score": None, "error": str(e), "fit_seconds": round(time.perf_counter() - started, 3)}
+    return {"score": round(score, 4), "error": None, "fit_seconds": round(time.perf_counter() - started, 3)}
+
+
+def train_rows(filepath, test_size):
+    # train_test_split ile aynı eğitim satırı sayısı; veri belleğe alınmaz
+    n = open_table(filepath).num_rows
+    return n - math.ceil(n * test_size)
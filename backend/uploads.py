@@ -0,0 +1,161 @@
+# backend/uploads.py
+import json
+import os
+import tempfile
+import threading
+
+from werkzeug.exceptions import RequestEntityTooLarge
+from werkzeug.utils import secure_filename
+
+from config import UPLOAD_FOLDER
+from dataset_store import (
+    HashingFile, dataset_cache, dataset_stats, find_dataset, ingest_file, stats_path, stored_path
+)
+from telemetry import span
+
+# ----------------------------
+# Ayarlar
+# ----------------------------
+# Tek bir yüklemenin en büyük boyutu (MB); 0 ise sınır yok
+UPLOAD_MAX_MB = int(os.environ.get("LEBB_UPLOAD_MAX_MB", "1024"))
+UPLOAD_MAX_BYTES = UPLOAD_MAX_MB * 1024 * 1024 or None
+# Yükleme hemen kolonlu depoya dönüştürülür; 0 ise ham dosya olduğu gibi saklanır
+UPLOAD_CONVERT = os.environ.get("LEBB_UPLOAD_CONVERT", "1") != "0"
+
+# İçerik özeti -> veri seti adı; aynı içerik ikinci kez işlenmez
+INDEX_PATH = os.path.join(UPLOAD_FOLDER, "uploads.json")
+_index_lock = threading.Lock()
+_pending = set()
+
+
+def _too_large():
+    return RequestEntityTooLarge(f"Dosya boyutu sınırı ({UPLOAD_MAX_MB} MB) aşıldı.")
+
+
+def safe_name(filename):
+    # İstemcinin verdiği ad yol olarak kullanılmaz: dizin bileşenleri ve özel
+    # karakterler atılır. Geriye bir şey kalmazsa None.
+    return secure_filename(filename or "") or None
+
+
+def inside(folder, name):
+    # Ad, klasörün dışına çıkan bir yola çözülmemeli
+    root = os.path.realpath(folder)
+    return os.path.dirname(os.path.realpath(os.path.join(root, name))) == root
+
+
+def upload_stream(filename=None):
+    # Werkzeug çok parçalı gövdeyi ayrıştırırken dosya kısmını doğrudan buraya
+    # yazar: ara kopya yok, özet ve boyut sınırı yazarken uygulanır.
+    suffix = os.path.splitext(filename or "")[1]
+    fd, path = tempfile.mkstemp(dir=UPLOAD_FOLDER, prefix=".upload-", suffix=suffix)
+    os.close(fd)
+    return SpooledUpload(path, UPLOAD_MAX_BYTES, _too_large)
+
+
+class SpooledUpload(HashingFile):
+    # İstek bitince sahiplenilmemiş (claim edilmemiş) dosya silinir
+
+    claimed = False
+
+    def close(self):
+        self._file.close()
+        if not self.claimed and os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def claim(file, suffix=""):
+    # FileStorage -> (diskteki yol, sha256, boyut). Akış zaten diske
+    # yazıldıysa dosya taşınmadan devralınır; değilse bir kez kopyalanır.
+    stream = file.stream
+    if isinstance(stream, SpooledUpload) and not stream.closed:
+        stream.claimed = True
+        stream.flush()
+        stream.close()
+        return stream.path, stream.hexdigest(), stream.size
+
+    fd, path = tempfile.mkstemp(dir=UPLOAD_FOLDER, prefix=".upload-", suffix=suffix)
+    os.close(fd)
+    sink = HashingFile(path, UPLOAD_MAX_BYTES, _too_large)
+    try:
+        file.save(sink)
+    except BaseException:
+        sink.close()
+        os.remove(path)
+        raise
+    sink.close()
+    return path, sink.hexdigest(), sink.size
+
+
+# ----------------------------
+# Yükleme indeksi
+# ----------------------------
+def _read_index():
+    try:
+        with open(INDEX_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_index(index):
+    tmp = INDEX_PATH + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(index, f)
+    os.replace(tmp, INDEX_PATH)
+
+
+def _dataset_path(name):
+    return find_dataset(name, UPLOAD_FOLDER)
+
+
+def _unique_name(filename, digest, index):
+    # Aynı adla farklı içerik yüklenirse öncekinin üzerine yazılmaz
+    taken = {name for d, name in index.items() if d != digest}
+    if filename not in taken and filename not in _pending and _dataset_path(filename) is None:
+        return filename
+    stem, ext = os.path.splitext(filename)
+    return f"{stem}_{digest[:8]}{ext}"
+
+
+def receive_dataset(file):
+    # (veri seti adı, profil, tekrar mı). Özet bilinen bir yüklemeyle
+    # aynıysa dosya yeniden ayrıştırılmaz; kayıtlı profil döner.
+    filename = safe_name(file.filename)
+    if filename is None or not inside(UPLOAD_FOLDER, filename):
+        raise ValueError("Geçersiz dosya adı.")
+    raw_path, digest, _ = claim(file, os.path.splitext(filename)[1])
+    with _index_lock:
+        index = _read_index()
+        existing = index.get(digest)
+        path = _dataset_path(existing) if existing else None
+        if path is not None:
+            os.remove(raw_path)
+            return existing, dataset_stats(path), True
+        name = _unique_name(filename, digest, index)
+        _pending.add(name)
+
+    target = os.path.join(UPLOAD_FOLDER, name)
+    try:
+        os.replace(raw_path, target)
+        with span("ingest"):
+            if UPLOAD_CONVERT:
+                _, profile = ingest_file(target)
+            else:
+                profile = dataset_stats(target)
+        with _index_lock:
+            index = _read_index()
+            index[digest] = name
+            _write_index(index)
+    except BaseException:
+        # Ham dosya, (yarım) depo kopyası ve profil dosyaları geride kalmaz
+        store = stored_path(UPLOAD_FOLDER, name)
+        for leftover in (raw_path, target, store, store + ".tmp", stats_path(target), stats_path(store)):
+            if os.path.exists(leftover):
+                os.remove(leftover)
+        dataset_cache.invalidate(store)
+        raise
+    finally:
+        with _index_lock:
+            _pending.discard(name)
+    return name, profile, False
@@ -212,26 +212,41 @@ function AppWrapper() {
       cvFolds: cvFolds,
     };
 
-    fetch("http://localhost:5000/train-models", {
+    // Eğitim arka planda iş olarak çalışır; durum periyodik olarak sorgulanır
+    fetch("http://localhost:5000/jobs", {
       method: "POST",
       headers: { "Content-Type": "application/json" },
       body: JSON.stringify(payload),
     })
+      .then((res) => res.json())
+      .then((job) => {
+        if (job.error) {
+          alert("Modelleme başarısız: " + job.error);
+          return;
+        }
+        pollTrainingJob(job.job_id);
+      })
+      .catch(() => {
+        alert("Modelleme sırasında hata oluştu.");
+      });
+  };
+
+  const pollTrainingJob = (jobId) => {
+    fetch(`http://localhost:5000/jobs/${jobId}`)
       .then((res) => {
         if (!res.ok) throw new Error("Sunucu hatası");
         return res.json();
       })
       .then((data) => {
-        if (data.error) {
-          alert("Modelleme başarısız: " + data.error);
-          return;
-        }
-        if (data.results) {
-          setModelResultsList(data.results);
+        setModelResultsList(data.results || []);
+
+        if (data.status === "done") {
           setComparisonPlot(data.comparison_plot || null);
           setMetricsTable(data.metrics_table || null);
-        } else {
-          alert("Modelleme başarısız. Sunucudan geçerli veri alınamadı.");
+        } else if (data.status === "failed") {
+          alert("Modelleme başarısız: " + data.error);
+        } else if (data.status !== "cancelled") {
+          setTimeout(() => pollTrainingJob(jobId), 1000);
         }
       })
       .catch(() => {
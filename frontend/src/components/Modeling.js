@@ -4,8 +4,16 @@ import ModulNavigation from "./ModulNavigation";
 
 const BACKEND_URL = "http://localhost:5000";
 
-function downloadTrainedModel(algo, modelType) {
-  const url = `${BACKEND_URL}/download-model?algo=${algo}&model_type=${modelType}`;
+// Grafikler /plots/<id>.png üzerinden ilk görüntülendiğinde render edilir
+function plotSrc(plot) {
+  if (!plot) return null;
+  if (plot.url) return `${BACKEND_URL}${plot.url}`;
+  return `data:image/png;base64,${plot}`;
+}
+
+function downloadTrainedModel(algo, modelType, version) {
+  let url = `${BACKEND_URL}/download-model?algo=${algo}&model_type=${modelType}`;
+  if (version) url += `&version=${version}`;
   const link = document.createElement("a");
   link.href = url;
   link.setAttribute("download", `${algo}_${modelType}.pkl`);
@@ -123,7 +131,7 @@ function Modeling({
     return (
       <a
         className="download-link"
-        href={`data:image/png;base64,${b64}`}
+        href={plotSrc(b64)}
         download={name}
       >
         {children || "Görseli İndir"}
@@ -141,6 +149,7 @@ function Modeling({
       { value: "SVM", label: "SVM" },
       { value: "NaiveBayes", label: "Naive Bayes" },
       { value: "GradientBoosting", label: "Gradient Boosting" },
+      { value: "SGD", label: "SGD" },
     ],
     regression: [
       { value: "LinearRegression", label: "Linear Regression" },
@@ -151,6 +160,7 @@ function Modeling({
       { value: "Ridge", label: "Ridge Regression" },
       { value: "Lasso", label: "Lasso Regression" },
       { value: "GradientBoosting", label: "Gradient Boosting" },
+      { value: "SGD", label: "SGD" },
     ],
     clustering: [
       { value: "KMeans", label: "KMeans" },
@@ -528,7 +538,8 @@ function Modeling({
                       {cm && (
                         <img
                           className="graph-image"
-                          src={`data:image/png;base64,${cm}`}
+                          src={plotSrc(cm)}
+                          loading="lazy"
                           alt="Confusion Matrix"
                         />
                       )}
@@ -540,7 +551,8 @@ function Modeling({
                       {roc && (
                         <img
                           className="graph-image"
-                          src={`data:image/png;base64,${roc}`}
+                          src={plotSrc(roc)}
+                          loading="lazy"
                           alt="ROC Curve"
                         />
                       )}
@@ -552,7 +564,8 @@ function Modeling({
                       {imp && (
                         <img
                           className="graph-image"
-                          src={`data:image/png;base64,${imp}`}
+                          src={plotSrc(imp)}
+                          loading="lazy"
                           alt="Feature Importance"
                         />
                       )}
@@ -563,7 +576,7 @@ function Modeling({
                   <div className="result-actions right">
                     <button
                       className="download-model-btn"
-                      onClick={() => downloadTrainedModel(res.algorithm, modelType)}
+                      onClick={() => downloadTrainedModel(res.algorithm, modelType, res.modelVersion)}
                     >
                       Modeli İndir
                     </button>
@@ -586,7 +599,8 @@ function Modeling({
                       {scatter && (
                         <img
                           className="graph-image"
-                          src={`data:image/png;base64,${scatter}`}
+                          src={plotSrc(scatter)}
+                          loading="lazy"
                           alt="Gerçek vs Tahmin"
                         />
                       )}
@@ -598,7 +612,8 @@ function Modeling({
                       {imp && (
                         <img
                           className="graph-image"
-                          src={`data:image/png;base64,${imp}`}
+                          src={plotSrc(imp)}
+                          loading="lazy"
                           alt="Feature Importance"
                         />
                       )}
@@ -609,7 +624,7 @@ function Modeling({
                   <div className="result-actions right">
                     <button
                       className="download-model-btn"
-                      onClick={() => downloadTrainedModel(res.algorithm, modelType)}
+                      onClick={() => downloadTrainedModel(res.algorithm, modelType, res.modelVersion)}
                     >
                       Modeli İndir
                     </button>
@@ -631,7 +646,8 @@ function Modeling({
                     {clusterPlot && (
                       <img
                         className="graph-image"
-                        src={`data:image/png;base64,${clusterPlot}`}
+                        src={plotSrc(clusterPlot)}
+                        loading="lazy"
                         alt="Küme Dağılımı"
                       />
                     )}
@@ -642,7 +658,7 @@ function Modeling({
                 <div className="result-actions right">
                   <button
                     className="download-model-btn"
-                    onClick={() => downloadTrainedModel(res.algorithm, modelType)}
+                    onClick={() => downloadTrainedModel(res.algorithm, modelType, res.modelVersion)}
                   >
                     Modeli İndir
                   </button>
@@ -657,7 +673,8 @@ function Modeling({
         <div className="comparison-plot">
           <h3 className="section-subtitle">📊 Algoritmaların Başarı Karşılaştırması</h3>
           <img
-            src={`data:image/png;base64,${comparisonPlot}`}
+            src={plotSrc(comparisonPlot)}
+            loading="lazy"
             alt="başarı-karşılaştırma"
             className="graph-image"
           />
@@ -668,7 +685,8 @@ function Modeling({
         <div className="metrics-table">
           <h3 className="section-subtitle">📋 Metrik Karşılaştırma Tablosu</h3>
           <img
-            src={`data:image/png;base64,${metricsTable}`}
+            src={plotSrc(metricsTable)}
+            loading="lazy"
             alt="metrik-tablosu"
             className="graph-image"
           />
@@ -2,6 +2,8 @@ import React, { useState } from "react";
 import ModulNavigation from "./ModulNavigation";
 import "../style.css";
 
+const BACKEND_URL = "http://localhost:5000";
+
 function Visualization({ preview, handleVisualize, graphList }) {
   const [selectedCharts, setSelectedCharts] = useState([]);
   const [chartParams, setChartParams] = useState({});
@@ -131,7 +133,8 @@ function Visualization({ preview, handleVisualize, graphList }) {
           {graphList.map((item, index) => (
             <div key={index} className="graph-preview">
               <img
-                src={`data:image/png;base64,${item.image}`}
+                src={`${BACKEND_URL}${item.url}`}
+                loading="lazy"
                 alt={`Grafik - ${item.chartType}`}
                 className="graph-image"
               />
@@ -141,7 +144,7 @@ function Visualization({ preview, handleVisualize, graphList }) {
                 </span>
 
                 <a
-                  href={`data:image/png;base64,${item.image}`}
+                  href={`${BACKEND_URL}${item.url}`}
                   download={`${item.chartType}_${index + 1}.png`}
                   className="download-link"
                 >